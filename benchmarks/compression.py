@@ -0,0 +1,89 @@
+"""
+Response compression benchmark: body size and time to deliver on a slow link.
+
+A 100-entry reading list page, serialized as the API sends it, is compressed
+with every offered coding (`identity` is the uncompressed body) using the
+configured levels. The report shows the body size, the compression time
+percentiles and the p99 time to deliver the page over a `--kbps` link,
+i.e. compressing plus sending the body.
+
+Usage:
+    python -m benchmarks.compression [--rounds 200] [--kbps 1600]
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+from typing import Dict, List
+
+# src.config builds the database URL at import time; no database is used here
+for name in ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB"):
+    os.environ.setdefault(name, "benchmark")
+
+import orjson  # noqa: E402
+
+from benchmarks.response_path import make_metadata  # noqa: E402
+from benchmarks.stats import percentile, print_table  # noqa: E402
+from src.middleware.body_compressor import CODINGS, Compressor  # noqa: E402
+
+
+def reading_list_page(items: int) -> bytes:
+    """A reading list page as the API serializes it."""
+    now = datetime(2025, 5, 1, 12, 30)
+    entries = [
+        {"status": "reading", "book": book, "created_at": now, "updated_at": now}
+        for book in make_metadata(items)
+    ]
+    return orjson.dumps(entries)
+
+
+def run_coding(coding: str, body: bytes, rounds: int, kbps: float) -> Dict[str, float]:
+    """
+    Compress `body` `rounds` times and summarize it.
+
+    Args:
+        coding (str): A key of `CODINGS`, or "identity" to send as is.
+        body (bytes): Uncompressed response body.
+        rounds (int): Number of compressions timed.
+        kbps (float): Link speed in kilobits per second.
+
+    Returns:
+        dict: Body size, compression time percentiles and delivery time.
+    """
+    make_compressor = CODINGS.get(coding, lambda: Compressor(bytes, bytes))
+    timings: List[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        compressor = make_compressor()
+        sent = compressor.compress(body) + compressor.finish()
+        timings.append(time.perf_counter() - started)
+    compress_p99 = percentile(timings, 0.99)
+    return {
+        "bytes": len(sent),
+        "ratio": len(body) / len(sent),
+        "zip_p50_ms": percentile(timings, 0.50) * 1000,
+        "zip_p99_ms": compress_p99 * 1000,
+        "deliver_ms": (compress_p99 + len(sent) * 8 / (kbps * 1000)) * 1000,
+    }
+
+
+def main() -> None:
+    """Parse the options, compress with every coding and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--kbps", type=float, default=1600, help="link speed (slow 3G: 1600)")
+    parser.add_argument("--items", type=int, default=100, help="reading list entries")
+    args = parser.parse_args()
+
+    body = reading_list_page(args.items)
+    results = {
+        coding: run_coding(coding, body, args.rounds, args.kbps)
+        for coding in ("identity", *CODINGS)
+    }
+    print_table(
+        results, ("bytes", "ratio", "zip_p50_ms", "zip_p99_ms", "deliver_ms")
+    )
+
+
+if __name__ == "__main__":
+    main()
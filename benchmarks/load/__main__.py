@@ -0,0 +1,109 @@
+"""
+Load test: realistic user mixes against the API, Postgres and a fake Gutendex.
+
+The API is started (`--workers` uvicorn workers) against a throwaway
+Postgres container and a local fake Gutendex with the given latency,
+jitter and error rate, see `benchmarks.load.fake_gutendex`. `--users`
+virtual users register, then follow their mix for `--seconds` after a
+`--warmup`: readers mostly browse /books, curators mostly edit their
+favourites and reading list, see `benchmarks.load.mixes`.
+
+The report shows requests per second, error rate and p50/p95/p99 latency
+per action and overall; it is also written as JSON, with the commit and
+settings, to compare runs across commits.
+
+Usage:
+    python -m benchmarks.load [--users 50] [--mix reader=8,curator=2]
+        [--seconds 60] [--warmup 10] [--think-time 0.5] [--workers 1]
+        [--latency 0.15] [--jitter 0.05] [--error-rate 0] [--books 5000]
+        [--postgres-url URL] [--output load-test.json]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import httpx
+
+from benchmarks.load.migrations import postgres
+from benchmarks.load.mixes import MIXES, LibraryUser
+from benchmarks.load.options import parse_args
+from benchmarks.load.report import Recorder, current_commit
+from benchmarks.load.services import api_environment, free_port, serve
+from benchmarks.stats import print_table
+
+
+def assign_mixes(users: int, shares: Dict[str, int]) -> List[str]:
+    """The mix of every user, in proportion to `shares`."""
+    cycle = [name for name, share in shares.items() for _ in range(share)]
+    return [cycle[number % len(cycle)] for number in range(users)]
+
+
+async def run_load(base_url: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """Register the users, run the mixes and summarize what was measured."""
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    run_id = uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        users = [
+            LibraryUser(client, recorder, f"load-{run_id}-{number}", args.books,
+                        random.Random(rng.random()))
+            for number in range(args.users)
+        ]
+        # Registrations are not recorded: measuring starts after the warm-up
+        registered = await asyncio.gather(*(user.register() for user in users))
+        if not all(registered):
+            raise RuntimeError(f"{registered.count(False)} users could not register")
+        mixes = assign_mixes(args.users, args.mix)
+        deadline = time.perf_counter() + args.warmup + args.seconds
+        measuring = asyncio.get_running_loop().call_later(args.warmup, recorder.start)
+        await asyncio.gather(*(
+            user.run(MIXES[mix], deadline, args.think_time) for user, mix in zip(users, mixes)
+        ))
+        measuring.cancel()
+    return recorder.summary(time.perf_counter() - recorder.started_at)
+
+
+def main() -> None:
+    """Parse the options, start the services, run the load and report it."""
+    args = parse_args(__doc__.splitlines()[1])
+
+    gutendex_port, api_port = free_port(), free_port()
+    gutendex_url = f"http://127.0.0.1:{gutendex_port}"
+    api_url = f"http://127.0.0.1:{api_port}"
+    gutendex = [
+        "-m", "benchmarks.load.fake_gutendex", "--port", str(gutendex_port),
+        "--latency", str(args.latency), "--jitter", str(args.jitter),
+        "--error-rate", str(args.error_rate), "--books", str(args.books),
+    ]
+    api = [
+        "-m", "uvicorn", "src.main:app", "--port", str(api_port),
+        "--workers", str(args.workers), "--log-level", "warning",
+    ]
+    with postgres(args.postgres_url) as database_url, serve(gutendex, gutendex_url):
+        with serve(api, f"{api_url}/docs", api_environment(database_url, gutendex_url)):
+            results = asyncio.run(run_load(api_url, args))
+
+    settings = {name: value for name, value in vars(args).items() if name != "postgres_url"}
+    report = {
+        "commit": current_commit(),
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+        "settings": settings,
+        **results,
+    }
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print_table(
+        {**results["actions"], "total": results["total"]},
+        ("rps", "error_rate", "p50_ms", "p95_ms", "p99_ms"),
+    )
+    print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
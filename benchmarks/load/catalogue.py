@@ -0,0 +1,72 @@
+"""
+Books of the fake Gutendex and the listing pages built from them.
+
+Titles and authors are drawn from a small word list, so that a search for
+one or two of the words matches a realistic share of the catalogue.
+"""
+from typing import Any, Dict, List, Optional
+
+# Books per listing page, as on Gutendex
+PAGE_SIZE = 32
+WORDS = (
+    "time", "sea", "war", "love", "night", "island", "river", "city", "winter", "garden",
+    "house", "king", "journey", "letters", "stars", "secret", "shadow", "voyage", "heart",
+)
+
+
+def make_book(book_id: int) -> Dict[str, Any]:
+    """Gutendex-like payload of a book, the same on every call."""
+    first, second = WORDS[book_id % len(WORDS)].title(), WORDS[book_id * 7 % len(WORDS)].title()
+    return {
+        "id": book_id,
+        "title": f"The {first} of the {second}",
+        "authors": [{"name": f"{second}, {first}", "birth_year": 1800}],
+        "subjects": ["Fiction", f"{first} -- Fiction"],
+        "bookshelves": ["Best Books Ever Listings"],
+        "languages": ["en"],
+        "copyright": False,
+        "media_type": "Text",
+        "formats": {"text/html": f"https://www.gutenberg.org/ebooks/{book_id}.html.images"},
+        "download_count": book_id * 10 % 50000,
+    }
+
+
+class Catalogue:
+    """Books 1..`size`, built once, with a lower-cased text of each to search in."""
+
+    def __init__(self, size: int):
+        self.books = {book_id: make_book(book_id) for book_id in range(1, size + 1)}
+        # Title and author, which is what Gutendex searches too
+        self.texts = {
+            book_id: f"{book['title']} {book['authors'][0]['name']}".lower()
+            for book_id, book in self.books.items()
+        }
+
+    def find(self, ids: List[int], search: str) -> List[Dict[str, Any]]:
+        """
+        Books among `ids` (every book if empty) whose title or author
+        contains every word of `search`.
+        """
+        matches = [book_id for book_id in ids if book_id in self.books] or list(self.books)
+        words = search.lower().split()
+        return [
+            self.books[book_id] for book_id in matches
+            if all(word in self.texts[book_id] for word in words)
+        ]
+
+
+def listing_page(matches: List[Dict[str, Any]], page: int, page_url) -> Dict[str, Any]:
+    """
+    One page of a listing with Gutendex's `next` and `previous` links,
+    `page_url(number)` being the URL of another page.
+    """
+    start = (page - 1) * PAGE_SIZE
+    links: Dict[str, Optional[int]] = {
+        "next": page + 1 if start + PAGE_SIZE < len(matches) else None,
+        "previous": page - 1 if page > 1 else None,
+    }
+    return {
+        "count": len(matches),
+        **{name: number and page_url(number) for name, number in links.items()},
+        "results": matches[start:start + PAGE_SIZE],
+    }
@@ -0,0 +1,67 @@
+"""
+Local stand-in for gutendex.com with configurable latency, jitter and errors.
+
+Books 1..`--books` exist, see `benchmarks.load.catalogue`; other IDs are 404.
+Each response is delayed by `--latency` ± `--jitter` seconds, and a share
+`--error-rate` of the requests fails with a 503 after the delay, as an
+overloaded upstream would.
+
+Usage:
+    python -m benchmarks.load.fake_gutendex [--port 8090] [--latency 0.15]
+        [--jitter 0.05] [--error-rate 0] [--books 5000]
+"""
+import argparse
+import asyncio
+import random
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from benchmarks.load.catalogue import Catalogue, listing_page
+
+
+def build_app(latency: float, jitter: float, error_rate: float, books: int) -> Starlette:
+    """App serving `/books/` and `/books/{id}/` like Gutendex does."""
+    catalogue = Catalogue(books)
+
+    async def respond(request: Request) -> JSONResponse:
+        # Wait like the upstream would, then fail or answer
+        await asyncio.sleep(max(0.0, random.uniform(latency - jitter, latency + jitter)))
+        if random.random() < error_rate:
+            return JSONResponse({"detail": "Service unavailable"}, status_code=503)
+        if "book_id" not in request.path_params:
+            return JSONResponse(list_books(request))
+        book = catalogue.books.get(request.path_params["book_id"])
+        return JSONResponse(book or {"detail": "Not found."}, status_code=200 if book else 404)
+
+    def list_books(request: Request) -> dict:
+        query = request.query_params
+        ids = [int(value) for value in query.get("ids", "").split(",") if value]
+        return listing_page(
+            catalogue.find(ids, query.get("search", "")),
+            int(query.get("page", 1)),
+            lambda number: str(request.url.include_query_params(page=number)),
+        )
+
+    return Starlette(routes=[Route("/books/", respond), Route("/books/{book_id:int}/", respond)])
+
+
+def main() -> None:
+    """Parse the options and serve until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.15, help="mean delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.05, help="delay spread in seconds")
+    parser.add_argument("--error-rate", type=float, default=0, help="share of 503 responses")
+    parser.add_argument("--books", type=int, default=5000, help="number of existing books")
+    args = parser.parse_args()
+
+    app = build_app(args.latency, args.jitter, args.error_rate, args.books)
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Database of a load test: a throwaway Postgres container with the Liquibase
+changesets of db/migration applied, or an already migrated database.
+"""
+import asyncio
+import contextlib
+import re
+from pathlib import Path
+from typing import Iterator, List, Optional
+from xml.etree import ElementTree
+
+import asyncpg
+
+ROOT = Path(__file__).resolve().parents[2]
+CHANGELOG = ROOT / "db" / "migration" / "db.master-changelog.xml"
+POSTGRES_IMAGE = "postgres:15"
+_INCLUDE = "{http://www.liquibase.org/xml/ns/dbchangelog}include"
+_CHANGESET = re.compile(r"^-- changeset .*$", re.MULTILINE)
+
+
+def changelog_files(changelog: Path) -> List[Path]:
+    """SQL files of a Liquibase changelog in the order it includes them."""
+    files = []
+    for include in ElementTree.parse(changelog).getroot().iter(_INCLUDE):
+        path = changelog.parent / include.get("file")
+        files += changelog_files(path) if path.suffix == ".xml" else [path]
+    return files
+
+
+async def apply_migrations(dsn: str) -> None:
+    """
+    Run every changeset of db/migration against a fresh database, in order.
+
+    Each changeset is sent as one simple-protocol query, which suits both the
+    plpgsql bodies (splitStatements:false) and the single CREATE INDEX
+    CONCURRENTLY changesets (runInTransaction:false). Unlike Liquibase,
+    nothing records which changesets ran: this is for throwaway databases.
+    """
+    connection = await asyncpg.connect(dsn)
+    try:
+        for path in changelog_files(CHANGELOG):
+            for changeset in _CHANGESET.split(path.read_text())[1:]:
+                await connection.execute(changeset)
+    finally:
+        await connection.close()
+
+
+@contextlib.contextmanager
+def postgres(url: Optional[str] = None) -> Iterator[str]:
+    """Yield the URL of the database to test against, in a new container if `url` is None."""
+    if url:
+        yield url
+        return
+    # Dev dependency, only needed when no database is given
+    from testcontainers.postgres import PostgresContainer
+
+    with PostgresContainer(POSTGRES_IMAGE, driver=None) as container:
+        url = container.get_connection_url()
+        asyncio.run(apply_migrations(url))
+        yield url
@@ -0,0 +1,81 @@
+"""
+What the virtual users do: the actions on the catalogue and the library,
+and the mixes of them that make up a kind of user.
+
+Actions that need a book the user already has (removing a favourite,
+changing a reading status) fall back to adding one.
+"""
+from typing import Dict
+
+from benchmarks.load.catalogue import PAGE_SIZE, WORDS
+from benchmarks.load.users import VirtualUser
+
+STATUSES = ("want_to_read", "reading", "done")
+
+# Relative weights of the actions of each kind of user
+MIXES: Dict[str, Dict[str, int]] = {
+    # Mostly browses the catalogue and looks at its lists
+    "reader": {
+        "browse_books": 30, "search_books": 15, "get_book": 25, "list_favourites": 10,
+        "list_reading_list": 10, "add_favourite": 5, "add_to_reading_list": 4, "login": 1,
+    },
+    # Mostly maintains its favourites and reading list
+    "curator": {
+        "get_book": 10, "list_favourites": 15, "add_favourite": 15, "remove_favourite": 8,
+        "list_reading_list": 15, "add_to_reading_list": 15, "update_reading_status": 20,
+        "login": 2,
+    },
+}
+
+
+class LibraryUser(VirtualUser):
+    """A user of /books, /favourites and /reading-list, remembering its own books."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.favourites: set = set()
+        self.reading_list: set = set()
+
+    async def browse_books(self) -> None:
+        # The first pages most often
+        page = 1 + int(self.rng.expovariate(0.5)) % max(1, self.books // PAGE_SIZE)
+        await self.request("browse_books", "GET", "/books/", params={"page": page})
+
+    async def search_books(self) -> None:
+        # One or two words of the titles
+        params = {"search": " ".join(self.rng.sample(WORDS, self.rng.randint(1, 2)))}
+        await self.request("search_books", "GET", "/books/", params=params)
+
+    async def get_book(self) -> None:
+        await self.request("get_book", "GET", f"/books/{self.book_id()}")
+
+    async def list_favourites(self) -> None:
+        await self.request("list_favourites", "GET", "/favourites/", params={"limit": 20})
+
+    async def add_favourite(self) -> None:
+        book_id = self.book_id()
+        body = {"book_id": book_id}
+        if await self.request("add_favourite", "POST", "/favourites/", (201,), json=body):
+            self.favourites.add(book_id)
+
+    async def remove_favourite(self) -> None:
+        if not self.favourites:
+            return await self.add_favourite()
+        book_id = self.favourites.pop()
+        await self.request("remove_favourite", "DELETE", f"/favourites/{book_id}", (204,))
+
+    async def list_reading_list(self) -> None:
+        await self.request("list_reading_list", "GET", "/reading-list/", params={"limit": 20})
+
+    async def add_to_reading_list(self) -> None:
+        book_id = self.book_id()
+        body = {"book_id": book_id, "status": self.rng.choice(STATUSES)}
+        if await self.request("add_to_reading_list", "POST", "/reading-list/", (201,), json=body):
+            self.reading_list.add(book_id)
+
+    async def update_reading_status(self) -> None:
+        if not self.reading_list:
+            return await self.add_to_reading_list()
+        book_id = self.rng.choice(sorted(self.reading_list))
+        body = {"status": self.rng.choice(STATUSES)}
+        await self.request("update_reading_status", "PATCH", f"/reading-list/{book_id}", json=body)
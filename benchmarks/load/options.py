@@ -0,0 +1,41 @@
+"""Command line options of the load test, see `benchmarks.load.__main__`."""
+import argparse
+from typing import Dict
+
+from benchmarks.load.mixes import MIXES
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """Parse "reader=8,curator=2" into the share of users of each mix."""
+    shares = {}
+    for part in value.split(","):
+        name, _, share = part.partition("=")
+        if name not in MIXES:
+            raise argparse.ArgumentTypeError(f"unknown mix {name!r}, expected: {', '.join(MIXES)}")
+        shares[name] = int(share or 1)
+    return shares
+
+
+def parse_args(description: str) -> argparse.Namespace:
+    """Options of the run; the API itself is configured through the environment as usual."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description=description)
+    # The load
+    parser.add_argument("--users", type=int, default=50, help="concurrent virtual users")
+    parser.add_argument("--mix", type=parse_mix, default="reader=8,curator=2",
+                        help="share of users per mix, from: " + ", ".join(MIXES))
+    parser.add_argument("--seconds", type=float, default=60, help="measured duration")
+    parser.add_argument("--warmup", type=float, default=10, help="unmeasured lead-in")
+    parser.add_argument("--think-time", type=float, default=0.5,
+                        help="mean pause of a user between actions, 0 for none")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the users' choices")
+    # The services
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers of the API")
+    parser.add_argument("--latency", type=float, default=0.15, help="Gutendex delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.05, help="Gutendex delay spread")
+    parser.add_argument("--error-rate", type=float, default=0, help="share of Gutendex 503s")
+    parser.add_argument("--books", type=int, default=5000, help="books of the fake Gutendex")
+    parser.add_argument("--postgres-url",
+                        help="already migrated database to use instead of a new container")
+    # The report
+    parser.add_argument("--output", default="load-test.json", help="JSON report file")
+    return parser.parse_args()
@@ -0,0 +1,85 @@
+"""Collection of request timings and the JSON report of a load test."""
+import subprocess
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks.stats import percentile
+
+
+class Recorder:
+    """
+    Timings and outcomes of the requests, per action.
+
+    Requests started before `start()` (the warm-up) are not recorded.
+    """
+
+    def __init__(self):
+        self.started_at: Optional[float] = None
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+
+    def start(self) -> None:
+        """Begin recording from now on."""
+        self.started_at = time.perf_counter()
+
+    def record(self, action: str, started: float, status: Optional[int], ok: bool) -> None:
+        """
+        Record one request.
+
+        Args:
+            action (str): Name of the user action, e.g. "browse_books".
+            started (float): `time.perf_counter()` when the request was sent.
+            status (Optional[int]): Response status, None if no response came.
+            ok (bool): Whether the outcome was the expected one.
+        """
+        # Still in the warm-up when the request was sent
+        if self.started_at is None or started < self.started_at:
+            return
+        self.latencies[action].append(time.perf_counter() - started)
+        self.statuses[action][str(status or "no_response")] += 1
+        # Unexpected statuses are errors too, e.g. a 503 where a 200 was due
+        self.errors[action] += not ok
+
+    def summary(self, seconds: float) -> Dict[str, Any]:
+        """Throughput, error rate and latency percentiles per action and overall."""
+        actions = {
+            action: summarize(latencies, self.errors[action], seconds)
+            for action, latencies in sorted(self.latencies.items())
+        }
+        for action, result in actions.items():
+            result["statuses"] = dict(self.statuses[action])
+        everything = [latency for latencies in self.latencies.values() for latency in latencies]
+        return {
+            "total": summarize(everything, sum(self.errors.values()), seconds),
+            "actions": actions,
+        }
+
+
+def summarize(latencies: List[float], errors: int, seconds: float) -> Dict[str, Any]:
+    """Requests per second, error rate and p50/p95/p99 latency of some requests."""
+    if not latencies:
+        return {"requests": 0, "rps": 0.0, "error_rate": 0.0,
+                "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / seconds,
+        "error_rate": errors / len(latencies),
+        **{
+            f"p{round(fraction * 100)}_ms": percentile(latencies, fraction) * 1000
+            for fraction in (0.50, 0.95, 0.99)
+        },
+    }
+
+
+def current_commit() -> Optional[str]:
+    """Commit of the working tree under test, None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,73 @@
+"""
+Processes of a load test: the fake Gutendex and the API itself.
+
+They run as child processes, so that the load generator does not share an
+event loop with them, and are stopped when the load test ends.
+"""
+import contextlib
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import unquote, urlsplit
+
+import httpx
+
+from benchmarks.load.migrations import ROOT
+
+
+def free_port() -> int:
+    """A local TCP port nothing listens on right now."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def api_environment(database_url: str, gutendex_url: str) -> Dict[str, str]:
+    """Settings of the API under test; other settings come from our own environment."""
+    parts = urlsplit(database_url)
+    return {
+        "PYTHONPATH": os.pathsep.join((str(ROOT / "src"), str(ROOT))),
+        "POSTGRES_HOST": parts.hostname,
+        "POSTGRES_PORT": str(parts.port or 5432),
+        "POSTGRES_USER": unquote(parts.username or ""),
+        "POSTGRES_PASSWORD": unquote(parts.password or ""),
+        "POSTGRES_DB": parts.path.lstrip("/"),
+        "GUTENDEX_BASE_URL": gutendex_url,
+        "JWT_TOKEN_SECRET": os.environ.get("JWT_TOKEN_SECRET", "load-test"),
+    }
+
+
+def wait_until_up(url: str, process: subprocess.Popen, timeout: float = 60) -> None:
+    """
+    Wait until `url` answers at all, whatever the status.
+
+    Raises:
+        RuntimeError: If the process exits first.
+        TimeoutError: If it does not answer within `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{url} exited with code {process.returncode}")
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise TimeoutError(f"{url} did not answer within {timeout:.0f} s")
+
+
+@contextlib.contextmanager
+def serve(args: List[str], url: str, env: Optional[Dict[str, str]] = None) -> Iterator[None]:
+    """Run `python <args>` from the repository root for the duration of the block."""
+    env = {**os.environ, **(env or {})}
+    process = subprocess.Popen([sys.executable, *args], cwd=ROOT, env=env)
+    try:
+        wait_until_up(url, process)
+        yield
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
@@ -0,0 +1,98 @@
+"""
+Virtual users of a load test: accounts, requests and the pace of actions.
+
+Every user registers, then repeatedly picks an action at random, by the
+weights of its mix (see `benchmarks.load.mixes`), and waits an exponentially
+distributed think time before the next one.
+"""
+import asyncio
+import random
+import time
+from typing import Collection, Dict, Optional
+
+import httpx
+
+from benchmarks.load.report import Recorder
+
+PASSWORD = "Smack-load-test-1234"
+# Shape of the book popularity: the lower, the longer the tail of rarely requested books
+POPULARITY = 0.7
+
+
+class VirtualUser:
+    """One simulated user with its own account and token."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        recorder: Recorder,
+        login: str,
+        books: int,
+        rng: random.Random,
+    ):
+        """
+        Args:
+            client (httpx.AsyncClient): Client of the API under test, shared by the users.
+            recorder (Recorder): Where the requests are recorded.
+            login (str): Login of the account to create.
+            books (int): Number of books of the fake Gutendex.
+            rng (random.Random): Source of the user's choices.
+        """
+        self.client = client
+        self.recorder = recorder
+        self.login_name = login
+        self.books = books
+        self.rng = rng
+        self.headers: Dict[str, str] = {}
+
+    async def request(
+        self, action: str, method: str, url: str, expected: Collection[int] = (200,), **kwargs
+    ) -> Optional[httpx.Response]:
+        """
+        Send a request and record its latency under `action`.
+
+        Returns:
+            The response, or None if it failed or had an unexpected status.
+        """
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(action, started, None, False)
+            return None
+        ok = response.status_code in expected
+        self.recorder.record(action, started, response.status_code, ok)
+        return response if ok else None
+
+    def book_id(self) -> int:
+        # Popular books are requested far more often than the rest, as on a real catalogue
+        return (int(self.rng.paretovariate(POPULARITY)) - 1) % self.books + 1
+
+    async def register(self) -> bool:
+        """Create the account; False if that failed."""
+        body = {"login": self.login_name, "password": PASSWORD, "username": self.login_name}
+        response = await self.request("register", "POST", "/users/new", json=body)
+        # Logged in from now on
+        if response is not None:
+            self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        return response is not None
+
+    async def login(self) -> None:
+        # As a returning user on another device would; the token in use stays valid
+        form = {"username": self.login_name, "password": PASSWORD}
+        await self.request("login", "POST", "/users/token", data=form)
+
+    async def run(self, weights: Dict[str, int], deadline: float, think_time: float) -> None:
+        """
+        Perform actions until `deadline` (a `time.perf_counter()` value).
+
+        Args:
+            weights (Dict[str, int]): Relative weight of each action (method name).
+            deadline (float): When to stop.
+            think_time (float): Mean pause between actions in seconds, 0 for none.
+        """
+        actions, chances = zip(*weights.items())
+        while time.perf_counter() < deadline:
+            await getattr(self, self.rng.choices(actions, chances)[0])()
+            if think_time:
+                await asyncio.sleep(self.rng.expovariate(1 / think_time))
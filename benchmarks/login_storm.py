@@ -0,0 +1,127 @@
+"""
+Login storm benchmark: password hashing inline vs. on the hashing executor.
+
+A minimal app exposes POST /login, which verifies an argon2id password the
+same way `authenticate_user` does, and GET /ping, standing in for any
+non-auth request. For each mode, `--logins` clients log in back to back
+while one client pings every 5 ms; the report shows login throughput and
+the latency percentiles of the pings, i.e. how much a login storm stalls
+everyone else.
+
+Usage:
+    python -m benchmarks.login_storm [--seconds 5] [--logins 16]
+"""
+import argparse
+import asyncio
+import os
+import time
+from typing import Dict, List
+
+# src.config builds the database URL at import time; no database is used here
+for name in ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB"):
+    os.environ.setdefault(name, "benchmark")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from benchmarks.stats import percentile, print_table  # noqa: E402
+from src.oauth.password_utils import (  # noqa: E402
+    check_password,
+    get_password_hash,
+    verify_password,
+)
+
+PASSWORD = "Smack-benchmark-1234"
+PING_INTERVAL = 0.005
+
+
+def build_app(mode: str, hashed: str) -> FastAPI:
+    """App whose /login verifies inline ("inline") or on the executor ("executor")."""
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login():
+        # Inline is what the handlers did before hashing moved to the executor
+        if mode == "inline":
+            return {"ok": verify_password(PASSWORD, hashed)}
+        valid, _ = await check_password(PASSWORD, hashed)
+        return {"ok": valid}
+
+    @app.get("/ping")
+    async def ping():
+        return {}
+
+    return app
+
+
+async def login_client(client: httpx.AsyncClient, deadline: float, done: List[float]) -> None:
+    """Log in again as soon as the previous login completed."""
+    while time.perf_counter() < deadline:
+        (await client.post("/login")).raise_for_status()
+        done.append(time.perf_counter())
+
+
+async def ping_client(client: httpx.AsyncClient, deadline: float, latencies: List[float]) -> None:
+    """
+    Measure how long cheap requests are held up.
+
+    Pings are due every PING_INTERVAL and their latency counts from when they
+    were due, so the pings a stalled event loop kept from being sent count too.
+    """
+    due = time.perf_counter()
+    while due < deadline:
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        await client.get("/ping")
+        finished = time.perf_counter()
+        while due <= finished and due < deadline:
+            latencies.append(finished - due)
+            due += PING_INTERVAL
+
+
+async def run_mode(mode: str, seconds: float, logins: int, hashed: str) -> Dict[str, float]:
+    """
+    Run one storm and summarize it.
+
+    Args:
+        mode (str): "inline" or "executor", see `build_app`.
+        seconds (float): Duration of the storm.
+        logins (int): Number of concurrent login clients.
+        hashed (str): Stored hash the logins are verified against.
+
+    Returns:
+        dict: Login throughput and ping latency percentiles.
+    """
+    transport = httpx.ASGITransport(app=build_app(mode, hashed))
+    deadline = time.perf_counter() + seconds
+    done: List[float] = []
+    latencies: List[float] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await asyncio.gather(
+            ping_client(client, deadline, latencies),
+            *(login_client(client, deadline, done) for _ in range(logins)),
+        )
+    return {
+        "logins_per_s": len(done) / seconds,
+        "ping_p50_ms": percentile(latencies, 0.50) * 1000,
+        "ping_p99_ms": percentile(latencies, 0.99) * 1000,
+        "pings": len(latencies),
+    }
+
+
+def main() -> None:
+    """Parse the options, run both modes and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--logins", type=int, default=16, help="concurrent login clients")
+    args = parser.parse_args()
+
+    hashed = get_password_hash(PASSWORD)
+    results = {
+        mode: asyncio.run(run_mode(mode, args.seconds, args.logins, hashed))
+        for mode in ("inline", "executor")
+    }
+    print_table(results, ("logins_per_s", "ping_p50_ms", "ping_p99_ms", "pings"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Microbenchmarks of the CPU work done per request, compared to a baseline.
+
+Each case of `benchmarks.micro.cases` is timed in isolation with `timeit`:
+the loop count is picked so that one run takes at least 0.2s, then
+`--repeat` runs are made and the best and median time per call reported.
+
+The results are compared to the stored `baseline.json`: a case whose best
+time is more than `--tolerance` slower fails the run, so a regression is
+caught before deploy. Timings depend on the machine, so the baseline is
+regenerated with `--save-baseline` on the machine that runs the comparison.
+
+Usage:
+    python -m benchmarks.micro [-k enrich] [--repeat 7] [--tolerance 0.25]
+        [--output micro-benchmarks.json] [--save-baseline]
+"""
+import argparse
+import json
+import platform
+import sys
+
+from benchmarks.load.report import current_commit
+from benchmarks.micro.cases import CASES
+from benchmarks.micro.timing import BASELINE, compare, measure
+from benchmarks.stats import print_table
+
+
+def main() -> None:
+    """Run the cases, write the results and fail on a regression."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", default="", help="only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown of the best time, 0.25 being 25%%")
+    parser.add_argument("--output", default="micro-benchmarks.json")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help=f"store the results as {BASELINE.name} instead of comparing")
+    args = parser.parse_args()
+
+    results = {case: measure(case, args.repeat) for case in CASES if args.k in case}
+    report = {
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(BASELINE if args.save_baseline else args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    if args.save_baseline or not BASELINE.exists():
+        print_table(results, ("best_us", "median_us"))
+        return
+
+    rows = compare(results, json.loads(BASELINE.read_text()), args.tolerance)
+    print_table(rows, ("best_us", "median_us", "baseline_us", "change_%"))
+    regressed = [case for case, row in rows.items() if row["regressed"]]
+    if regressed:
+        sys.exit(f"\nSlower than the baseline by more than {args.tolerance:.0%}: "
+                 + ", ".join(regressed))
+
+
+if __name__ == "__main__":
+    main()
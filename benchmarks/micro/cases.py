@@ -0,0 +1,99 @@
+"""
+The microbenchmark cases: CPU work done on every request, without I/O.
+
+Each case builds its inputs once and returns the function that is timed,
+so that only the hot path itself is measured.
+"""
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+# src.config reads these at import time; no database is used here
+for name in ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "JWT_TOKEN_SECRET"):
+    os.environ.setdefault(name, "benchmark")
+
+from jose import jwt  # noqa: E402
+
+from benchmarks.micro.payloads import gutendex_page  # noqa: E402
+from src.config import JWT_TOKEN_SECRET  # noqa: E402
+from src.models.schemas import Book, EnrichedBooksList, ListBooksParams  # noqa: E402
+from src.models.user_schemas import UserBase  # noqa: E402
+from src.oauth.auth_algorithm import ALGORITHM  # noqa: E402
+from src.oauth.jwt_utils import create_access_token_from_user  # noqa: E402
+from src.routers.books import enrich_books  # noqa: E402
+
+# Books the user has a state for, far more than one page holds
+LIBRARY_SIZE = 10000
+
+
+def book_states() -> Dict[int, tuple]:
+    """(became_favourite_at, reading_status) of a large library, part of the page included."""
+    rng = random.Random(0)
+    added = datetime(2025, 5, 1, 12, 30)
+    states = {
+        book_id: (added - timedelta(minutes=book_id), rng.choice((None, "reading", "done")))
+        for book_id in rng.sample(range(1, 100000), LIBRARY_SIZE)
+    }
+    for book in gutendex_page()["results"][::2]:
+        states[book["id"]] = (added, "want_to_read")
+    return states
+
+
+def enriched_page() -> dict:
+    """The page `list_books` validates as `EnrichedBooksList`."""
+    return enrich_books(gutendex_page(), book_states())
+
+
+def enrich_page() -> Callable[[], object]:
+    """`enrich_books` over a page of 32 books against a large state dict."""
+    page, states = gutendex_page(), book_states()
+    return lambda: enrich_books(page, states)
+
+
+def validate_books() -> Callable[[], object]:
+    """`Book(**metadata)` for every book of a page."""
+    books = gutendex_page()["results"]
+    return lambda: [Book(**book) for book in books]
+
+
+def validate_page() -> Callable[[], object]:
+    """`EnrichedBooksList(**enriched)`, the response model of GET /books/."""
+    page = enriched_page()
+    return lambda: EnrichedBooksList(**page)
+
+
+def serialize_page() -> Callable[[], object]:
+    """A validated page rendered to JSON, as FastAPI's response does."""
+    model = EnrichedBooksList(**enriched_page())
+    return lambda: json.dumps(model.model_dump(mode="json")).encode()
+
+
+def encode_token() -> Callable[[], object]:
+    """`create_access_token_from_user`, done on every login."""
+    user = UserBase(login="reader@example.com", username="reader")
+    return lambda: create_access_token_from_user(user)
+
+
+def decode_token() -> Callable[[], object]:
+    """`jwt.decode` of an access token, done on every principal cache miss."""
+    token = create_access_token_from_user(UserBase(login="reader@example.com"))
+    return lambda: jwt.decode(token, JWT_TOKEN_SECRET, algorithms=[ALGORITHM])
+
+
+def dump_list_params() -> Callable[[], object]:
+    """`ListBooksParams.model_dump`, as `fetch_books` forwards the query to Gutendex."""
+    params = ListBooksParams(page=2, languages="en,fr", search="dickens", sort="popular")
+    return lambda: params.model_dump(exclude_none=True, exclude={"cursor"})
+
+
+CASES: Dict[str, Callable[[], Callable[[], object]]] = {
+    "enrich_books": enrich_page,
+    "book_validate": validate_books,
+    "page_validate": validate_page,
+    "page_serialize": serialize_page,
+    "jwt_encode": encode_token,
+    "jwt_decode": decode_token,
+    "params_dump": dump_list_params,
+}
@@ -0,0 +1,97 @@
+"""
+Gutendex payloads for the microbenchmarks, shaped like a real first page
+of `/books/` (the most downloaded books): authors with their years, a
+machine-written summary, subjects, bookshelves and the usual formats.
+"""
+from typing import Any, Dict, List
+
+# (id, title, author, birth year, death year, downloads) of the first listing page
+TOP_BOOKS = (
+    (84, "Frankenstein; Or, The Modern Prometheus", "Shelley, Mary Wollstonecraft", 1797, 1851,
+     101386),
+    (1342, "Pride and Prejudice", "Austen, Jane", 1775, 1817, 73462),
+    (2701, "Moby Dick; Or, The Whale", "Melville, Herman", 1819, 1891, 67289),
+    (1513, "Romeo and Juliet", "Shakespeare, William", 1564, 1616, 63874),
+    (11, "Alice's Adventures in Wonderland", "Carroll, Lewis", 1832, 1898, 53125),
+    (100, "The Complete Works of William Shakespeare", "Shakespeare, William", 1564, 1616,
+     51204),
+    (64317, "The Great Gatsby", "Fitzgerald, F. Scott (Francis Scott)", 1896, 1940, 48920),
+    (2641, "A Room with a View", "Forster, E. M. (Edward Morgan)", 1879, 1970, 45871),
+    (145, "Middlemarch", "Eliot, George", 1819, 1880, 44603),
+    (37106, "Little Women; Or, Meg, Jo, Beth, and Amy", "Alcott, Louisa May", 1832, 1888,
+     42117),
+    (67979, "The Blue Castle: a novel", "Montgomery, L. M. (Lucy Maud)", 1874, 1942, 41580),
+    (16389, "The Enchanted April", "Von Arnim, Elizabeth", 1866, 1941, 39802),
+    (394, "Cranford", "Gaskell, Elizabeth Cleghorn", 1810, 1865, 38544),
+    (6761, "The Adventures of Ferdinand Count Fathom — Complete", "Smollett, T. (Tobias)",
+     1721, 1771, 37209),
+    (2160, "The Expedition of Humphry Clinker", "Smollett, T. (Tobias)", 1721, 1771, 36988),
+    (4085, "The Adventures of Roderick Random", "Smollett, T. (Tobias)", 1721, 1771, 36512),
+    (6593, "History of Tom Jones, a Foundling", "Fielding, Henry", 1707, 1754, 35870),
+    (5197, "My Life — Volume 1", "Wagner, Richard", 1813, 1883, 35644),
+    (1259, "Twenty Years After", "Dumas, Alexandre", 1802, 1870, 34990),
+    (844, "The Importance of Being Earnest: A Trivial Comedy for Serious People",
+     "Wilde, Oscar", 1854, 1900, 34521),
+    (25344, "The Scarlet Letter", "Hawthorne, Nathaniel", 1804, 1864, 33408),
+    (1260, "Jane Eyre: An Autobiography", "Brontë, Charlotte", 1816, 1855, 32765),
+    (2542, "A Doll's House : a play", "Ibsen, Henrik", 1828, 1906, 31950),
+    (174, "The Picture of Dorian Gray", "Wilde, Oscar", 1854, 1900, 31402),
+    (345, "Dracula", "Stoker, Bram", 1847, 1912, 30885),
+    (76, "Adventures of Huckleberry Finn", "Twain, Mark", 1835, 1910, 29917),
+    (98, "A Tale of Two Cities", "Dickens, Charles", 1812, 1870, 29406),
+    (1080, "A Modest Proposal", "Swift, Jonathan", 1667, 1745, 28877),
+    (43, "The Strange Case of Dr. Jekyll and Mr. Hyde", "Stevenson, Robert Louis", 1850, 1894,
+     28450),
+    (5200, "Metamorphosis", "Kafka, Franz", 1883, 1924, 27962),
+    (1952, "The Yellow Wallpaper", "Gilman, Charlotte Perkins", 1860, 1935, 27514),
+    (1400, "Great Expectations", "Dickens, Charles", 1812, 1870, 27003),
+)
+
+SUMMARY = (
+    '"{title}" by {author} is a work of literature written in its author\'s lifetime. '
+    "The story follows its protagonists through a series of trials that reveal the manners, "
+    "ambitions and conflicts of their society, and it has been read ever since for its "
+    "characters, its humour and its insight into human nature. The opening of the book "
+    "introduces the setting and the central figures, hinting at the tensions that will "
+    "unfold as the narrative progresses. (This is an automatically generated summary.)"
+)
+
+
+def gutendex_book(book_id: int, title: str, author: str, born: int, died: int,
+                  downloads: int) -> Dict[str, Any]:
+    """One book as Gutendex returns it."""
+    base = f"https://www.gutenberg.org/ebooks/{book_id}"
+    cache = f"https://www.gutenberg.org/cache/epub/{book_id}/pg{book_id}"
+    return {
+        "id": book_id,
+        "title": title,
+        "authors": [{"name": author, "birth_year": born, "death_year": died}],
+        "summaries": [SUMMARY.format(title=title, author=author)],
+        "translators": [],
+        "subjects": ["Fiction", f"{author.split(',')[0]} -- Fiction", "Classic literature"],
+        "bookshelves": ["Best Books Ever Listings", "Category: Novels", "Category: Classics"],
+        "languages": ["en"],
+        "copyright": False,
+        "media_type": "Text",
+        "formats": {
+            "text/html": f"{base}.html.images",
+            "application/epub+zip": f"{base}.epub3.images",
+            "application/x-mobipocket-ebook": f"{base}.kf8.images",
+            "text/plain; charset=us-ascii": f"{base}.txt.utf-8",
+            "application/rdf+xml": f"{base}.rdf",
+            "image/jpeg": f"{cache}.cover.medium.jpg",
+            "application/octet-stream": f"{cache}-h.zip",
+        },
+        "download_count": downloads,
+    }
+
+
+def gutendex_page() -> Dict[str, Any]:
+    """A full listing page of 32 books."""
+    results: List[Dict[str, Any]] = [gutendex_book(*book) for book in TOP_BOOKS]
+    return {
+        "count": 76523,
+        "next": "https://gutendex.com/books/?page=2",
+        "previous": None,
+        "results": results,
+    }
@@ -0,0 +1,37 @@
+"""Timing of the microbenchmark cases and their comparison to the baseline."""
+import timeit
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict
+
+from benchmarks.micro.cases import CASES
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def measure(case: str, repeat: int) -> Dict[str, float]:
+    """Best and median microseconds per call of `case` over `repeat` runs."""
+    timer = timeit.Timer(CASES[case]())
+    loops, _ = timer.autorange()
+    per_call = [total / loops * 1e6 for total in timer.repeat(repeat, loops)]
+    return {"best_us": min(per_call), "median_us": median(per_call), "loops": loops}
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any],
+            tolerance: float) -> Dict[str, Dict[str, float]]:
+    """
+    Results of the cases in the baseline, with the baseline's best time and
+    the change of the best time in %; `regressed` is 1 for a case slower
+    than the baseline by more than `tolerance`.
+    """
+    rows = {}
+    for case, result in results.items():
+        if case not in baseline["results"]:
+            continue
+        before = baseline["results"][case]["best_us"]
+        change = result["best_us"] / before - 1
+        rows[case] = {
+            **result, "baseline_us": before, "change_%": change * 100,
+            "regressed": float(change > tolerance),
+        }
+    return rows
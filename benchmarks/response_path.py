@@ -0,0 +1,126 @@
+"""
+Response path benchmark: validated models vs. the fast JSON path.
+
+A minimal app serves the same favourites page twice: GET /validated builds
+`FavouriteBook` models and lets FastAPI validate and serialize them against
+the response model, as the list endpoints used to; GET /fast assembles the
+page from cached `book_payload` projections and returns it with
+`json_response`, as they do now. `--clients` clients request each endpoint
+back to back; the report shows requests per second and latency percentiles.
+
+Usage:
+    python -m benchmarks.response_path [--seconds 5] [--clients 8] [--items 100]
+"""
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Dict, List
+
+# src.config builds the database URL at import time; no database is used here
+for name in ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB"):
+    os.environ.setdefault(name, "benchmark")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from benchmarks.stats import percentile, print_table  # noqa: E402
+from src.models.schemas import Book, FavouriteBook  # noqa: E402
+from src.routers.json_responses import book_payload, json_response  # noqa: E402
+
+
+def make_metadata(items: int) -> List[dict]:
+    """Gutendex-like payloads, shared between requests as the metadata cache does."""
+    return [
+        {
+            "id": book_id,
+            "title": f"Book {book_id}",
+            "authors": [{"name": f"Author {book_id}", "birth_year": 1800, "death_year": 1870}],
+            "subjects": ["Fiction", "Adventure stories"],
+            "bookshelves": ["Best Books Ever Listings"],
+            "languages": ["en"],
+            "copyright": False,
+            "media_type": "Text",
+            "formats": {"text/html": f"https://www.gutenberg.org/ebooks/{book_id}.html.images"},
+            "download_count": book_id * 10,
+        }
+        for book_id in range(1, items + 1)
+    ]
+
+
+def build_app(items: int) -> FastAPI:
+    """App serving the same page of `items` favourites on both paths."""
+    app = FastAPI()
+    metadata = make_metadata(items)
+    added_at = datetime(2025, 5, 1, 12, 30)
+
+    @app.get("/validated", response_model=List[FavouriteBook])
+    async def validated():
+        return [FavouriteBook(book=Book(**book), added_at=added_at) for book in metadata]
+
+    @app.get("/fast", response_model=List[FavouriteBook])
+    async def fast():
+        return json_response(
+            [{"book": book_payload(book), "added_at": added_at} for book in metadata]
+        )
+
+    return app
+
+
+async def page_client(
+    client: httpx.AsyncClient, path: str, deadline: float, latencies: List[float]
+) -> None:
+    """Request the page again as soon as the previous response arrived."""
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        (await client.get(path)).raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_path(path: str, seconds: float, clients: int, items: int) -> Dict[str, float]:
+    """
+    Load one endpoint and summarize it.
+
+    Args:
+        path (str): "/validated" or "/fast", see `build_app`.
+        seconds (float): Duration of the run.
+        clients (int): Number of concurrent clients.
+        items (int): Favourites per page.
+
+    Returns:
+        dict: Throughput and latency percentiles.
+    """
+    transport = httpx.ASGITransport(app=build_app(items))
+    latencies: List[float] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm-up request: fills the projection cache of the fast path
+        (await client.get(path)).raise_for_status()
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(
+            *(page_client(client, path, deadline, latencies) for _ in range(clients))
+        )
+    return {
+        "requests_per_s": len(latencies) / seconds,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main() -> None:
+    """Parse the options, run both paths and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--clients", type=int, default=8, help="concurrent clients")
+    parser.add_argument("--items", type=int, default=100, help="favourites per page")
+    args = parser.parse_args()
+
+    results = {
+        path.strip("/"): asyncio.run(run_path(path, args.seconds, args.clients, args.items))
+        for path in ("/validated", "/fast")
+    }
+    print_table(results, ("requests_per_s", "p50_ms", "p99_ms"))
+
+
+if __name__ == "__main__":
+    main()
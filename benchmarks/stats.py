@@ -0,0 +1,22 @@
+"""Helpers shared by the benchmark scripts: percentiles and result tables."""
+from typing import Dict, List, Sequence
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile; works with a handful of samples too."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def print_table(rows: Dict[str, Dict[str, float]], columns: Sequence[str]) -> None:
+    """
+    Print one line per benchmark case.
+
+    Args:
+        rows: Results keyed by case name, each a mapping of column to value.
+        columns: Columns to print, in order.
+    """
+    width = max(12, *(len(name) + 2 for name in rows))
+    print(f"{'case':<{width}}" + "".join(f"{column:>14}" for column in columns))
+    for name, result in rows.items():
+        print(f"{name:<{width}}" + "".join(f"{result[column]:>14.2f}" for column in columns))
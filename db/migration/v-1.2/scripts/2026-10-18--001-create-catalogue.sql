@@ -0,0 +1,108 @@
+-- liquibase formatted sql
+
+-- changeset catorleader:001-create-books-table
+CREATE TABLE books
+(
+    id             integer PRIMARY KEY,
+    title          text    NOT NULL,
+    summaries      text[]  NOT NULL DEFAULT '{}',
+    bookshelves    text[]  NOT NULL DEFAULT '{}',
+    languages      text[]  NOT NULL DEFAULT '{}',
+    copyright      boolean,
+    media_type     varchar(64) NOT NULL,
+    formats        jsonb   NOT NULL DEFAULT '{}',
+    download_count integer NOT NULL DEFAULT 0,
+    payload_hash   char(32) NOT NULL,
+    synced_at      timestamp NOT NULL DEFAULT now()
+);
+
+CREATE INDEX idx_books_download_count ON books (download_count DESC, id);
+CREATE INDEX idx_books_languages ON books USING gin (languages);
+
+-- DROP TABLE IF EXISTS books CASCADE;
+
+-- changeset catorleader:002-create-authors-table
+CREATE TYPE book_person_role AS ENUM ('author', 'translator');
+
+CREATE TABLE authors
+(
+    id         serial PRIMARY KEY,
+    name       varchar(1024) NOT NULL,
+    birth_year integer,
+    death_year integer,
+    CONSTRAINT uq_authors_person UNIQUE NULLS NOT DISTINCT (name, birth_year, death_year)
+);
+
+CREATE TABLE book_authors
+(
+    book_id   integer          NOT NULL REFERENCES books (id) ON DELETE CASCADE,
+    author_id integer          NOT NULL REFERENCES authors (id),
+    role      book_person_role NOT NULL,
+    position  smallint         NOT NULL,
+    PRIMARY KEY (book_id, role, position)
+);
+
+CREATE INDEX idx_book_authors_author ON book_authors (author_id);
+
+-- DROP TABLE IF EXISTS book_authors CASCADE;
+-- DROP TABLE IF EXISTS authors CASCADE;
+-- DROP TYPE IF EXISTS book_person_role;
+
+-- changeset catorleader:003-create-subjects-table
+CREATE TABLE subjects
+(
+    id   serial PRIMARY KEY,
+    name text NOT NULL UNIQUE
+);
+
+CREATE TABLE book_subjects
+(
+    book_id    integer NOT NULL REFERENCES books (id) ON DELETE CASCADE,
+    subject_id integer NOT NULL REFERENCES subjects (id),
+    position   smallint NOT NULL,
+    PRIMARY KEY (book_id, subject_id)
+);
+
+CREATE INDEX idx_book_subjects_subject ON book_subjects (subject_id);
+
+-- DROP TABLE IF EXISTS book_subjects CASCADE;
+-- DROP TABLE IF EXISTS subjects CASCADE;
+
+-- changeset catorleader:004-create-book-documents-view
+CREATE VIEW book_documents AS
+SELECT b.id,
+       b.download_count,
+       jsonb_build_object(
+               'id', b.id,
+               'title', b.title,
+               'authors', COALESCE((SELECT jsonb_agg(jsonb_build_object(
+                                                   'name', a.name,
+                                                   'birth_year', a.birth_year,
+                                                   'death_year', a.death_year) ORDER BY ba.position)
+                                    FROM book_authors ba
+                                             JOIN authors a ON a.id = ba.author_id
+                                    WHERE ba.book_id = b.id
+                                      AND ba.role = 'author'), '[]'),
+               'translators', COALESCE((SELECT jsonb_agg(jsonb_build_object(
+                                                       'name', a.name,
+                                                       'birth_year', a.birth_year,
+                                                       'death_year', a.death_year) ORDER BY ba.position)
+                                        FROM book_authors ba
+                                                 JOIN authors a ON a.id = ba.author_id
+                                        WHERE ba.book_id = b.id
+                                          AND ba.role = 'translator'), '[]'),
+               'subjects', COALESCE((SELECT jsonb_agg(s.name ORDER BY bs.position)
+                                     FROM book_subjects bs
+                                              JOIN subjects s ON s.id = bs.subject_id
+                                     WHERE bs.book_id = b.id), '[]'),
+               'summaries', to_jsonb(b.summaries),
+               'bookshelves', to_jsonb(b.bookshelves),
+               'languages', to_jsonb(b.languages),
+               'copyright', b.copyright,
+               'media_type', b.media_type,
+               'formats', b.formats,
+               'download_count', b.download_count
+       ) AS document
+FROM books b;
+
+-- DROP VIEW IF EXISTS book_documents;
@@ -0,0 +1,49 @@
+-- liquibase formatted sql
+
+-- changeset catorleader:005-create-pg-trgm-extension
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- DROP EXTENSION IF EXISTS pg_trgm;
+
+-- changeset catorleader:006-add-books-search-columns
+ALTER TABLE books
+    ADD COLUMN search_text   text     NOT NULL DEFAULT '',
+    ADD COLUMN search_vector tsvector NOT NULL DEFAULT '';
+
+CREATE INDEX idx_books_search_vector ON books USING gin (search_vector);
+CREATE INDEX idx_books_search_text_trgm ON books USING gin (search_text gin_trgm_ops);
+
+-- ALTER TABLE books DROP COLUMN IF EXISTS search_vector, DROP COLUMN IF EXISTS search_text;
+
+-- changeset catorleader:007-create-refresh-book-search-function splitStatements:false endDelimiter:;
+CREATE OR REPLACE FUNCTION refresh_book_search(book_ids integer[])
+    RETURNS void AS
+$$
+WITH parts AS (SELECT b.id,
+                      b.title,
+                      COALESCE((SELECT string_agg(a.name, ' ' ORDER BY ba.position)
+                                FROM book_authors ba
+                                         JOIN authors a ON a.id = ba.author_id
+                                WHERE ba.book_id = b.id
+                                  AND ba.role = 'author'), '')      AS authors,
+                      COALESCE((SELECT string_agg(s.name, ' ' ORDER BY bs.position)
+                                FROM book_subjects bs
+                                         JOIN subjects s ON s.id = bs.subject_id
+                                WHERE bs.book_id = b.id), '')       AS subjects,
+                      array_to_string(b.bookshelves, ' ')           AS bookshelves
+               FROM books b
+               WHERE b.id = ANY (book_ids))
+UPDATE books b
+SET search_text   = concat_ws(' ', p.title, p.authors, p.subjects, p.bookshelves),
+    search_vector = setweight(to_tsvector('simple', p.title), 'A') ||
+                    setweight(to_tsvector('simple', p.authors), 'B') ||
+                    setweight(to_tsvector('simple', p.subjects), 'C') ||
+                    setweight(to_tsvector('simple', p.bookshelves), 'D')
+FROM parts p
+WHERE b.id = p.id;
+$$ LANGUAGE sql;
+
+-- DROP FUNCTION IF EXISTS refresh_book_search(integer[]);
+
+-- changeset catorleader:008-backfill-books-search
+SELECT refresh_book_search(ARRAY(SELECT id FROM books));
@@ -0,0 +1,19 @@
+-- liquibase formatted sql
+
+-- changeset catorleader:009-create-favourite_books-user-created-index runInTransaction:false
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_favourite_books_user_created
+    ON favourite_books (user_id, created_at DESC, book_id DESC);
+
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_favourite_books_user_created;
+
+-- changeset catorleader:010-create-reading_list-user-status-updated-index runInTransaction:false
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reading_list_user_status_updated
+    ON reading_list (user_id, status, updated_at DESC, book_id DESC) INCLUDE (created_at);
+
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_reading_list_user_status_updated;
+
+-- changeset catorleader:011-create-reading_list-user-updated-index runInTransaction:false
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reading_list_user_updated
+    ON reading_list (user_id, updated_at DESC, book_id DESC) INCLUDE (status, created_at);
+
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_reading_list_user_updated;
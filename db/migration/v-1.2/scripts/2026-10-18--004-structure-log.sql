@@ -0,0 +1,86 @@
+-- liquibase formatted sql
+
+-- changeset catorleader:012-add-log-structured-columns
+ALTER TABLE log
+    ADD COLUMN IF NOT EXISTS book_id    integer,
+    ADD COLUMN IF NOT EXISTS old_status reading_status,
+    ADD COLUMN IF NOT EXISTS new_status reading_status;
+
+-- ALTER TABLE log DROP COLUMN IF EXISTS book_id, DROP COLUMN IF EXISTS old_status, DROP COLUMN IF EXISTS new_status;
+
+-- changeset catorleader:013-structure-trigger-log-favourite-books splitStatements:false endDelimiter:;
+CREATE OR REPLACE FUNCTION trigger_log_favourite_books()
+    RETURNS trigger AS
+$$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO log(action, user_id, book_id, info)
+        VALUES ('add_favourite', NEW.user_id, NEW.book_id,
+                'Added favourite book with book_id: ' || NEW.book_id);
+        RETURN NEW;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO log(action, user_id, book_id, info)
+        VALUES ('remove_favourite', OLD.user_id, OLD.book_id,
+                'Removed favourite book with book_id: ' || OLD.book_id);
+        RETURN OLD;
+    ELSE
+        RETURN NULL;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- changeset catorleader:014-structure-trigger-log-reading-list splitStatements:false endDelimiter:;
+CREATE OR REPLACE FUNCTION trigger_log_reading_list()
+    RETURNS trigger AS
+$$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO log(action, user_id, book_id, new_status, info)
+        VALUES ('add_to_reading_list', NEW.user_id, NEW.book_id, NEW.status,
+                'Added book (book_id: ' || NEW.book_id || ') to reading list with status: ' || NEW.status);
+        RETURN NEW;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO log(action, user_id, book_id, old_status, new_status, info)
+        VALUES ('change_reading_status', NEW.user_id, NEW.book_id, OLD.status, NEW.status,
+                'Changed book (book_id: ' || NEW.book_id || ') status from ' || OLD.status || ' to ' || NEW.status);
+        RETURN NEW;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO log(action, user_id, book_id, old_status, info)
+        VALUES ('remove_from_reading_list', OLD.user_id, OLD.book_id, OLD.status,
+                'Removed book (book_id: ' || OLD.book_id || ') from reading list');
+        RETURN OLD;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- changeset catorleader:015-make-log-triggers-optional
+-- The API writes the activity log itself (ACTIVITY_LOG=app) and sets
+-- booktrack.log_triggers=off on its connections; the triggers then skip the
+-- per-row INSERT into log. Other clients (psql, scripts) are still logged.
+DROP TRIGGER IF EXISTS user_changes ON "user";
+CREATE TRIGGER user_changes
+    AFTER INSERT OR UPDATE OR DELETE
+    ON "user"
+    FOR EACH ROW
+    WHEN (COALESCE(current_setting('booktrack.log_triggers', true), '') <> 'off')
+EXECUTE FUNCTION trigger_log_user();
+
+DROP TRIGGER IF EXISTS favourite_books_changes ON favourite_books;
+CREATE TRIGGER favourite_books_changes
+    AFTER INSERT OR DELETE
+    ON favourite_books
+    FOR EACH ROW
+    WHEN (COALESCE(current_setting('booktrack.log_triggers', true), '') <> 'off')
+EXECUTE FUNCTION trigger_log_favourite_books();
+
+DROP TRIGGER IF EXISTS reading_list_changes ON reading_list;
+CREATE TRIGGER reading_list_changes
+    AFTER INSERT OR UPDATE OR DELETE
+    ON reading_list
+    FOR EACH ROW
+    WHEN (COALESCE(current_setting('booktrack.log_triggers', true), '') <> 'off')
+EXECUTE FUNCTION trigger_log_reading_list();
+
+-- DROP TRIGGER IF EXISTS user_changes ON "user"; CREATE TRIGGER user_changes AFTER INSERT OR UPDATE OR DELETE ON "user" FOR EACH ROW EXECUTE FUNCTION trigger_log_user();
+-- DROP TRIGGER IF EXISTS favourite_books_changes ON favourite_books; CREATE TRIGGER favourite_books_changes AFTER INSERT OR DELETE ON favourite_books FOR EACH ROW EXECUTE FUNCTION trigger_log_favourite_books();
+-- DROP TRIGGER IF EXISTS reading_list_changes ON reading_list; CREATE TRIGGER reading_list_changes AFTER INSERT OR UPDATE OR DELETE ON reading_list FOR EACH ROW EXECUTE FUNCTION trigger_log_reading_list();
@@ -0,0 +1,101 @@
+-- liquibase formatted sql
+
+-- changeset catorleader:016-create-log-partition-functions splitStatements:false endDelimiter:;
+-- Monthly partitions named log_YYYY_MM, from the month of `since` up to
+-- `months_ahead` months after the current one. Rows that reached log_default
+-- because their partition was missing are moved into the new partition.
+CREATE OR REPLACE FUNCTION create_log_partitions(months_ahead integer DEFAULT 3,
+                                                 since timestamp DEFAULT localtimestamp)
+    RETURNS integer AS
+$$
+DECLARE
+    month   timestamp := date_trunc('month', since);
+    part    text;
+    created integer   := 0;
+BEGIN
+    -- Several API workers and the maintenance job may run this at once
+    PERFORM pg_advisory_xact_lock(hashtext('create_log_partitions'));
+    WHILE month <= date_trunc('month', localtimestamp) + make_interval(months => months_ahead) LOOP
+        part := 'log_' || to_char(month, 'YYYY_MM');
+        IF to_regclass(part) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I (LIKE log INCLUDING DEFAULTS)', part);
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM log_default WHERE created_at >= %L AND created_at < %L RETURNING *)'
+                ' INSERT INTO %I SELECT * FROM moved',
+                month, month + interval '1 month', part);
+            EXECUTE format('ALTER TABLE log ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                           part, month, month + interval '1 month');
+            created := created + 1;
+        END IF;
+        month := month + interval '1 month';
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+-- DROP FUNCTION IF EXISTS create_log_partitions;
+
+-- changeset catorleader:017-create-log-retention-function splitStatements:false endDelimiter:;
+-- Retention: drop the monthly partitions older than `keep_months` months
+-- before the current one, which is much cheaper than DELETE + VACUUM.
+CREATE OR REPLACE FUNCTION drop_log_partitions(keep_months integer)
+    RETURNS integer AS
+$$
+DECLARE
+    cutoff  timestamp := date_trunc('month', localtimestamp) - make_interval(months => keep_months);
+    part    text;
+    dropped integer   := 0;
+BEGIN
+    FOR part IN
+        SELECT c.relname
+        FROM pg_inherits i
+                 JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'log'::regclass
+          AND c.relname ~ '^log_\d{4}_\d{2}$'
+          AND to_timestamp(substr(c.relname, 5), 'YYYY_MM') < cutoff
+    LOOP
+        EXECUTE format('DROP TABLE %I', part);
+        dropped := dropped + 1;
+    END LOOP;
+    RETURN dropped;
+END;
+$$ LANGUAGE plpgsql;
+-- DROP FUNCTION IF EXISTS drop_log_partitions;
+
+-- changeset catorleader:018-partition-log-table
+ALTER TABLE log RENAME TO log_unpartitioned;
+
+CREATE SEQUENCE IF NOT EXISTS log_id_seq AS bigint;
+
+CREATE TABLE log
+(
+    id         bigint    NOT NULL DEFAULT nextval('log_id_seq'),
+    action     action,
+    user_id    uuid,
+    info       varchar(1024),
+    created_at timestamp NOT NULL DEFAULT now(),
+    book_id    integer,
+    old_status reading_status,
+    new_status reading_status,
+    CONSTRAINT fk_log_user FOREIGN KEY (user_id) REFERENCES "user" (id)
+) PARTITION BY RANGE (created_at);
+
+ALTER SEQUENCE log_id_seq OWNED BY log.id;
+
+-- Catches rows whose monthly partition does not exist (yet)
+CREATE TABLE log_default PARTITION OF log DEFAULT;
+
+-- Log rows are appended in time order, so a BRIN index summarises time
+-- ranges in a few pages; the B-tree serves the per-user activity feed.
+CREATE INDEX idx_log_created_at_brin ON log USING brin (created_at);
+CREATE INDEX idx_log_user_created ON log (user_id, created_at DESC, id DESC);
+
+SELECT create_log_partitions(3, COALESCE((SELECT min(created_at) FROM log_unpartitioned), localtimestamp));
+
+INSERT INTO log (action, user_id, info, created_at, book_id, old_status, new_status)
+SELECT action, user_id, info, COALESCE(created_at, 'epoch'), book_id, old_status, new_status
+FROM log_unpartitioned
+ORDER BY created_at;
+
+DROP TABLE log_unpartitioned;
+
+-- DROP TABLE IF EXISTS log CASCADE;
@@ -0,0 +1,100 @@
+-- liquibase formatted sql
+
+-- changeset catorleader:019-create-user_library_stats-table
+-- Per-user counters behind GET /users/me/summary, kept up to date by the
+-- statement-level triggers below in the transaction of every write.
+CREATE TABLE IF NOT EXISTS user_library_stats
+(
+    user_id      uuid PRIMARY KEY REFERENCES "user" (id) ON DELETE CASCADE,
+    favourites   integer   NOT NULL DEFAULT 0,
+    want_to_read integer   NOT NULL DEFAULT 0,
+    reading      integer   NOT NULL DEFAULT 0,
+    done         integer   NOT NULL DEFAULT 0,
+    updated_at   timestamp NOT NULL DEFAULT localtimestamp
+);
+
+-- DROP TABLE IF EXISTS user_library_stats;
+
+-- changeset catorleader:020-create-count-library-changes-function splitStatements:false endDelimiter:;
+-- Adds the rows of a statement (transition tables new_rows and old_rows) to
+-- the counters with one upsert per statement, however many rows it wrote:
+-- rows added count +1, rows removed -1, an UPDATE is both. Favourites get
+-- the status 'favourite', as reading_list.status may be NULL.
+CREATE OR REPLACE FUNCTION count_library_changes()
+    RETURNS trigger AS
+$$
+DECLARE
+    status  text := CASE TG_TABLE_NAME
+                        WHEN 'reading_list' THEN 'status::text'
+                        ELSE quote_literal('favourite') END;
+    added   text := format('SELECT user_id, %s AS status, 1 AS n FROM new_rows', status);
+    removed text := format('SELECT user_id, %s AS status, -1 AS n FROM old_rows', status);
+BEGIN
+    EXECUTE format(
+        'INSERT INTO user_library_stats AS s (user_id, favourites, want_to_read, reading, done)
+         SELECT user_id,
+                coalesce(sum(n) FILTER (WHERE status = %L), 0),
+                coalesce(sum(n) FILTER (WHERE status = %L), 0),
+                coalesce(sum(n) FILTER (WHERE status = %L), 0),
+                coalesce(sum(n) FILTER (WHERE status = %L), 0)
+         FROM (%s) AS changes
+         GROUP BY user_id
+         ON CONFLICT (user_id) DO UPDATE
+             SET favourites   = s.favourites + EXCLUDED.favourites,
+                 want_to_read = s.want_to_read + EXCLUDED.want_to_read,
+                 reading      = s.reading + EXCLUDED.reading,
+                 done         = s.done + EXCLUDED.done,
+                 updated_at   = localtimestamp',
+        'favourite', 'want_to_read', 'reading', 'done',
+        CASE TG_OP
+            WHEN 'INSERT' THEN added
+            WHEN 'DELETE' THEN removed
+            ELSE added || ' UNION ALL ' || removed
+        END);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+-- DROP FUNCTION IF EXISTS count_library_changes;
+
+-- changeset catorleader:021-create-library-count-triggers
+-- Creating the triggers locks out writers until the backfill below commits,
+-- so every row is counted exactly once.
+CREATE TRIGGER favourite_books_count_inserts
+    AFTER INSERT ON favourite_books
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_library_changes();
+CREATE TRIGGER favourite_books_count_deletes
+    AFTER DELETE ON favourite_books
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_library_changes();
+CREATE TRIGGER reading_list_count_inserts
+    AFTER INSERT ON reading_list
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_library_changes();
+CREATE TRIGGER reading_list_count_updates
+    AFTER UPDATE ON reading_list
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_library_changes();
+CREATE TRIGGER reading_list_count_deletes
+    AFTER DELETE ON reading_list
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_library_changes();
+
+INSERT INTO user_library_stats (user_id, favourites, want_to_read, reading, done)
+SELECT u.id,
+       (SELECT count(*) FROM favourite_books f WHERE f.user_id = u.id),
+       count(r.book_id) FILTER (WHERE r.status = 'want_to_read'),
+       count(r.book_id) FILTER (WHERE r.status = 'reading'),
+       count(r.book_id) FILTER (WHERE r.status = 'done')
+FROM "user" u
+         LEFT JOIN reading_list r ON r.user_id = u.id
+GROUP BY u.id
+ON CONFLICT (user_id) DO UPDATE
+    SET favourites   = EXCLUDED.favourites,
+        want_to_read = EXCLUDED.want_to_read,
+        reading      = EXCLUDED.reading,
+        done         = EXCLUDED.done,
+        updated_at   = localtimestamp;
+
+-- DROP TRIGGER IF EXISTS favourite_books_count_inserts ON favourite_books; DROP TRIGGER IF EXISTS favourite_books_count_deletes ON favourite_books;
+-- DROP TRIGGER IF EXISTS reading_list_count_inserts ON reading_list; DROP TRIGGER IF EXISTS reading_list_count_updates ON reading_list; DROP TRIGGER IF EXISTS reading_list_count_deletes ON reading_list;
@@ -0,0 +1,71 @@
+"""
+Bounded in-process queue handing out activity events in batches.
+"""
+import asyncio
+from typing import List, Optional
+
+from src.activity.events import ActivityEvent
+from src.metrics import ACTIVITY_QUEUE
+
+
+class EventBatcher:
+    """
+    Queue of events, taken out in batches of up to `batch_size` events.
+
+    A batch stays pending (and is handed out again) until `done` is called,
+    so events of a failed write are not lost.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, max_queue: int):
+        """
+        Args:
+            batch_size (int): Events in one batch at most.
+            flush_interval (float): Seconds a batch waits to fill up.
+            max_queue (int): Events kept waiting before `put` refuses new ones.
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(max_queue)
+        # Events taken off the queue and not written yet
+        self.pending: List[ActivityEvent] = []
+
+    def put(self, event: ActivityEvent) -> bool:
+        """Queue an event without waiting; False if the queue is full."""
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            return False
+        ACTIVITY_QUEUE.set(self._queue.qsize())
+        return True
+
+    async def next_batch(self) -> List[ActivityEvent]:
+        """Wait for an event, then for more until the batch is full or the interval is over."""
+        if not self.pending:
+            self.pending.append(await self._queue.get())
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while self._take(self.batch_size) < self.batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                self.pending.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return self.pending
+
+    def drain(self) -> List[ActivityEvent]:
+        """The pending batch followed by every queued event, e.g. on shutdown."""
+        self._take(None)
+        return self.pending
+
+    def done(self) -> None:
+        """The pending batch has been written."""
+        self.pending = []
+
+    def _take(self, limit: Optional[int]) -> int:
+        # Move queued events into the pending batch without waiting
+        while (limit is None or len(self.pending) < limit) and not self._queue.empty():
+            self.pending.append(self._queue.get_nowait())
+        ACTIVITY_QUEUE.set(self._queue.qsize())
+        return len(self.pending)
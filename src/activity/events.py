@@ -0,0 +1,35 @@
+"""
+Activity log events, recorded by the API and written by `ActivityLogWriter`.
+
+They carry the structured columns of the `log` table instead of the free
+text `info` the database triggers used to build.
+"""
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from src.models.schemas import Action, ReadingStatus
+
+__all__ = ["Action", "ActivityEvent"]
+
+
+class ActivityEvent(NamedTuple):
+    """One row of the activity log."""
+
+    action: Action
+    user_id: str
+    book_id: Optional[int]
+    old_status: Optional[ReadingStatus]
+    new_status: Optional[ReadingStatus]
+    created_at: datetime
+
+    @classmethod
+    def now(
+        cls,
+        action: Action,
+        user_id,
+        book_id: Optional[int] = None,
+        old_status: Optional[ReadingStatus] = None,
+        new_status: Optional[ReadingStatus] = None,
+    ) -> "ActivityEvent":
+        """An event that happens now, by the user with ID `user_id` (UUID or str)."""
+        return cls(action, str(user_id), book_id, old_status, new_status, datetime.now())
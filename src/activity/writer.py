@@ -0,0 +1,117 @@
+"""
+Application-side activity log.
+
+Handlers record events after their transaction has committed; the events
+wait on an in-process queue and a background task writes them in batches,
+one INSERT per ACTIVITY_LOG_BATCH_SIZE events or ACTIVITY_LOG_FLUSH_INTERVAL
+seconds, outside of the user-facing transactions. A failed batch is kept and
+written again; on shutdown the queue is drained, so every recorded event is
+written at least once (a batch cut short by the shutdown may be written twice).
+"""
+import asyncio
+import logging
+from contextlib import suppress
+from typing import List, Optional
+
+from src.activity.batcher import EventBatcher
+from src.activity.events import Action, ActivityEvent
+from src.config import (
+    ACTIVITY_LOG,
+    ACTIVITY_LOG_BATCH_SIZE,
+    ACTIVITY_LOG_FLUSH_INTERVAL,
+    ACTIVITY_LOG_QUEUE_SIZE,
+    ACTIVITY_LOG_SHUTDOWN_TIMEOUT,
+)
+from src.cruds.activity_crud import insert_activity
+from src.database import async_session_maker
+from src.metrics import ACTIVITY_EVENTS, ACTIVITY_FLUSHES
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityLogWriter:
+    """Records activity events and writes them from a background task."""
+
+    def __init__(
+        self,
+        enabled: bool = ACTIVITY_LOG == "app",
+        batch_size: int = ACTIVITY_LOG_BATCH_SIZE,
+        flush_interval: float = ACTIVITY_LOG_FLUSH_INTERVAL,
+        max_queue: int = ACTIVITY_LOG_QUEUE_SIZE,
+        session_maker=async_session_maker,
+    ):
+        """
+        Args:
+            enabled (bool): Whether events are recorded at all; off when the
+                database triggers keep the log (ACTIVITY_LOG=triggers).
+            batch_size (int): Events written by one INSERT at most.
+            flush_interval (float): Seconds an event waits for a full batch.
+            max_queue (int): Events kept waiting before new ones are dropped.
+            session_maker: Factory of async database sessions.
+        """
+        self.enabled = enabled
+        self._batcher = EventBatcher(batch_size, flush_interval, max_queue)
+        self._session_maker = session_maker
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, action: Action, user_id, *args, **kwargs) -> None:
+        """
+        Queue an event, see `ActivityEvent.now` for the arguments.
+
+        Never blocks the request: the event is dropped if the queue is full.
+        """
+        if not self.enabled:
+            return
+        event = ActivityEvent.now(action, user_id, *args, **kwargs)
+        if not self._batcher.put(event):
+            ACTIVITY_EVENTS.labels("dropped").inc()
+            logger.warning("Activity log queue is full, dropping %s", event)
+
+    def start(self) -> None:
+        """Start the background writer (from within the event loop)."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self, timeout: float = ACTIVITY_LOG_SHUTDOWN_TIMEOUT) -> None:
+        """Stop the background writer and write every pending event (up to `timeout` seconds)."""
+        if self._task is not None:
+            # Cancelling may interrupt a write: its batch stays pending below
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        # The whole backlog, including a batch whose write was interrupted
+        events = self._batcher.drain()
+        try:
+            written = await asyncio.wait_for(self._write(events), timeout)
+        except asyncio.TimeoutError:
+            written = False
+        if not written:
+            logger.error("Activity log: %d events could not be written", len(events))
+
+    async def _run(self) -> None:
+        while True:
+            if not await self._write(await self._batcher.next_batch()):
+                # Keep the batch and give the database some time to recover
+                await asyncio.sleep(self._batcher.flush_interval)
+
+    async def _write(self, events: List[ActivityEvent]) -> bool:
+        """Write a batch with one INSERT; on failure it stays pending for the next attempt."""
+        if not events:
+            return True
+        try:
+            async with self._session_maker() as session:
+                await insert_activity(session, events)
+                await session.commit()
+        except Exception:
+            # Connection losses included, the batch is kept either way
+            ACTIVITY_FLUSHES.labels("error").inc()
+            logger.exception("Activity log: writing %d events failed", len(events))
+            return False
+        ACTIVITY_FLUSHES.labels("ok").inc()
+        ACTIVITY_EVENTS.labels("written").inc(len(events))
+        self._batcher.done()
+        return True
+
+
+activity_log = ActivityLogWriter()
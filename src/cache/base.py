@@ -0,0 +1,28 @@
+"""
+Interface of the storage levels behind `TieredCache`.
+
+A backend maps string keys to values. The in-process backend keeps the
+values as they are; shared backends serialize them (see `src.cache.codec`).
+Shared backends must not fail the request when their server is down: they
+report a miss and skip the write instead.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Sequence
+
+
+class CacheBackend(ABC):
+    """One level of a `TieredCache`."""
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Return the live entries among `keys`; absent keys are misses."""
+
+    @abstractmethod
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store several entries, each expiring after `ttl` seconds (None for never)."""
+
+    def clear(self) -> None:
+        """Drop the entries this process owns; shared levels keep theirs."""
+
+    async def aclose(self) -> None:
+        """Release connections held by the backend."""
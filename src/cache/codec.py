@@ -0,0 +1,38 @@
+"""
+Serialization of cached values for shared (out-of-process) backends.
+
+Values are stored as compact JSON. Payloads of at least
+CACHE_COMPRESS_MIN_BYTES are zlib-compressed, which typically shrinks a
+Gutendex book several times over. A one-byte header tells both forms apart.
+"""
+import json
+import zlib
+from typing import Any
+
+from src.config import CACHE_COMPRESS_MIN_BYTES
+
+PLAIN = b"j"
+COMPRESSED = b"z"
+
+
+def encode(value: Any) -> bytes:
+    """Serialize a JSON-compatible value, compressing it if it is large enough."""
+    data = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+    if len(data) < CACHE_COMPRESS_MIN_BYTES:
+        return PLAIN + data
+    return COMPRESSED + zlib.compress(data)
+
+
+def decode(data: bytes) -> Any:
+    """
+    Inverse of `encode`.
+
+    Raises:
+        ValueError: If `data` was not produced by `encode`.
+    """
+    header, body = data[:1], data[1:]
+    if header == COMPRESSED:
+        body = zlib.decompress(body)
+    elif header != PLAIN:
+        raise ValueError("Unknown cache value format")
+    return json.loads(body)
@@ -0,0 +1,31 @@
+"""
+Entries stored by the levels of a `TieredCache`: [fresh_until, value, expires_at].
+
+Both times are epoch seconds, or None for no limit: the entry is fresh until
+the soft TTL and expires with the hard one. Entries written before the hard
+expiry was stored are [fresh_until, value] pairs.
+"""
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+def make_entry(value: Any, soft_ttl: Optional[float], ttl: Optional[float]) -> list:
+    """Entry for a value stored now."""
+    now = time.time()
+    return [now + soft_ttl if soft_ttl else None, value, now + ttl if ttl else None]
+
+
+def is_stale(entry: list, now: float) -> bool:
+    """Whether the entry is past its soft TTL."""
+    return entry[0] is not None and entry[0] <= now
+
+
+def remaining_ttl(entry: list, ttl: Optional[float]) -> Optional[float]:
+    """Seconds until the entry expires; `ttl` if its expiry is unknown."""
+    expires_at = entry[2] if len(entry) > 2 else None
+    return ttl if expires_at is None else expires_at - time.time()
+
+
+def with_values(entries: Dict[str, list], convert: Callable[[Any], Any]) -> Dict[str, list]:
+    """The same entries with `convert` applied to their values."""
+    return {key: [entry[0], convert(entry[1]), *entry[2:]] for key, entry in entries.items()}
@@ -0,0 +1,91 @@
+"""
+Loading on top of `TieredCache`: single-flight misses and stale-while-revalidate.
+
+Concurrent misses of the same key in a process share one load, so an entry
+expiring under load costs one upstream call instead of one per request.
+Entries past their soft TTL are returned at once while one background load
+replaces them; only entries past the hard TTL make callers wait again.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+from src.cache.tiered import TieredCache
+from src.metrics import CACHE_REFRESHES
+
+logger = logging.getLogger(__name__)
+
+# Loads several keys at once, returning the values found keyed like the input
+LoadMany = Callable[[List[str]], Awaitable[Dict[str, Any]]]
+
+
+class LoadingCache(TieredCache):
+    """`TieredCache` that loads missing entries and refreshes stale ones."""
+
+    def __init__(self, *args, **kwargs):
+        """Takes the arguments of `TieredCache`."""
+        super().__init__(*args, **kwargs)
+        # Misses being loaded by `get_or_load`, awaited by concurrent callers
+        self._loading: Dict[str, asyncio.Future] = {}
+        # Background refreshes of stale keys (kept referenced until they finish)
+        self._refreshing: Dict[str, asyncio.Future] = {}
+
+    async def get_or_load(self, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for `key`, calling `load` on a miss.
+
+        A stale value is returned at once and refreshed in the background.
+        Concurrent misses for the same key in this process share a single
+        `load` call. Exceptions raised by `load` are propagated and not cached.
+        """
+        values, stale = await self.lookup([key])
+        if key in values:
+            if stale:
+                self.refresh_many(stale, lambda keys: self._fetch_one(key, load))
+            return values[key]
+        future = self._loading.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._store(self._fetch_one(key, load)))
+            self._loading[key] = future
+            future.add_done_callback(lambda _: self._loading.pop(key, None))
+        return (await asyncio.shield(future))[key]
+
+    def refresh_many(self, keys: Sequence[str], load_many: LoadMany) -> None:
+        """
+        Reload stale keys in the background with one `load_many` call.
+
+        Keys already being loaded are skipped. A failed refresh is logged and
+        the stale values are served until they reach the hard TTL.
+        """
+        keys = [key for key in keys if key not in self._refreshing and key not in self._loading]
+        if not keys:
+            return
+        task = asyncio.ensure_future(self._store(load_many(keys)))
+        self._refreshing.update(dict.fromkeys(keys, task))
+        task.add_done_callback(lambda done: self._refreshed(keys, done))
+
+    @staticmethod
+    async def _fetch_one(key: str, load: Callable[[], Awaitable[Any]]) -> Dict[str, Any]:
+        return {key: await load()}
+
+    async def _store(self, loading: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        values = await loading
+        await self.set_many(values)
+        return values
+
+    def _refreshed(self, keys: List[str], task: asyncio.Future) -> None:
+        """Forget a finished background refresh, logging its failure."""
+        for key in keys:
+            self._refreshing.pop(key, None)
+        if task.cancelled():
+            return
+        failed = task.exception() is not None
+        CACHE_REFRESHES.labels(self.name, "error" if failed else "ok").inc()
+        if failed:
+            logger.warning("Refreshing %s cache failed: %r", self.name, task.exception())
+
+    def clear(self) -> None:
+        """Cancel pending refreshes and drop the in-process entries."""
+        for task in set(self._refreshing.values()):
+            task.cancel()
+        super().clear()
@@ -0,0 +1,78 @@
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from src.cache.base import CacheBackend
+from src.cache.memory import LRUCache
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process cache level backed by an `LRUCache`.
+
+    Values are kept as Python objects, so a hit costs a dict lookup and
+    nothing is serialized.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self._lru = LRUCache(maxsize, ttl)
+
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Return the live entries among `keys`."""
+        found = {}
+        for key in keys:
+            value = self._lru.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store several entries, evicting the least recently used ones if full."""
+        for key, value in items.items():
+            self._lru.set(key, value, ttl)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._lru.clear()
+
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        return len(self._lru)
+
+    @property
+    def evictions(self) -> int:
+        """Entries evicted so far to make room for new ones."""
+        return self._lru.evictions
+
+
+class RecordBackend(MemoryBackend):
+    """
+    In-process cache level keeping values as compact records, bounded in bytes.
+
+    Values are packed with `pack(value)` when stored and rebuilt with the
+    record's `to_dict()` on every hit; the records' `nbytes` count against
+    `maxbytes`. Entries are `TieredCache` entries: only their value is packed.
+    """
+
+    def __init__(self, pack: Callable[[Any], Any], maxbytes: int, ttl: Optional[float] = None):
+        self._pack = pack
+        self._lru = LRUCache(maxbytes, ttl, weigh=lambda entry: entry[1].nbytes)
+
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Return the live entries among `keys`, with their values rebuilt."""
+        found = await super().get_many(keys)
+        return {
+            key: [fresh_until, record.to_dict(), *times]
+            for key, (fresh_until, record, *times) in found.items()
+        }
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Pack and store several entries, evicting the least recently used ones if full."""
+        packed = {
+            key: (fresh_until, self._pack(value), *times)
+            for key, (fresh_until, value, *times) in items.items()
+        }
+        await super().set_many(packed, ttl)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by the stored records."""
+        return self._lru.weight
@@ -0,0 +1,99 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """
+    Bounded in-process LRU cache with an optional time-to-live.
+
+    Unlike `alru_cache`, entries can be looked up and stored explicitly,
+    which lets batch lookups serve the already cached part from memory
+    and fetch only the rest.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        weigh: Optional[Callable[[Any], int]] = None,
+    ):
+        """
+        Args:
+            maxsize (int): Maximum number of entries kept, or their total
+                weight when `weigh` is given.
+            ttl (Optional[float]): Seconds an entry stays valid, None for no expiry.
+            weigh (Optional[Callable[[Any], int]]): Weight of a value, e.g. its
+                size in bytes; every entry weighs 1 by default.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.weight = 0
+        # Entries dropped to make room, see src/cache/stats.py
+        self.evictions = 0
+        self._weigh = weigh or (lambda value: 1)
+        # key -> (monotonic expiry time or None, value, weight), least recently used first
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any, int]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or `default` if it is absent or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value, _ = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.pop(key)
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+
+        `ttl` overrides the cache-wide time-to-live for this entry. A value
+        weighing more than `maxsize` on its own is not stored at all.
+        """
+        # Per-entry TTLs let e.g. cached tokens expire together with the token
+        ttl = ttl or self.ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        self.pop(key)
+        weight = self._weigh(value)
+        if weight > self.maxsize:
+            return
+        self._data[key] = (expires_at, value, weight)
+        self.weight += weight
+        while self.weight > self.maxsize:
+            self.pop(next(iter(self._data)))
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> Any:
+        """Remove an entry, returning its value (or None)."""
+        item = self._data.pop(key, None)
+        if item is None:
+            return None
+        self.weight -= item[2]
+        return item[1]
+
+    def remove_if(self, predicate: Callable[[Any], bool]) -> None:
+        """
+        Drop every entry whose value matches `predicate`.
+
+        This scans the whole cache, so it is meant for rare invalidations.
+        """
+        for key, (_, value, _) in list(self._data.items()):
+            if predicate(value):
+                self.pop(key)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+        self.weight = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a live entry exists for `key`."""
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        """Number of stored entries, expired ones not yet evicted included."""
+        return len(self._data)
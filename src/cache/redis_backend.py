@@ -0,0 +1,89 @@
+"""
+Shared cache level on a Redis-protocol server (Redis, Valkey, KeyDB, ...).
+
+All uvicorn workers (and replicas) read and fill the same entries, so a book
+fetched from Gutendex by one worker is a cache hit for the others. Values
+are stored encoded by `src.cache.codec`. Connection problems and timeouts
+are logged, counted in `cache_backend_errors_total` and served as misses, so
+an unavailable server slows requests down to Gutendex speed but never
+fails them.
+"""
+import logging
+import zlib
+from typing import Any, Dict, Optional, Sequence
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.cache.base import CacheBackend
+from src.cache.codec import decode, encode
+from src.config import CACHE_KEY_PREFIX, CACHE_REDIS_TIMEOUT
+from src.metrics import CACHE_ERRORS
+
+logger = logging.getLogger(__name__)
+
+
+class RedisBackend(CacheBackend):
+    """Cache level stored on a Redis-protocol server."""
+
+    def __init__(self, client: Redis, prefix: str = CACHE_KEY_PREFIX):
+        """
+        Args:
+            client (Redis): Async client; it is closed by `aclose`.
+            prefix (str): Prepended to every key, so that several
+                applications can share one server.
+        """
+        self._client = client
+        self._prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        """Connect to e.g. redis://redis:6379/0 with CACHE_REDIS_TIMEOUT timeouts."""
+        client = Redis.from_url(
+            url,
+            socket_timeout=CACHE_REDIS_TIMEOUT,
+            socket_connect_timeout=CACHE_REDIS_TIMEOUT,
+        )
+        return cls(client)
+
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Return the entries among `keys` found on the server (one MGET)."""
+        if not keys:
+            return {}
+        try:
+            values = await self._client.mget([self._prefix + key for key in keys])
+        except (RedisError, OSError) as exc:
+            self._failed("get", exc)
+            return {}
+        found = {}
+        for key, value in zip(keys, values):
+            if value is None:
+                continue
+            try:
+                found[key] = decode(value)
+            except (ValueError, zlib.error) as exc:
+                # Written by an incompatible version; it gets overwritten on refill
+                self._failed("decode", exc)
+        return found
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store several entries in one round trip."""
+        if not items:
+            return
+        expiry = max(int(ttl * 1000), 1) if ttl else None
+        pipeline = self._client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipeline.set(self._prefix + key, encode(value), px=expiry)
+        try:
+            await pipeline.execute()
+        except (RedisError, OSError) as exc:
+            self._failed("set", exc)
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
+
+    @staticmethod
+    def _failed(operation: str, exc: Exception) -> None:
+        CACHE_ERRORS.labels(operation).inc()
+        logger.warning("Shared cache %s failed (%s), treating it as a miss", operation, exc)
@@ -0,0 +1,38 @@
+"""
+Shared cache level whose values are rebuilt on every hit.
+
+Shared backends hand back values decoded from JSON, i.e. plain dicts and
+lists, whatever type was stored. Wrapping the level in `RestoringBackend`
+turns them back into that type (e.g. `BookPayload`), so a value read from
+L2 is the same kind of object as one read from L1 or freshly loaded.
+"""
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from src.cache.base import CacheBackend
+from src.cache.entries import with_values
+
+
+class RestoringBackend(CacheBackend):
+    """View of another backend applying `restore` to the values it returns."""
+
+    def __init__(self, backend: CacheBackend, restore: Callable[[Any], Any]):
+        """
+        Args:
+            backend (CacheBackend): Shared level; it stays owned (and is
+                closed) by whoever created it.
+            restore (Callable): Rebuilds a value from its decoded form.
+        """
+        self._backend = backend
+        self._restore = restore
+
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Return the live entries among `keys`, with their values restored."""
+        return with_values(await self._backend.get_many(keys), self._restore)
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store several entries in the wrapped backend."""
+        await self._backend.set_many(items, ttl)
+
+    def clear(self) -> None:
+        """Drop the entries this process owns in the wrapped backend."""
+        self._backend.clear()
@@ -0,0 +1,49 @@
+"""
+Size and evictions of the in-process caches, read when /metrics is scraped.
+
+Caches are registered by name with `track_cache`. Only weak references are
+kept, so a cache that is dropped (e.g. a client built by a test) leaves the
+metrics with it. A tracked cache provides `len()` and an `evictions` count,
+and `nbytes` if it is bounded in bytes.
+"""
+import weakref
+from typing import Any, Iterator
+
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+_caches: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+
+
+def track_cache(name: str, cache: Any) -> None:
+    """Report the size of `cache` under `name`, replacing a cache tracked before."""
+    _caches[name] = cache
+
+
+class CacheStatsCollector(Collector):
+    """Reads the tracked caches at every scrape instead of updating gauges on writes."""
+
+    def collect(self) -> Iterator[Metric]:
+        entries = GaugeMetricFamily(
+            "cache_entries", "Entries held by an in-process cache", labels=["cache"]
+        )
+        size = GaugeMetricFamily(
+            "cache_size_bytes",
+            "Estimated memory held by an in-process cache bounded in bytes",
+            labels=["cache"],
+        )
+        evictions = CounterMetricFamily(
+            "cache_evictions",
+            "Entries an in-process cache dropped to make room for new ones",
+            labels=["cache"],
+        )
+        for name, cache in sorted(_caches.items()):
+            entries.add_metric([name], len(cache))
+            evictions.add_metric([name], cache.evictions)
+            if hasattr(cache, "nbytes"):
+                size.add_metric([name], cache.nbytes)
+        yield from (entries, size, evictions)
+
+
+REGISTRY.register(CacheStatsCollector())
@@ -0,0 +1,113 @@
+"""
+Two-level cache: a per-process L1 in front of an optional shared L2.
+
+Lookups try L1 first, then L2 for the keys L1 missed; L2 hits are copied
+into L1, for what is left of their hard TTL, so that the next lookup stays
+in process. Writes go to both levels.
+Hits and misses are counted per cache and level in `cache_lookups_total`;
+the size of L1 is reported under the cache's name, see `src.cache.stats`.
+
+Entries have two lifetimes: they are fresh until the soft TTL and kept by
+the levels until the hard TTL. Stale entries (between the two) are still
+returned, flagged so that the caller can refresh them, see `LoadingCache`.
+"""
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.cache.base import CacheBackend
+from src.cache.entries import is_stale, make_entry, remaining_ttl
+from src.cache.stats import track_cache
+from src.metrics import CACHE_LOOKUPS
+
+
+class TieredCache:
+    """Cache with an in-process level (L1) and an optional shared one (L2)."""
+
+    def __init__(
+        self,
+        name: str,
+        l1: CacheBackend,
+        l2: Optional[CacheBackend] = None,
+        ttl: Optional[float] = None,
+        soft_ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            name (str): Label of the cache in the metrics, e.g. "books".
+            l1 (CacheBackend): In-process level, owned by this cache.
+            l2 (Optional[CacheBackend]): Shared level; it may be shared with
+                other caches and is closed by whoever created it.
+            ttl (Optional[float]): Hard TTL, seconds entries are kept at all
+                (None for no expiry).
+            soft_ttl (Optional[float]): Seconds entries count as fresh; None
+                (or not below `ttl`) means entries never go stale.
+        """
+        self.name = name
+        self.ttl = ttl
+        self.soft_ttl = soft_ttl if soft_ttl and (not ttl or soft_ttl < ttl) else None
+        track_cache(name, l1)
+        self._levels = [("l1", l1)] + ([("l2", l2)] if l2 is not None else [])
+
+    async def lookup(
+        self, keys: Sequence[str], promote: bool = True
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Return the cached values among `keys` and which of them are stale.
+
+        Levels are looked up in turn, each for the keys the previous one
+        missed; L2 hits are copied into L1 unless `promote` is False.
+        """
+        # Levels store entries, see `src.cache.entries`
+        entries: Dict[str, list] = {}
+        missing = list(dict.fromkeys(keys))
+        for depth, (level, backend) in enumerate(self._levels):
+            if not missing:
+                break
+            hits = await backend.get_many(missing)
+            self._count(level, len(hits), len(missing) - len(hits))
+            if hits and depth and promote:
+                # Promote shared hits so the next lookup stays in process
+                await self._promote(hits)
+            entries.update(hits)
+            missing = [key for key in missing if key not in hits]
+        now = time.time()
+        stale = [key for key, entry in entries.items() if is_stale(entry, now)]
+        return {key: entry[1] for key, entry in entries.items()}, stale
+
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Return the cached values among `keys`, stale ones included."""
+        return (await self.lookup(keys))[0]
+
+    async def get(self, key: str) -> Any:
+        """Return the cached value for `key`, or None."""
+        return (await self.get_many([key])).get(key)
+
+    async def set_many(self, items: Dict[str, Any]) -> None:
+        """Store several fresh entries in every level."""
+        entries = {
+            key: make_entry(value, self.soft_ttl, self.ttl) for key, value in items.items()
+        }
+        for _, backend in self._levels:
+            await backend.set_many(entries, self.ttl)
+
+    def clear(self) -> None:
+        """Drop the in-process entries; the shared level is left to other workers."""
+        for _, backend in self._levels:
+            backend.clear()
+
+    async def _promote(self, hits: Dict[str, list]) -> None:
+        """
+        Copy shared hits into L1 until they expire from L2, not a full TTL
+        later. Hits already expired for L2 (clocks differ between hosts) are
+        served this once but not kept.
+        """
+        for key, entry in hits.items():
+            ttl = remaining_ttl(entry, self.ttl)
+            if ttl is None or ttl > 0:
+                await self._levels[0][1].set_many({key: entry}, ttl)
+
+    def _count(self, level: str, hits: int, misses: int) -> None:
+        if hits:
+            CACHE_LOOKUPS.labels(self.name, level, "hit").inc(hits)
+        if misses:
+            CACHE_LOOKUPS.labels(self.name, level, "miss").inc(misses)
@@ -0,0 +1,68 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from fastapi import Depends
+
+from src.clients.gutendex_client import GutendexClient, get_gutendex_client
+
+
+class BookLoader:
+    """
+    Request-scoped, dataloader-style batch loader for book metadata.
+
+    Every `load` issued during the same event loop iteration is collected
+    and resolved with a single `GutendexClient.get_books` call, so a page
+    of N rows costs one upstream round trip instead of N. Results are
+    memoized for the lifetime of the loader (i.e. of the request).
+    """
+
+    def __init__(self, client: GutendexClient):
+        self._client = client
+        self._results: Dict[int, asyncio.Future] = {}
+        self._queue: List[int] = []
+        self._dispatches: Set[asyncio.Task] = set()
+
+    def load(self, book_id: int) -> "asyncio.Future[Optional[Dict[str, Any]]]":
+        """
+        Schedule a book for loading.
+
+        Returns a future resolving to the Gutendex payload,
+        or None if the book does not exist.
+        """
+        future = self._results.get(book_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._results[book_id] = future
+            if not self._queue:
+                # The task only starts once the caller yields to the event
+                # loop, by then all loads of this iteration are queued.
+                task = loop.create_task(self._dispatch())
+                self._dispatches.add(task)
+                task.add_done_callback(self._dispatches.discard)
+            self._queue.append(book_id)
+        return future
+
+    async def load_many(self, book_ids: Iterable[int]) -> List[Optional[Dict[str, Any]]]:
+        """Load several books, returning them in the order of `book_ids`."""
+        return list(await asyncio.gather(*(self.load(book_id) for book_id in book_ids)))
+
+    async def _dispatch(self) -> None:
+        batch, self._queue = self._queue, []
+        try:
+            books = await self._client.get_books(batch)
+        except Exception as exc:
+            for book_id in batch:
+                self._results.pop(book_id).set_exception(exc)
+            return
+        for book_id in batch:
+            self._results[book_id].set_result(books.get(book_id))
+
+
+async def get_book_loader(
+    client: GutendexClient = Depends(get_gutendex_client),
+) -> BookLoader:
+    """
+    FastAPI dependency provider that creates a BookLoader for the current request.
+    """
+    return BookLoader(client)
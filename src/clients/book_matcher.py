@@ -0,0 +1,96 @@
+"""
+Matching of books known by title and author (e.g. from a Goodreads export)
+to Gutendex IDs.
+"""
+import asyncio
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.cache.memory import LRUCache
+from src.cache.stats import track_cache
+from src.clients.gutendex_client import GutendexClient
+from src.config import GUTENDEX_BATCH_CONCURRENCY, GUTENDEX_CACHE_TTL, IMPORT_MATCH_CACHE_SIZE
+
+# Normalized title without subtitle, and normalized author surname
+MatchKey = Tuple[str, str]
+
+_WORDS = re.compile(r"\w+")
+_SUBTITLE = re.compile(r"[:;(]")
+# Shared by all imports of the process: a popular book is searched for once
+_matches = LRUCache(IMPORT_MATCH_CACHE_SIZE, ttl=GUTENDEX_CACHE_TTL or None)
+track_cache("import_matches", _matches)
+_MISSING = object()
+
+
+def _words(value: str) -> List[str]:
+    return _WORDS.findall(value.casefold())
+
+
+def match_key(title: str, author: str) -> MatchKey:
+    """
+    Key on which books are matched: "Frankenstein: or, The Modern Prometheus"
+    by "Mary Shelley" and Gutendex's "Frankenstein; Or, The Modern Prometheus"
+    by "Shelley, Mary Wollstonecraft" both give ("frankenstein", "shelley").
+    """
+    surname = _words(author)[-1:]
+    return " ".join(_words(_SUBTITLE.split(title, maxsplit=1)[0])), "".join(surname)
+
+
+def _is_match(key: MatchKey, book: Dict[str, Any]) -> bool:
+    title, surname = key
+    if match_key(book["title"], "")[0] != title:
+        return False
+    return not surname or any(surname in _words(author["name"]) for author in book["authors"])
+
+
+class BookMatcher:
+    """
+    Resolves (title, author) pairs to Gutendex book IDs.
+
+    Every distinct pair that is not cached costs one search (the first
+    result page, bypassing the listing cache); at most
+    GUTENDEX_BATCH_CONCURRENCY searches run at a time. The most downloaded
+    book with the same title and author wins.
+    """
+
+    def __init__(
+        self,
+        client: GutendexClient,
+        concurrency: int = GUTENDEX_BATCH_CONCURRENCY,
+        cache: LRUCache = _matches,
+    ):
+        self._client = client
+        self._concurrency = concurrency
+        self._cache = cache
+
+    async def match(self, keys: Iterable[MatchKey]) -> Dict[MatchKey, Optional[int]]:
+        """
+        Match several books at once.
+
+        Args:
+            keys (Iterable[MatchKey]): Keys built with `match_key`, duplicates
+                are allowed.
+
+        Returns:
+            dict: Book ID of every key, None for books without a match.
+
+        Raises:
+            HTTPStatusError: If a search fails.
+            GutendexUnavailable: If the circuit breaker refuses a search.
+        """
+        matches = {}
+        for key in set(keys):
+            matches[key] = self._cache.get(key, _MISSING) if key[0] else None
+        missing = [key for key, book_id in matches.items() if book_id is _MISSING]
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def search(key: MatchKey) -> Optional[int]:
+            async with semaphore:
+                page = await self._client.find_books(" ".join(key))
+            # Gutendex ranks the most downloaded books first
+            return next((book["id"] for book in page["results"] if _is_match(key, book)), None)
+
+        for key, book_id in zip(missing, await asyncio.gather(*map(search, missing))):
+            self._cache.set(key, book_id)
+            matches[key] = book_id
+        return matches
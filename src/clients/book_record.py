@@ -0,0 +1,121 @@
+"""
+Compact in-process form of cached Gutendex books.
+
+A book payload parsed from JSON is a tree of dicts, lists and strings that
+costs several kilobytes of Python objects. `BookRecord` keeps the same data
+in a slotted object instead: strings repeated across books (languages,
+subjects, bookshelves, people, media types) are interned and shared, lists
+become tuples, people become (name, birth_year, death_year) tuples, and the
+bulky per-book `formats` and `summaries` are kept as one blob encoded by the
+cache codec, compressed once it is large enough.
+"""
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.cache import codec
+from src.models.schemas import Book
+
+Person = Tuple[str, Optional[int], Optional[int]]
+
+
+class BookPayload(dict):
+    """Book payload validated as `Book`, see `validated`."""
+
+    __slots__ = ()
+
+
+def validated(payload: Dict[str, Any]) -> BookPayload:
+    """
+    The `Book` fields of a Gutendex payload, validated and ready for JSON.
+
+    Raises:
+        ValidationError: If the payload is not a valid `Book`.
+    """
+    if isinstance(payload, BookPayload):
+        return payload
+    return BookPayload(Book.model_validate(payload).model_dump(mode="json"))
+
+
+class BookRecord:
+    """
+    A validated `Book`, packed for the in-process metadata cache.
+
+    `nbytes` estimates the memory the record holds on its own; interned
+    strings are shared with other records and not counted.
+    """
+
+    __slots__ = (
+        "id", "title", "subjects", "authors", "translators", "bookshelves",
+        "languages", "copyright", "media_type", "download_count", "details", "nbytes",
+    )
+
+    def __init__(self, payload: Dict[str, Any]):
+        """
+        Args:
+            payload (dict): Book as returned by Gutendex; fields that are not
+                part of `Book` are dropped.
+
+        Raises:
+            ValidationError: If the payload is not a valid `Book`.
+        """
+        book = validated(payload)
+        self.id = book["id"]
+        self.title = book["title"]
+        self.subjects = _interned(book["subjects"])
+        self.authors = _people(book["authors"])
+        self.translators = _people(book["translators"])
+        self.bookshelves = _interned(book["bookshelves"])
+        self.languages = _interned(book["languages"])
+        self.copyright = book["copyright"]
+        self.media_type = sys.intern(book["media_type"])
+        self.download_count = book["download_count"]
+        # Read only to build a payload: kept serialized, and compressed if large
+        self.details = codec.encode({"formats": book["formats"], "summaries": book["summaries"]})
+        self.nbytes = self._size()
+
+    def to_dict(self) -> BookPayload:
+        """Rebuild the payload; every call returns new objects the caller may modify."""
+        details = codec.decode(self.details)
+        return BookPayload(
+            id=self.id,
+            title=self.title,
+            subjects=list(self.subjects),
+            authors=_person_dicts(self.authors),
+            summaries=details["summaries"],
+            translators=_person_dicts(self.translators),
+            bookshelves=list(self.bookshelves),
+            languages=list(self.languages),
+            copyright=self.copyright,
+            media_type=self.media_type,
+            formats=details["formats"],
+            download_count=self.download_count,
+        )
+
+    def _size(self) -> int:
+        tuples = (self.subjects, self.authors, self.translators, self.bookshelves, self.languages)
+        people = self.authors + self.translators
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.title)
+            + sys.getsizeof(self.details)
+            + sum(sys.getsizeof(value) for value in tuples)
+            + sum(sys.getsizeof(person) for person in people)
+        )
+
+
+def _interned(values: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+
+def _people(people: Iterable[Dict[str, Any]]) -> Tuple[Person, ...]:
+    return tuple(
+        (sys.intern(person["name"]), person["birth_year"], person["death_year"])
+        for person in people
+    )
+
+
+def _person_dicts(people: Tuple[Person, ...]) -> List[Dict[str, Any]]:
+    return [
+        {"name": name, "birth_year": birth_year, "death_year": death_year}
+        for name, birth_year, death_year in people
+    ]
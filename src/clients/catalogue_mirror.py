@@ -0,0 +1,110 @@
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.config import CATALOGUE_MIRROR
+from src.clients.book_record import validated
+from src.clients.gutendex_errors import is_upstream_failure
+from src.cruds import catalogue_crud
+from src.database import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PREFER = "prefer"
+FALLBACK = "fallback"
+
+
+class CatalogueMirror:
+    """
+    Read access to the local copy of the Gutendex catalogue.
+
+    Depending on `mode` the mirror is either consulted before Gutendex
+    ("prefer": the hot path is a local indexed query) or only when Gutendex
+    is unreachable ("fallback": we keep serving while the upstream is down).
+    """
+
+    def __init__(self, mode: str = CATALOGUE_MIRROR, session_maker=async_session_maker):
+        """
+        Args:
+            mode (str): "prefer" or "fallback", see the class docstring.
+            session_maker: Factory of async database sessions.
+        """
+        self.mode = mode
+        self._session_maker = session_maker
+
+    async def get_books(self, book_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Mirrored books keyed by ID, validated as `Book` like Gutendex books;
+        missing IDs (or a broken mirror) yield nothing.
+        """
+        try:
+            async with self._session_maker() as session:
+                books = await catalogue_crud.get_books(session, book_ids)
+        except SQLAlchemyError:
+            logger.exception("Catalogue mirror lookup failed")
+            return {}
+        return {book_id: validated(book) for book_id, book in books.items()}
+
+    async def get_book_page(self, book_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Mirrored books as a list, like the results of a `/books/?ids=` page."""
+        return list((await self.get_books(book_ids)).values())
+
+    async def get_book(self, book_id: int) -> Optional[Dict[str, Any]]:
+        """A single mirrored book, or None."""
+        return (await self.get_books([book_id])).get(book_id)
+
+    async def list_books(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """A Gutendex-shaped listing page, or None if the mirror has no matches."""
+        try:
+            async with self._session_maker() as session:
+                page = await catalogue_crud.list_books(session, params)
+        except SQLAlchemyError:
+            logger.exception("Catalogue mirror listing failed")
+            return None
+        return page if page["count"] else None
+
+    async def fetch(
+        self,
+        from_mirror: Callable[[], Awaitable[Optional[T]]],
+        from_upstream: Callable[[], Awaitable[T]],
+        complete: Callable[[T], bool] = lambda result: result is not None,
+    ) -> T:
+        """
+        Combine a mirror read and an upstream call according to `mode`.
+
+        Args:
+            from_mirror: Reads the data from the mirror.
+            from_upstream: Requests the data from Gutendex.
+            complete: Tells whether a mirror result can be served as is.
+                A result that is not complete is replaced by the upstream one
+                in "prefer" mode; in "fallback" mode any non-empty mirror
+                result is better than an error.
+
+        Returns:
+            The mirror or the upstream result.
+        """
+        if self.mode == PREFER:
+            local = await from_mirror()
+            if local is not None and complete(local):
+                return local
+            return await from_upstream()
+        try:
+            return await from_upstream()
+        except Exception as exc:
+            if not is_upstream_failure(exc):
+                raise
+            local = await from_mirror()
+            if not local:
+                raise
+            logger.warning("Gutendex unavailable (%s), serving from the mirror", exc)
+            return local
+
+
+class NoMirror:
+    """Stand-in used when no mirror is configured: every read goes upstream."""
+
+    async def fetch(self, from_mirror, from_upstream, **kwargs):
+        return await from_upstream()
@@ -0,0 +1,105 @@
+"""
+Circuit breaker for the Gutendex upstream.
+
+After GUTENDEX_BREAKER_FAILURES consecutive failures (connection errors,
+timeouts, 5xx answers) the breaker opens: calls fail at once with
+`GutendexUnavailable` instead of each waiting for the HTTP timeout. After
+GUTENDEX_BREAKER_RESET seconds it lets a single probe call through
+(half-open); its success closes the breaker again, its failure re-opens it.
+Outcomes of calls that started before the breaker opened are ignored, so
+that late answers neither trip it again nor close it without a probe.
+"""
+import time
+
+from src.clients.gutendex_errors import GutendexUnavailable
+from src.config import GUTENDEX_BREAKER_FAILURES, GUTENDEX_BREAKER_RESET
+from src.metrics import GUTENDEX_BREAKER_STATE, GUTENDEX_BREAKER_TRIPS
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+# Values of the gutendex_breaker_state gauge
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with half-open probing.
+
+    Every call must be announced with `before_call` and then settled with
+    exactly one of `record_success`, `record_failure` or `release`, passing
+    back whether it is the probe as `before_call` returned it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = GUTENDEX_BREAKER_FAILURES,
+        reset_timeout: float = GUTENDEX_BREAKER_RESET,
+    ):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker.
+            reset_timeout (float): Seconds the breaker stays open before a probe.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.state = CLOSED
+        self._opened_at = 0.0
+        # Whether the single half-open probe is in flight
+        self._probing = False
+        GUTENDEX_BREAKER_STATE.set(STATE_VALUES[CLOSED])
+
+    def before_call(self) -> bool:
+        """
+        Let a call through, or refuse it while the upstream is considered down.
+
+        Returns:
+            bool: Whether the call is the half-open probe.
+
+        Raises:
+            GutendexUnavailable: If the breaker is open, or half-open with
+                the probe already in flight.
+        """
+        if self.state == OPEN:
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                raise GutendexUnavailable(remaining)
+            self._set_state(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self._probing:
+                raise GutendexUnavailable(1)
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self, probe: bool = False) -> None:
+        """The upstream answered: reset the failure count, or close the breaker on a probe."""
+        if probe:
+            self._probing = False
+            self._set_state(CLOSED)
+        if self.state == CLOSED:
+            self.failures = 0
+
+    def record_failure(self, probe: bool = False) -> None:
+        """The upstream failed: open the breaker once too many calls in a row did."""
+        if probe:
+            self._probing = False
+            self._open()
+        elif self.state == CLOSED:
+            # Late failures while open or half-open do not count
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self._open()
+
+    def release(self, probe: bool = False) -> None:
+        """The call ended without telling anything about the upstream (e.g. cancelled)."""
+        if probe:
+            self._probing = False
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._set_state(OPEN)
+        GUTENDEX_BREAKER_TRIPS.inc()
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        GUTENDEX_BREAKER_STATE.set(STATE_VALUES[state])
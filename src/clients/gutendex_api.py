@@ -0,0 +1,117 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Set
+
+import httpx
+
+from src.config import GUTENDEX_BASE_URL, GUTENDEX_SHUTDOWN_TIMEOUT
+from src.clients.book_record import validated
+from src.clients.circuit_breaker import CircuitBreaker
+from src.clients.gutendex_http import build_http_client
+from src.metrics import GUTENDEX_REQUEST_SECONDS
+
+
+class GutendexAPI:
+    """
+    Thin, uncached wrapper around the Gutendex HTTP endpoints.
+
+    Caching and the choice between Gutendex and the local catalogue mirror
+    are done one level up, in `GutendexClient`. Books requested by ID are
+    validated as `Book`, like the cached ones they become. Every call goes through a
+    circuit breaker, so an unreachable upstream fails requests fast.
+    """
+
+    BASE_URL = GUTENDEX_BASE_URL
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        breaker: CircuitBreaker | None = None,
+    ):
+        """
+        Args:
+            client (httpx.AsyncClient | None): HTTP client to use. If omitted,
+                a pooled client is built and closed again by `aclose`.
+            breaker (CircuitBreaker | None): Breaker guarding the calls,
+                one with the configured thresholds if omitted.
+        """
+        self._owns_client = client is None
+        self._client = client or build_http_client(self.BASE_URL)
+        self.breaker = breaker or CircuitBreaker()
+        self._pending: Set[asyncio.Future] = set()
+
+    async def _get(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Perform a GET request against Gutendex, keeping track of it
+        so that `aclose` can wait for it to finish. Its latency is observed
+        in `gutendex_request_seconds` under `method`, the calling method.
+
+        Raises:
+            GutendexUnavailable: If the circuit breaker refuses the call.
+        """
+        probe = self.breaker.before_call()
+        future = asyncio.ensure_future(self._client.get(url, **kwargs))
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        started = time.perf_counter()
+        try:
+            response = await future
+        except httpx.TransportError:
+            # Connection errors and timeouts
+            self.breaker.record_failure(probe)
+            GUTENDEX_REQUEST_SECONDS.labels(method, "error").observe(time.perf_counter() - started)
+            raise
+        except BaseException:
+            self.breaker.release(probe)
+            raise
+        elapsed = time.perf_counter() - started
+        GUTENDEX_REQUEST_SECONDS.labels(method, str(response.status_code)).observe(elapsed)
+        if response.status_code >= 500:
+            self.breaker.record_failure(probe)
+        else:
+            self.breaker.record_success(probe)
+        return response
+
+    async def fetch_book(self, book_id: int) -> Dict[str, Any]:
+        """
+        Request a single book.
+
+        Raises:
+            HTTPStatusError: On non-200 responses (including 404).
+        """
+        # Include trailing slash to avoid redirect
+        response = await self._get("fetch_book", f"/books/{book_id}/")
+        if response.status_code == 404:
+            raise httpx.HTTPStatusError(
+                message="Book not found",
+                request=response.request,
+                response=response,
+            )
+        response.raise_for_status()
+        return validated(response.json())
+
+    async def fetch_books(self, book_ids: List[int]) -> List[Dict[str, Any]]:
+        """Request up to one listing page of books by ID in a single call."""
+        ids = ",".join(str(book_id) for book_id in book_ids)
+        page = await self._fetch_page("fetch_books", {"ids": ids})
+        return [validated(book) for book in page["results"]]
+
+    async def fetch_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Request one page of the `/books/` listing with the given filters."""
+        return await self._fetch_page("fetch_list", params)
+
+    async def _fetch_page(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Use trailing slash to avoid redirect
+        response = await self._get(method, "/books/", params=params)
+        response.raise_for_status()
+        return response.json()
+
+    async def aclose(self, timeout: float = GUTENDEX_SHUTDOWN_TIMEOUT) -> None:
+        """
+        Wait for in-flight calls (up to `timeout` seconds), then close
+        the connection pool if we own it.
+        """
+        if self._pending:
+            await asyncio.wait(set(self._pending), timeout=timeout)
+        if self._owns_client:
+            await self._client.aclose()
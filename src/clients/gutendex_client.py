@@ -1,94 +1,183 @@
-from typing import Optional, Dict, Any, AsyncGenerator
+import asyncio
+from typing import Dict, Any, Iterable, List
 import httpx
-from async_lru import alru_cache
+from fastapi import Request
 
+from src.config import (
+    GUTENDEX_BASE_URL,
+    GUTENDEX_SHUTDOWN_TIMEOUT,
+    GUTENDEX_BOOK_CACHE_BYTES,
+    GUTENDEX_LIST_CACHE_SIZE,
+    GUTENDEX_CACHE_TTL,
+    GUTENDEX_CACHE_SOFT_TTL,
+    GUTENDEX_BATCH_CONCURRENCY,
+)
+from src.cache.base import CacheBackend
+from src.cache.local import MemoryBackend, RecordBackend
+from src.cache.loading import LoadingCache
+from src.cache.restoring import RestoringBackend
+from src.clients.book_record import BookRecord, validated
+from src.clients.gutendex_api import GutendexAPI
+from src.clients.catalogue_mirror import CatalogueMirror, NoMirror
+from src.clients.gutendex_listing import BookListing
+from src.clients.not_found_cache import NotFoundCache
 
-class GutendexClient:
+
+class GutendexClient(BookListing):
     """
     A reusable async client for interacting with the
-    Gutendex API (https://gutendex.com), using an async LRU cache
-    for `get_book` and `list_books` calls.
+    Gutendex API (https://gutendex.com), caching the results of
+    `get_book`, `get_books` and `list_books` calls.
+
+    A single instance is created per process (see `lifespan` in main.py),
+    so the caches are shared by all requests handled by the worker. With a
+    shared cache backend they are also shared between workers. Unknown book
+    IDs are remembered for GUTENDEX_NOT_FOUND_TTL seconds, so probing them
+    does not reach Gutendex every time.
     """
 
-    BASE_URL = "https://gutendex.com"
+    BASE_URL = GUTENDEX_BASE_URL
+    # Gutendex returns at most this many books per listing page
+    PAGE_SIZE = 32
 
-    def __init__(self, client: httpx.AsyncClient | None = None):
-        # Ensure the HTTP client follows redirects from Gutendex endpoints
-        self._client = client or httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            follow_redirects=True,
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        mirror: CatalogueMirror | None = None,
+        shared_cache: CacheBackend | None = None,
+    ):
+        """
+        Args:
+            client (httpx.AsyncClient | None): HTTP client to use. If omitted,
+                a pooled client is built and closed again by `aclose`.
+            mirror (CatalogueMirror | None): Local catalogue copy consulted
+                before Gutendex or when it is down, depending on its mode.
+            shared_cache (CacheBackend | None): Second cache level shared with
+                other workers (e.g. `RedisBackend`), consulted on in-process misses.
+        """
+        self._mirror = mirror or NoMirror()
+        self._api = GutendexAPI(client)
+        ttl, soft_ttl = GUTENDEX_CACHE_TTL or None, GUTENDEX_CACHE_SOFT_TTL or None
+        # Books are kept as compact records, within GUTENDEX_BOOK_CACHE_BYTES;
+        # shared hits are restored as `BookPayload`s, like L1 hits and fetched books
+        books = RecordBackend(BookRecord, GUTENDEX_BOOK_CACHE_BYTES, ttl)
+        shared_books = (
+            RestoringBackend(shared_cache, validated) if shared_cache is not None else None
+        )
+        self._books = LoadingCache("books", books, shared_books, ttl, soft_ttl)
+        self._lists = LoadingCache(
+            "lists", MemoryBackend(GUTENDEX_LIST_CACHE_SIZE, ttl), shared_cache, ttl, soft_ttl
         )
+        self._not_found = NotFoundCache(shared_cache)
 
-    @alru_cache(maxsize=128)
     async def get_book(self, book_id: int) -> Dict[str, Any]:
         """
         Fetches a single book by ID from Gutendex.
-        Uses an async LRU cache to avoid repeated requests for the same book.
-        Raises HTTPStatusError on non-200 (including 404).
+        Uses the tiered cache to avoid repeated requests for the same book;
+        concurrent lookups of the same ID share one upstream call, and a
+        book past its soft TTL is returned at once and refreshed behind it.
+
+        Args:
+            book_id (int): Gutendex ID of the book.
+
+        Returns:
+            dict: The `Book` fields of the payload returned by Gutendex.
+
+        Raises:
+            HTTPStatusError: On non-200 responses (including 404, also
+                when served from the negative cache).
+            GutendexUnavailable: If the circuit breaker refuses the call.
         """
-        # Include trailing slash to avoid redirect
-        response = await self._client.get(f"/books/{book_id}/")
-        if response.status_code == 404:
-            raise httpx.HTTPStatusError(
-                message="Book not found",
-                request=response.request,
-                response=response,
+        return await self._not_found.guard(book_id, lambda: self._books.get_or_load(
+            _book_key(book_id), lambda: self._mirror.fetch(
+                lambda: self._mirror.get_book(book_id),
+                lambda: self._api.fetch_book(book_id),
             )
-        response.raise_for_status()
-        return response.json()
+        ))
 
-    @alru_cache(maxsize=64)
-    async def list_books(
-        self,
-        page: int = 1,
-        author_year_start: Optional[int] = None,
-        author_year_end: Optional[int] = None,
-        copyright: Optional[str] = None,
-        ids: Optional[str] = None,
-        languages: Optional[str] = None,
-        mime_type: Optional[str] = None,
-        search: Optional[str] = None,
-        topic: Optional[str] = None,
-        sort: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    async def get_books(
+        self, book_ids: Iterable[int], populate: bool = True
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetches several books at once, keyed by ID.
+
+        Cached books are served from the cache (stale ones are refreshed in
+        one background batch); the rest is requested with `/books/?ids=...`,
+        one call per PAGE_SIZE IDs, and at most GUTENDEX_BATCH_CONCURRENCY
+        of those calls run concurrently.
+
+        Args:
+            book_ids (Iterable[int]): IDs to fetch, duplicates are allowed.
+            populate (bool): Whether fetched books (and shared hits) are added
+                to the cache; bulk reads pass False so that they do not evict
+                the books other requests rely on.
+
+        Returns:
+            dict: Book payloads keyed by ID. IDs unknown to Gutendex
+            are simply absent from the result.
+
+        Raises:
+            HTTPStatusError: If one of the listing calls fails.
+            GutendexUnavailable: If the circuit breaker refuses a call.
         """
-        Fetches a paginated list of books from Gutendex with optional filters.
-        Uses an async LRU cache keyed on all method arguments.
-        Returns the parsed JSON payload as a dict.
+        book_ids = list(dict.fromkeys(book_ids))
+        keys = [_book_key(book_id) for book_id in book_ids]
+        cached, stale = await self._books.lookup(keys, promote=populate)
+        if stale:
+            self._books.refresh_many(stale, self._reload_books)
+        found = {book["id"]: book for book in cached.values()}
+        missing = [book_id for book_id in book_ids if book_id not in found]
+        # IDs Gutendex recently answered with 404 are left out without a call
+        unknown = await self._not_found.missing(missing)
+        missing = [book_id for book_id in missing if book_id not in unknown]
+        fetched = await self._fetch_books(missing)
+        if populate:
+            await self._books.set_many(
+                {_book_key(book_id): book for book_id, book in fetched.items()}
+            )
+        return {**found, **fetched}
+
+    async def _fetch_books(self, book_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Uncached part of `get_books`: fetch books page by page, keyed by ID."""
+        chunks = [
+            book_ids[start:start + self.PAGE_SIZE]
+            for start in range(0, len(book_ids), self.PAGE_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(GUTENDEX_BATCH_CONCURRENCY)
+
+        async def fetch(chunk: List[int]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._mirror.fetch(
+                    lambda: self._mirror.get_book_page(chunk),
+                    lambda: self._api.fetch_books(chunk),
+                    complete=lambda books: len(books) == len(chunk),
+                )
+
+        pages = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return {book["id"]: book for books in pages for book in books}
+
+    async def _reload_books(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        books = await self._fetch_books([int(key.split(":")[1]) for key in keys])
+        return {_book_key(book_id): book for book_id, book in books.items()}
+
+    async def aclose(self, timeout: float = GUTENDEX_SHUTDOWN_TIMEOUT) -> None:
+        """
+        Drain in-flight upstream calls (up to `timeout` seconds), drop the
+        cached metadata and close the connection pool if we own it.
         """
-        params: Dict[str, Any] = {"page": page}
-        if author_year_start is not None:
-            params["author_year_start"] = author_year_start
-        if author_year_end is not None:
-            params["author_year_end"] = author_year_end
-        if copyright is not None:
-            params["copyright"] = copyright
-        if ids is not None:
-            params["ids"] = ids
-        if languages is not None:
-            params["languages"] = languages
-        if mime_type is not None:
-            params["mime_type"] = mime_type
-        if search is not None:
-            params["search"] = search
-        if topic is not None:
-            params["topic"] = topic
-        if sort is not None:
-            params["sort"] = sort
-
-        # Use trailing slash to avoid redirect
-        response = await self._client.get("/books/", params=params)
-        response.raise_for_status()
-        return response.json()
-
-
-async def get_gutendex_client() -> AsyncGenerator[GutendexClient, None]:
+        await self._api.aclose(timeout)
+        self._books.clear()
+        self._lists.clear()
+        self._not_found.clear()
+
+
+def _book_key(book_id: int) -> str:
+    return f"book:{book_id}"
+
+
+async def get_gutendex_client(request: Request) -> GutendexClient:
     """
-    FastAPI dependency provider that yields a GutendexClient with
-    a managed HTTPX AsyncClient.
+    FastAPI dependency provider that returns the process-wide GutendexClient
+    created by the application lifespan.
     """
-    async with httpx.AsyncClient(
-        base_url=GutendexClient.BASE_URL,
-        follow_redirects=True,
-    ) as async_client:
-        yield GutendexClient(async_client)
+    return request.app.state.gutendex_client
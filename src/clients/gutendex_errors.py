@@ -0,0 +1,37 @@
+"""
+Errors raised on the way to Gutendex and how they are classified.
+"""
+import httpx
+
+from src.config import GUTENDEX_BASE_URL
+
+
+class GutendexUnavailable(Exception):
+    """
+    Raised instead of calling Gutendex while the circuit breaker is open.
+
+    Attributes:
+        retry_after (int): Seconds until the next upstream call is allowed.
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Gutendex is unavailable, retry in {retry_after:.0f}s")
+        self.retry_after = max(int(retry_after + 0.5), 1)
+
+
+def is_upstream_failure(exc: Exception) -> bool:
+    """Gutendex is unreachable or failing (as opposed to answering 4xx)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, (httpx.TransportError, GutendexUnavailable))
+
+
+def book_not_found(book_id: int) -> httpx.HTTPStatusError:
+    """
+    The error Gutendex answers for an unknown book, rebuilt for cached 404s.
+
+    Callers then handle a negative cache hit exactly like the upstream answer.
+    """
+    request = httpx.Request("GET", f"{GUTENDEX_BASE_URL}/books/{book_id}/")
+    response = httpx.Response(404, request=request)
+    return httpx.HTTPStatusError("Book not found", request=request, response=response)
@@ -0,0 +1,31 @@
+import httpx
+
+from src.config import (
+    GUTENDEX_BASE_URL,
+    GUTENDEX_HTTP2,
+    GUTENDEX_TIMEOUT,
+    GUTENDEX_MAX_CONNECTIONS,
+    GUTENDEX_MAX_KEEPALIVE,
+    GUTENDEX_KEEPALIVE_EXPIRY,
+)
+
+
+def build_http_client(base_url: str = GUTENDEX_BASE_URL) -> httpx.AsyncClient:
+    """
+    Build the pooled HTTPX client used to talk to Gutendex.
+
+    Idle connections are kept alive, so consecutive requests reuse an
+    already established TLS session instead of doing a new handshake.
+    """
+    return httpx.AsyncClient(
+        base_url=base_url,
+        # Ensure the HTTP client follows redirects from Gutendex endpoints
+        follow_redirects=True,
+        http2=GUTENDEX_HTTP2,
+        timeout=httpx.Timeout(GUTENDEX_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=GUTENDEX_MAX_CONNECTIONS,
+            max_keepalive_connections=GUTENDEX_MAX_KEEPALIVE,
+            keepalive_expiry=GUTENDEX_KEEPALIVE_EXPIRY,
+        ),
+    )
@@ -0,0 +1,78 @@
+"""
+Book listings and searches of `GutendexClient`.
+"""
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from src.cache.loading import LoadingCache
+from src.clients.catalogue_mirror import CatalogueMirror
+from src.clients.gutendex_api import GutendexAPI
+from src.clients.gutendex_params import normalize_list_params
+
+
+class BookListing:
+    """Listing part of `GutendexClient`, which sets up the attributes below."""
+
+    _mirror: CatalogueMirror
+    _api: GutendexAPI
+    _lists: LoadingCache
+
+    async def list_books(
+        self,
+        page: int = 1,
+        author_year_start: Optional[int] = None,
+        author_year_end: Optional[int] = None,
+        copyright: Optional[str] = None,
+        ids: Optional[str] = None,
+        languages: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        search: Optional[str] = None,
+        topic: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetches a paginated list of books from Gutendex with optional filters.
+        Filters are normalized first, so e.g. `languages="fr,en"` and
+        `languages="en,fr"` hit the same cache entry.
+
+        Args:
+            page (int): 1-based page number.
+            author_year_start, author_year_end, copyright, ids, languages,
+            mime_type, search, topic, sort: Gutendex filters, see
+                https://gutendex.com for their semantics.
+
+        Returns:
+            dict: The parsed JSON payload (count, next, previous, results).
+        """
+        return await self._list_books(normalize_list_params(
+            page=page,
+            author_year_start=author_year_start,
+            author_year_end=author_year_end,
+            copyright=copyright,
+            ids=ids,
+            languages=languages,
+            mime_type=mime_type,
+            search=search,
+            topic=topic,
+            sort=sort,
+        ))
+
+    async def _list_books(self, params: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+        """
+        Cached part of `list_books`, keyed on the normalized query parameters.
+        """
+        key = f"list:{urlencode(params)}"
+        return await self._lists.get_or_load(key, lambda: self._fetch_list(params))
+
+    async def find_books(self, search: str) -> Dict[str, Any]:
+        """
+        First page of a `list_books` search that bypasses the list cache,
+        for one-off lookups (e.g. an import) that would evict popular pages.
+        """
+        return await self._fetch_list(normalize_list_params(search=search))
+
+    async def _fetch_list(self, params: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+        return await self._mirror.fetch(
+            lambda: self._mirror.list_books(dict(params)),
+            lambda: self._api.fetch_list(dict(params)),
+        )
@@ -0,0 +1,64 @@
+"""
+Normalization of Gutendex query parameters.
+
+`GutendexClient.list_books` caches responses keyed on its arguments, so
+equivalent queries (same languages in a different order, extra spaces in a
+search phrase, ...) are first brought to one canonical form.
+"""
+from typing import Any, Optional, Tuple
+
+
+def _normalize_csv(value: Optional[str]) -> Optional[str]:
+    """
+    Turn a comma separated filter like " fr,en ,en" into "en,fr", so that
+    equivalent queries share one cache entry.
+    """
+    if value is None:
+        return None
+    items = {item.strip().lower() for item in value.split(",") if item.strip()}
+    return ",".join(sorted(items)) or None
+
+
+def _normalize_ids(value: Optional[str]) -> Optional[str]:
+    """Sort and deduplicate a comma separated list of book IDs."""
+    if value is None:
+        return None
+    ids = {int(item) for item in value.split(",") if item.strip().isdigit()}
+    return ",".join(str(book_id) for book_id in sorted(ids)) or None
+
+
+def _normalize_text(value: Optional[str]) -> Optional[str]:
+    """Trim and collapse whitespace of a free text query."""
+    if value is None:
+        return None
+    return " ".join(value.split()) or None
+
+
+_NORMALIZERS = {
+    "copyright": _normalize_csv,
+    "ids": _normalize_ids,
+    "languages": _normalize_csv,
+    "mime_type": _normalize_text,
+    "search": _normalize_text,
+    "topic": _normalize_text,
+    "sort": _normalize_text,
+}
+
+
+def normalize_list_params(**params: Any) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Bring `list_books` filters to a canonical, hashable form.
+
+    Args:
+        **params: Gutendex query parameters, None meaning "not set".
+
+    Returns:
+        tuple: Sorted (name, value) pairs of the parameters that are set.
+    """
+    normalized = {
+        name: _NORMALIZERS.get(name, lambda value: value)(value)
+        for name, value in params.items()
+    }
+    return tuple(sorted(
+        (name, value) for name, value in normalized.items() if value is not None
+    ))
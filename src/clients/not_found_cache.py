@@ -0,0 +1,74 @@
+"""
+Negative cache of the Gutendex book lookups.
+
+Gutendex answers unknown IDs with 404, which the book cache does not keep,
+so clients probing invalid IDs would reach the upstream on every request.
+Those IDs are remembered here for GUTENDEX_NOT_FOUND_TTL seconds instead.
+"""
+from typing import Awaitable, Callable, Iterable, Optional, Set, TypeVar
+
+import httpx
+
+from src.cache.base import CacheBackend
+from src.cache.local import MemoryBackend
+from src.cache.tiered import TieredCache
+from src.clients.gutendex_errors import book_not_found
+from src.config import GUTENDEX_BOOK_CACHE_SIZE, GUTENDEX_NOT_FOUND_TTL
+
+T = TypeVar("T")
+
+
+class NotFoundCache:
+    """Book IDs Gutendex recently answered with 404; a TTL of 0 disables it."""
+
+    def __init__(
+        self,
+        shared_cache: Optional[CacheBackend] = None,
+        ttl: float = GUTENDEX_NOT_FOUND_TTL,
+    ):
+        """
+        Args:
+            shared_cache (Optional[CacheBackend]): Level shared with other workers.
+            ttl (float): Seconds an unknown ID is remembered.
+        """
+        self._cache = TieredCache(
+            "not_found", MemoryBackend(GUTENDEX_BOOK_CACHE_SIZE, ttl), shared_cache, ttl
+        ) if ttl else None
+
+    async def missing(self, book_ids: Iterable[int]) -> Set[int]:
+        """The IDs among `book_ids` known to be unknown to Gutendex."""
+        keys = [_missing_key(book_id) for book_id in book_ids]
+        if self._cache is None or not keys:
+            return set()
+        return {int(key.split(":")[1]) for key in await self._cache.get_many(keys)}
+
+    async def remember(self, book_id: int) -> None:
+        """Record that Gutendex answered `book_id` with 404."""
+        if self._cache is not None:
+            await self._cache.set_many({_missing_key(book_id): True})
+
+    async def guard(self, book_id: int, load: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run the lookup `load` of `book_id` unless the ID is known to be unknown.
+
+        Raises:
+            HTTPStatusError: 404 rebuilt from the cache, or any error of `load`,
+                whose 404s are remembered.
+        """
+        if await self.missing([book_id]):
+            raise book_not_found(book_id)
+        try:
+            return await load()
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                await self.remember(book_id)
+            raise
+
+    def clear(self) -> None:
+        """Drop the in-process entries."""
+        if self._cache is not None:
+            self._cache.clear()
+
+
+def _missing_key(book_id: int) -> str:
+    return f"missing:{book_id}"
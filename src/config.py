@@ -1,4 +1,4 @@
-from os import environ
+from os import environ, cpu_count
 
 APP_META = dict(
     title="Book-Track API",
@@ -10,11 +10,14 @@ APP_META = dict(
     },
 )
 
+# POSTGRES_USER, POSTGRES_PASSWORD and POSTGRES_DB are required.
+POSTGRES_HOST = environ.get("POSTGRES_HOST", "postgresql")
+POSTGRES_PORT = int(environ.get("POSTGRES_PORT", 5432))
 DATABASE_URL = (
     "postgresql+asyncpg://"
     "{POSTGRES_USER}:{POSTGRES_PASSWORD}@"
-    "postgresql:5432/{POSTGRES_DB}"
-).format(**environ)
+    "{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+).format_map({**environ, "POSTGRES_HOST": POSTGRES_HOST, "POSTGRES_PORT": POSTGRES_PORT})
 
 JWT_TOKEN_URL = "auth/login"
 JWT_TOKEN_SECRET = environ.get("JWT_TOKEN_SECRET")
@@ -22,3 +25,143 @@ JWT_TOKEN_LIFETIME = 7 * 24 * 3600
 
 URL_ALIAS_LENGTH = 6
 IS_E2E = environ.get("E2E_ACTIVE")
+
+
+def env_flag(name: str, default: str = "false") -> bool:
+    """Read a boolean switch such as GUTENDEX_HTTP2=true from the environment."""
+    return environ.get(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+# Connection pool of each worker (see src/database.py): DB_POOL_SIZE connections
+# are kept open, up to DB_MAX_OVERFLOW more are opened under load, and a request
+# waits at most DB_POOL_TIMEOUT seconds for one. Connections are tested before
+# use (DB_POOL_PRE_PING) and replaced after DB_POOL_RECYCLE seconds (-1: never).
+DB_POOL_SIZE = int(environ.get("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(environ.get("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(environ.get("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(environ.get("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = env_flag("DB_POOL_PRE_PING", "true")
+# Prepared statements kept per connection, enough for every query of the API;
+# set 0 behind PgBouncer in transaction pooling mode.
+DB_STATEMENT_CACHE_SIZE = int(environ.get("DB_STATEMENT_CACHE_SIZE", 256))
+
+# Gutendex upstream. One client (and one connection pool) is shared by the
+# whole process, see `lifespan` in main.py.
+GUTENDEX_BASE_URL = environ.get("GUTENDEX_BASE_URL", "https://gutendex.com")
+# HTTP/2 needs the optional `h2` package (pip install "httpx[http2]").
+GUTENDEX_HTTP2 = env_flag("GUTENDEX_HTTP2")
+GUTENDEX_TIMEOUT = float(environ.get("GUTENDEX_TIMEOUT", 10))
+# Keep-alive pool: idle connections are reused instead of a new TLS handshake.
+GUTENDEX_MAX_CONNECTIONS = int(environ.get("GUTENDEX_MAX_CONNECTIONS", 100))
+GUTENDEX_MAX_KEEPALIVE = int(environ.get("GUTENDEX_MAX_KEEPALIVE", 20))
+GUTENDEX_KEEPALIVE_EXPIRY = float(environ.get("GUTENDEX_KEEPALIVE_EXPIRY", 60))
+# How long shutdown waits for in-flight upstream calls to finish.
+GUTENDEX_SHUTDOWN_TIMEOUT = float(environ.get("GUTENDEX_SHUTDOWN_TIMEOUT", 10))
+# Process-level metadata caches (entries), TTL in seconds, 0 disables expiry.
+GUTENDEX_BOOK_CACHE_SIZE = int(environ.get("GUTENDEX_BOOK_CACHE_SIZE", 128))
+# Memory budget of the process-level book cache, which keeps compact records.
+GUTENDEX_BOOK_CACHE_BYTES = int(environ.get("GUTENDEX_BOOK_CACHE_BYTES", 32 * 1024 * 1024))
+GUTENDEX_LIST_CACHE_SIZE = int(environ.get("GUTENDEX_LIST_CACHE_SIZE", 64))
+GUTENDEX_CACHE_TTL = float(environ.get("GUTENDEX_CACHE_TTL", 3600))
+# Entries older than this are still served, but refreshed in the background;
+# 0 disables the refresh, so entries are only replaced once the TTL is over.
+GUTENDEX_CACHE_SOFT_TTL = float(environ.get("GUTENDEX_CACHE_SOFT_TTL", 600))
+# Seconds a Gutendex 404 is remembered, so probing unknown IDs stays local.
+GUTENDEX_NOT_FOUND_TTL = float(environ.get("GUTENDEX_NOT_FOUND_TTL", 60))
+# Circuit breaker: consecutive upstream failures that make calls fail fast,
+# and seconds before a single probe call checks whether Gutendex is back.
+GUTENDEX_BREAKER_FAILURES = int(environ.get("GUTENDEX_BREAKER_FAILURES", 5))
+GUTENDEX_BREAKER_RESET = float(environ.get("GUTENDEX_BREAKER_RESET", 30))
+# Parallel `/books/?ids=` calls when a batch needs more than one page.
+GUTENDEX_BATCH_CONCURRENCY = int(environ.get("GUTENDEX_BATCH_CONCURRENCY", 4))
+
+# Local catalogue mirror, filled by `python -m src.jobs.catalogue_sync`:
+# off - always ask Gutendex, prefer - read the mirror first,
+# fallback - read the mirror only while Gutendex is unreachable.
+CATALOGUE_MIRROR = environ.get("CATALOGUE_MIRROR", "off").strip().lower()
+
+# Where `/books/` looks up `search` and `topic` queries: gutendex, or local
+# for ranked full-text search over the catalogue mirror (needs a synced mirror).
+BOOK_SEARCH_BACKEND = environ.get("BOOK_SEARCH_BACKEND", "gutendex").strip().lower()
+
+# Seconds clients may reuse `/books/` pages and `/books/{id}` responses without
+# revalidating them (Cache-Control: private, max-age). Both carry the user's
+# favourite state, so keep them short; an ETag revalidation is cheap anyway.
+BOOKS_LIST_MAX_AGE = int(environ.get("BOOKS_LIST_MAX_AGE", 30))
+BOOK_MAX_AGE = int(environ.get("BOOK_MAX_AGE", 60))
+
+# Password hashing. argon2id costs follow the OWASP baseline (19 MiB, 2 passes);
+# changing them rehashes each password on the user's next login.
+ARGON2_TIME_COST = int(environ.get("ARGON2_TIME_COST", 2))
+ARGON2_MEMORY_COST = int(environ.get("ARGON2_MEMORY_COST", 19456))  # KiB
+ARGON2_PARALLELISM = int(environ.get("ARGON2_PARALLELISM", 1))
+# Only used to verify (and then upgrade) legacy bcrypt hashes.
+BCRYPT_ROUNDS = int(environ.get("BCRYPT_ROUNDS", 12))
+# Hashing threads and how many jobs may wait for them before logins get a 503.
+PASSWORD_HASH_WORKERS = int(environ.get("PASSWORD_HASH_WORKERS", min(4, cpu_count() or 1)))
+PASSWORD_HASH_MAX_QUEUE = int(environ.get("PASSWORD_HASH_MAX_QUEUE", 64))
+
+# Authenticated principals cached per token (entries, seconds); TTL 0 disables.
+# A user changed by another worker is picked up once the TTL has passed.
+PRINCIPAL_CACHE_SIZE = int(environ.get("PRINCIPAL_CACHE_SIZE", 1024))
+PRINCIPAL_CACHE_TTL = float(environ.get("PRINCIPAL_CACHE_TTL", 60))
+
+# Most book IDs accepted by one `/favourites/batch` or `/reading-list/batch` call.
+BATCH_MAX_ITEMS = int(environ.get("BATCH_MAX_ITEMS", 100))
+
+# Activity log: "app" queues events in the API and writes them in batches (the
+# v1.1 log triggers are then switched off for the API's connections);
+# "triggers" leaves the logging to the database triggers as before.
+ACTIVITY_LOG = environ.get("ACTIVITY_LOG", "app").strip().lower()
+# A batch is written once it has this many events or its oldest one waited
+# this many seconds; events beyond the queue size are dropped (and counted).
+ACTIVITY_LOG_BATCH_SIZE = int(environ.get("ACTIVITY_LOG_BATCH_SIZE", 500))
+ACTIVITY_LOG_FLUSH_INTERVAL = float(environ.get("ACTIVITY_LOG_FLUSH_INTERVAL", 1))
+ACTIVITY_LOG_QUEUE_SIZE = int(environ.get("ACTIVITY_LOG_QUEUE_SIZE", 10000))
+# How long shutdown waits for the queued events to be written.
+ACTIVITY_LOG_SHUTDOWN_TIMEOUT = float(environ.get("ACTIVITY_LOG_SHUTDOWN_TIMEOUT", 10))
+# The log table is partitioned by month: partitions are created this many months
+# ahead, and those older than LOG_RETENTION_MONTHS are dropped. The default 0
+# keeps all history; dropping it is left to an explicit setting.
+# API workers check both every LOG_MAINTENANCE_INTERVAL seconds (0: only via
+# `python -m src.jobs.log_partitions`, e.g. from cron).
+LOG_PARTITIONS_AHEAD = int(environ.get("LOG_PARTITIONS_AHEAD", 3))
+LOG_RETENTION_MONTHS = int(environ.get("LOG_RETENTION_MONTHS", 0))
+LOG_MAINTENANCE_INTERVAL = float(environ.get("LOG_MAINTENANCE_INTERVAL", 24 * 3600))
+
+# Library exports read this many rows per server-side cursor fetch, and look up
+# the books of each chunk with one batched Gutendex call.
+EXPORT_CHUNK_SIZE = int(environ.get("EXPORT_CHUNK_SIZE", 500))
+
+# Reading list imports (`POST /reading-list/import`) read and match the uploaded
+# CSV this many rows at a time, refuse files with more than IMPORT_MAX_ROWS rows
+# and report at most IMPORT_MAX_REPORTED unmatched rows. Title and author
+# matches are remembered per process for GUTENDEX_CACHE_TTL seconds.
+IMPORT_BATCH_SIZE = int(environ.get("IMPORT_BATCH_SIZE", 500))
+IMPORT_MAX_ROWS = int(environ.get("IMPORT_MAX_ROWS", 20000))
+IMPORT_MAX_REPORTED = int(environ.get("IMPORT_MAX_REPORTED", 100))
+IMPORT_MATCH_CACHE_SIZE = int(environ.get("IMPORT_MATCH_CACHE_SIZE", 10000))
+
+# Shared (L2) metadata cache behind the per-process one, e.g. redis://redis:6379/0,
+# so that workers and replicas warm a single cache. Empty keeps caches per process.
+CACHE_REDIS_URL = environ.get("CACHE_REDIS_URL", "")
+# Prepended to every shared key, so several deployments can use one server.
+CACHE_KEY_PREFIX = environ.get("CACHE_KEY_PREFIX", "booktrack:")
+# Seconds a shared cache call may take before it is given up as a miss.
+CACHE_REDIS_TIMEOUT = float(environ.get("CACHE_REDIS_TIMEOUT", 0.25))
+# Shared values of at least this many bytes are zlib-compressed.
+CACHE_COMPRESS_MIN_BYTES = int(environ.get("CACHE_COMPRESS_MIN_BYTES", 256))
+
+# Response compression (zstd if `zstandard` is installed, br, gzip), see
+# src/middleware/compression.py. Smaller bodies are sent as they are; chunks of
+# at least COMPRESSION_THREAD_MIN_BYTES are compressed on a worker thread.
+COMPRESSION_MIN_BYTES = int(environ.get("COMPRESSION_MIN_BYTES", 1024))
+COMPRESSION_THREAD_MIN_BYTES = int(environ.get("COMPRESSION_THREAD_MIN_BYTES", 256 * 1024))
+COMPRESSION_GZIP_LEVEL = int(environ.get("COMPRESSION_GZIP_LEVEL", 6))
+COMPRESSION_BROTLI_LEVEL = int(environ.get("COMPRESSION_BROTLI_LEVEL", 4))
+COMPRESSION_ZSTD_LEVEL = int(environ.get("COMPRESSION_ZSTD_LEVEL", 3))
+# Comma-separated path prefixes that are never compressed.
+COMPRESSION_EXCLUDE_PATHS = tuple(
+    path.strip() for path in environ.get("COMPRESSION_EXCLUDE_PATHS", "/metrics").split(",")
+    if path.strip()
+)
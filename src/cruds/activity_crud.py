@@ -0,0 +1,136 @@
+from datetime import datetime
+from typing import Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.activity.events import ActivityEvent
+from src.cruds.cursors import decode_row_cursor, encode_row_cursor
+from src.cruds.query_metrics import timed
+from src.models.user_schemas import UserFromDB
+
+
+@timed
+async def insert_activity(db: AsyncSession, events: Sequence[ActivityEvent]) -> None:
+    """
+    Append events to the activity log with one INSERT, whatever their number.
+
+    The columns are passed as parallel arrays, so the statement (and its
+    prepared plan) is the same for every batch. The caller commits.
+    """
+    if not events:
+        return
+    await db.execute(
+        text(
+            """INSERT INTO log (action, user_id, book_id, old_status, new_status, created_at)
+            SELECT CAST(t.action AS action), t.user_id, t.book_id,
+                CAST(t.old_status AS reading_status), CAST(t.new_status AS reading_status),
+                t.created_at
+            FROM unnest(
+                CAST(:actions AS text[]), CAST(:user_ids AS uuid[]),
+                CAST(:book_ids AS integer[]), CAST(:old_statuses AS text[]),
+                CAST(:new_statuses AS text[]), CAST(:created_ats AS timestamp[])
+            ) AS t(action, user_id, book_id, old_status, new_status, created_at)"""
+        ),
+        {
+            "actions": [event.action.value for event in events],
+            "user_ids": [event.user_id for event in events],
+            "book_ids": [event.book_id for event in events],
+            "old_statuses": [_value(event.old_status) for event in events],
+            "new_statuses": [_value(event.new_status) for event in events],
+            "created_ats": [event.created_at for event in events],
+        },
+    )
+
+
+def _value(status) -> Optional[str]:
+    return status.value if status is not None else None
+
+
+@timed
+async def get_activity_page(
+    user: UserFromDB,
+    db: AsyncSession,
+    limit: int,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+) -> tuple[list, Optional[str]]:
+    """
+    Read one page of the user's activity log, most recent first.
+
+    The time range and the cursor both bound `created_at`, the partition key
+    of `log`, so only the monthly partitions they overlap are scanned.
+
+    Args:
+        user: The user whose activity is listed.
+        db: Async database session.
+        limit: Maximum number of entries to return.
+        since: Only entries at or after this time.
+        until: Only entries before this time.
+        cursor: Token returned for the previous page.
+
+    Returns:
+        A tuple (rows, next_cursor) where:
+            - rows: (id, action, book_id, old_status, new_status, created_at) rows.
+            - next_cursor: Token for the following page, None on the last one.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    clauses, params = ["user_id = :user_id"], {"user_id": str(user.id), "limit": limit + 1}
+    if since is not None:
+        clauses.append("created_at >= :since")
+        params["since"] = _local(since)
+    if until is not None:
+        clauses.append("created_at < :until")
+        params["until"] = _local(until)
+    if cursor is not None:
+        after_at, after_id = decode_row_cursor(cursor)
+        # The plain bound prunes partitions, the row comparison breaks ties
+        clauses.append("created_at <= :after_at AND (created_at, id) < (:after_at, :after_id)")
+        params.update(after_at=after_at, after_id=after_id)
+    result = await db.execute(
+        text(
+            f"""SELECT id, action, book_id, old_status, new_status, created_at FROM log
+            WHERE {" AND ".join(clauses)}
+            ORDER BY created_at DESC, id DESC LIMIT :limit"""
+        ),
+        params,
+    )
+    rows = result.all()
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], encode_row_cursor(last.created_at, last.id)
+
+
+@timed
+async def maintain_log_partitions(
+    db: AsyncSession, months_ahead: int, keep_months: int
+) -> tuple[int, int]:
+    """
+    Create the upcoming monthly partitions of `log` and drop expired ones.
+
+    Args:
+        db: Async database session; the caller commits.
+        months_ahead: Months after the current one to create partitions for.
+        keep_months: Months of history to keep, 0 to keep everything.
+
+    Returns:
+        Number of partitions created and dropped.
+    """
+    created = await db.scalar(
+        text("SELECT create_log_partitions(:months_ahead)"), {"months_ahead": months_ahead}
+    )
+    dropped = 0
+    if keep_months > 0:
+        dropped = await db.scalar(
+            text("SELECT drop_log_partitions(:keep_months)"), {"keep_months": keep_months}
+        )
+    return created, dropped
+
+
+def _local(moment: datetime) -> datetime:
+    # `log.created_at` holds naive local times, as written by the API
+    return moment.astimezone().replace(tzinfo=None) if moment.tzinfo else moment
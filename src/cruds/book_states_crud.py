@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cruds.query_metrics import timed
+from src.models.user_schemas import UserFromDB
+
+BookState = tuple[Optional[datetime], Optional[str]]
+
+
+@timed
+async def get_book_states(
+    user: UserFromDB,
+    db: AsyncSession,
+    book_ids: Iterable[int],
+) -> dict[int, BookState]:
+    """
+    Read the user's favourite and reading list state of the given books.
+
+    Only the requested IDs are looked up, through the primary keys of both
+    tables, so annotating a page costs the same however large the user's
+    library is.
+
+    Args:
+        user: The user whose library is read.
+        db: Async database session.
+        book_ids: IDs of the books to look up (e.g. one page of results).
+
+    Returns:
+        (became_favourite_at, reading_status) keyed by book ID, each None
+        when the book is not a favourite or not on the reading list. Books
+        that are in neither are absent.
+    """
+    result = await db.execute(
+        text(
+            """SELECT ids.book_id, f.created_at, r.status
+            FROM unnest(CAST(:book_ids AS integer[])) AS ids(book_id)
+            LEFT JOIN favourite_books f ON f.user_id = :user_id AND f.book_id = ids.book_id
+            LEFT JOIN reading_list r ON r.user_id = :user_id AND r.book_id = ids.book_id
+            WHERE f.book_id IS NOT NULL OR r.book_id IS NOT NULL"""
+        ),
+        {"user_id": str(user.id), "book_ids": list(dict.fromkeys(book_ids))},
+    )
+    return {book_id: (favourite_at, status) for book_id, favourite_at, status in result.all()}
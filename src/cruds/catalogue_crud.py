@@ -0,0 +1,102 @@
+"""
+Queries against the local mirror of the Gutendex catalogue.
+
+The mirror lives in the `books`, `authors`, `book_authors`, `subjects` and
+`book_subjects` tables (see db/migration/v-1.2) and is filled by the
+`src.jobs.catalogue_sync` job. Books are read back through the `book_documents`
+view, which already renders them in the Gutendex JSON shape, so callers can
+use mirrored and upstream payloads interchangeably.
+"""
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlencode
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import GUTENDEX_BASE_URL
+from src.cruds.catalogue_filters import FILTERS
+from src.cruds.query_metrics import timed
+
+PAGE_SIZE = 32
+
+SORT_ORDERS = {
+    "ascending": "d.id ASC",
+    "descending": "d.id DESC",
+    "popular": "d.download_count DESC, d.id ASC",
+}
+
+
+@timed
+async def get_books(db: AsyncSession, book_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Read mirrored books by ID.
+
+    Args:
+        db: Async database session.
+        book_ids: IDs to look up.
+
+    Returns:
+        Gutendex-shaped payloads keyed by ID; IDs not in the mirror are absent.
+    """
+    result = await db.execute(
+        text("SELECT id, document FROM book_documents WHERE id = ANY(:ids)"),
+        {"ids": list(book_ids)},
+    )
+    return {book_id: document for book_id, document in result.all()}
+
+
+def _page_url(params: Dict[str, Any], page: int) -> str:
+    query = {name: value for name, value in params.items() if name != "page"}
+    if page > 1:
+        query["page"] = page
+    return f"{GUTENDEX_BASE_URL}/books/?{urlencode(query)}"
+
+
+@timed
+async def list_books(db: AsyncSession, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    List mirrored books with Gutendex filter semantics.
+
+    Args:
+        db: Async database session.
+        params: Normalized Gutendex query parameters (see `GutendexClient.list_books`).
+
+    Returns:
+        A Gutendex-shaped page: count, next, previous and results.
+    """
+    page = int(params.get("page", 1))
+    clauses, binds = ["TRUE"], {}
+    for name, build in FILTERS.items():
+        if params.get(name) is not None:
+            clause, clause_binds = build(params[name])
+            clauses.append(clause)
+            binds.update(clause_binds)
+    order_by = SORT_ORDERS.get(params.get("sort") or "popular", SORT_ORDERS["popular"])
+
+    result = await db.execute(
+        text(
+            # Documents are only rendered for the rows of the requested page
+            f"""SELECT v.document, page.total FROM (
+                    SELECT d.id, count(*) OVER () AS total,
+                           row_number() OVER (ORDER BY {order_by}) AS position
+                    FROM books d WHERE {" AND ".join(clauses)}
+                    ORDER BY {order_by} LIMIT :limit OFFSET :offset
+                ) page JOIN book_documents v ON v.id = page.id
+                ORDER BY page.position"""
+        ),
+        {**binds, "limit": PAGE_SIZE, "offset": (page - 1) * PAGE_SIZE},
+    )
+    rows = result.all()
+    count = rows[0][1] if rows else 0
+    return {
+        "count": count,
+        "next": _page_url(params, page + 1) if page * PAGE_SIZE < count else None,
+        "previous": _page_url(params, page - 1) if page > 1 else None,
+        "results": [document for document, _ in rows],
+    }
+
+
+@timed
+async def get_book(db: AsyncSession, book_id: int) -> Optional[Dict[str, Any]]:
+    """Read a single mirrored book, None if it has not been synced."""
+    return (await get_books(db, [book_id])).get(book_id)
@@ -0,0 +1,105 @@
+"""
+Translation of Gutendex `/books/` filters into SQL for the catalogue mirror.
+
+Every filter maps its (normalized) query value to a WHERE clause over the
+`books` table, aliased `d`, and the bind parameters that clause uses.
+`search_conditions` combines them with the full-text and trigram matching
+used by the local ranked search.
+"""
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def _csv(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def _copyright_clause(value: str) -> Tuple[str, Dict[str, Any]]:
+    flags = _csv(value)
+    clause = "d.copyright = ANY(:copyright)"
+    if "null" in flags:
+        clause = f"({clause} OR d.copyright IS NULL)"
+    return clause, {"copyright": [flag == "true" for flag in flags if flag != "null"]}
+
+
+def _search_clause(value: str) -> Tuple[str, Dict[str, Any]]:
+    # Like Gutendex: every word must occur in the title or an author name
+    clauses, params = [], {}
+    for index, word in enumerate(value.split()):
+        clauses.append(
+            f"(d.title ILIKE :search_{index} OR EXISTS (SELECT 1 FROM book_authors ba"
+            " JOIN authors a ON a.id = ba.author_id WHERE ba.book_id = d.id"
+            f" AND a.name ILIKE :search_{index}))"
+        )
+        params[f"search_{index}"] = f"%{word}%"
+    return " AND ".join(clauses) or "TRUE", params
+
+
+FILTERS: Dict[str, Callable[[Any], Tuple[str, Dict[str, Any]]]] = {
+    "ids": lambda value: (
+        "d.id = ANY(:ids)", {"ids": [int(book_id) for book_id in _csv(value)]}
+    ),
+    "languages": lambda value: ("d.languages && :languages", {"languages": _csv(value)}),
+    "copyright": _copyright_clause,
+    "mime_type": lambda value: (
+        "EXISTS (SELECT 1 FROM jsonb_object_keys(d.formats) AS mime"
+        " WHERE mime LIKE :mime_type)",
+        {"mime_type": f"{value}%"},
+    ),
+    "author_year_start": lambda value: (
+        "EXISTS (SELECT 1 FROM book_authors ba JOIN authors a ON a.id = ba.author_id"
+        " WHERE ba.book_id = d.id AND ba.role = 'author'"
+        " AND a.death_year >= :author_year_start)",
+        {"author_year_start": value},
+    ),
+    "author_year_end": lambda value: (
+        "EXISTS (SELECT 1 FROM book_authors ba JOIN authors a ON a.id = ba.author_id"
+        " WHERE ba.book_id = d.id AND ba.role = 'author'"
+        " AND a.birth_year <= :author_year_end)",
+        {"author_year_end": value},
+    ),
+    "search": _search_clause,
+    "topic": lambda value: (
+        "(EXISTS (SELECT 1 FROM book_subjects bs JOIN subjects s ON s.id = bs.subject_id"
+        " WHERE bs.book_id = d.id AND s.name ILIKE :topic)"
+        " OR EXISTS (SELECT 1 FROM unnest(d.bookshelves) AS shelf WHERE shelf ILIKE :topic))",
+        {"topic": f"%{value}%"},
+    ),
+}
+
+# Relevance of a book for the search words: full-text rank plus how closely
+# the words appear in its text (which keeps misspelt queries useful)
+SEARCH_RANK = (
+    "ts_rank(d.search_vector, to_tsquery('simple', :tsquery))"
+    " + word_similarity(:search, d.search_text)"
+)
+SEARCH_MATCH = "(d.search_vector @@ to_tsquery('simple', :tsquery) OR :search <% d.search_text)"
+# Without search words (topic only) the most downloaded books come first
+POPULARITY_RANK = "d.download_count"
+
+
+def _tsquery(search: str) -> str:
+    """Every word must match, as a prefix so "pride prej" already finds books."""
+    return " & ".join(f"{word}:*" for word in re.findall(r"\w+", search.lower()))
+
+
+def search_conditions(params: Dict[str, Any]) -> Tuple[str, List[str], Dict[str, Any]]:
+    """
+    Translate `/books/` query params for the ranked search.
+
+    Returns:
+        The rank expression of a book, the WHERE clauses over `books d`
+        and the bind parameters they use.
+    """
+    clauses, binds = ["TRUE"], {}
+    for name, build in FILTERS.items():
+        if name != "search" and params.get(name) is not None:
+            clause, clause_binds = build(params[name])
+            clauses.append(clause)
+            binds.update(clause_binds)
+    tsquery = _tsquery(params.get("search") or "")
+    if not tsquery:
+        return POPULARITY_RANK, clauses, binds
+    clauses.append(SEARCH_MATCH)
+    binds.update(tsquery=tsquery, search=params["search"])
+    return SEARCH_RANK, clauses, binds
@@ -0,0 +1,111 @@
+"""
+Ranked search over the local catalogue mirror.
+
+Search words are matched against `books.search_vector` (title, author names,
+subjects and bookshelves, weighted in that order) and, to tolerate typos,
+against `books.search_text` with pg_trgm word similarity; both are indexed
+and refreshed by the catalogue sync. Results come back in the Gutendex page
+shape and are paginated with keyset cursors, so `next`/`previous` cost the
+same deep into the result set as on the first page.
+"""
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cruds.catalogue_filters import search_conditions
+from src.cruds.cursors import decode_cursor, encode_cursor
+from src.cruds.query_metrics import timed
+
+PAGE_SIZE = 32
+
+# Page order and keyset condition for both directions of travel
+ORDERS = {"next": "rank DESC, id ASC", "prev": "rank ASC, id DESC"}
+AFTER = {
+    "next": "(rank < :after_rank OR (rank = :after_rank AND id > :after_id))",
+    "prev": "(rank > :after_rank OR (rank = :after_rank AND id < :after_id))",
+}
+
+
+def _keyset(cursor: Optional[str]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Direction and position encoded in a cursor (forward from the start if None).
+
+    Raises:
+        ValueError: If the cursor was not issued by `search_books`.
+    """
+    if cursor is None:
+        return "next", None
+    values = decode_cursor(cursor)
+    try:
+        after = {"after_rank": float(values["rank"]), "after_id": int(values["id"])}
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if values.get("dir") not in ORDERS:
+        raise ValueError("Invalid cursor")
+    return values["dir"], after
+
+
+def _page_url(params: Dict[str, Any], direction: str, row) -> str:
+    query = {name: value for name, value in params.items() if name not in ("page", "cursor")}
+    query["cursor"] = encode_cursor({"dir": direction, "rank": row.rank, "id": row.id})
+    return f"/books/?{urlencode(query)}"
+
+
+@timed
+async def search_books(db: AsyncSession, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Search mirrored books, best matches first.
+
+    Args:
+        db: Async database session.
+        params: Normalized `/books/` query parameters. `search` and the
+            Gutendex filters narrow the results, `cursor` (from a previous
+            `next`/`previous` link) or else `page` selects the page; `sort`
+            is ignored since results are ordered by relevance.
+
+    Returns:
+        A Gutendex-shaped page: count, next, previous and results.
+
+    Raises:
+        ValueError: If `cursor` is malformed.
+    """
+    rank, clauses, binds = search_conditions(params)
+    direction, after = _keyset(params.get("cursor"))
+    offset = 0 if after else (int(params.get("page", 1)) - 1) * PAGE_SIZE
+
+    result = await db.execute(
+        text(
+            # One extra row tells whether there is a page beyond this one
+            f"""WITH matches AS (
+                    SELECT d.id, CAST({rank} AS double precision) AS rank
+                    FROM books d WHERE {" AND ".join(clauses)}
+                ), page AS (
+                    SELECT id, rank FROM matches WHERE {AFTER[direction] if after else "TRUE"}
+                    ORDER BY {ORDERS[direction]} LIMIT :limit OFFSET :offset
+                )
+                SELECT total.count, page.id, page.rank, v.document
+                FROM (SELECT count(*) AS count FROM matches) total
+                LEFT JOIN page ON TRUE
+                LEFT JOIN book_documents v ON v.id = page.id
+                ORDER BY {ORDERS[direction]}"""
+        ),
+        {**binds, **(after or {}), "limit": PAGE_SIZE + 1, "offset": offset},
+    )
+    rows = result.all()
+    count = rows[0].count
+    rows = [row for row in rows if row.id is not None]
+    has_more = len(rows) > PAGE_SIZE
+    rows = rows[:PAGE_SIZE]
+    if direction == "prev":
+        rows.reverse()
+    # Walking backwards we came from the next page; forwards, from the previous one
+    has_next = has_more if direction == "next" else True
+    has_previous = has_more if direction == "prev" else bool(after or offset)
+    return {
+        "count": count,
+        "next": _page_url(params, "next", rows[-1]) if rows and has_next else None,
+        "previous": _page_url(params, "prev", rows[0]) if rows and has_previous else None,
+        "results": [row.document for row in rows],
+    }
@@ -0,0 +1,121 @@
+"""
+Writes into the local mirror of the Gutendex catalogue.
+
+Whole pages of Gutendex payloads are sent to Postgres as a single JSON
+document and unpacked there, so a sync costs a handful of statements per
+page regardless of how many books, authors and subjects it contains.
+"""
+import json
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cruds.query_metrics import timed
+
+UPSERT_BOOKS = """
+    WITH incoming AS (
+        SELECT CAST(doc->>'id' AS integer) AS id, doc
+        FROM jsonb_array_elements(CAST(:books AS jsonb)) AS doc
+    )
+    INSERT INTO books (id, title, summaries, bookshelves, languages, copyright,
+                       media_type, formats, download_count, payload_hash, synced_at)
+    SELECT id,
+           doc->>'title',
+           ARRAY(SELECT jsonb_array_elements_text(COALESCE(doc->'summaries', '[]'))),
+           ARRAY(SELECT jsonb_array_elements_text(COALESCE(doc->'bookshelves', '[]'))),
+           ARRAY(SELECT jsonb_array_elements_text(COALESCE(doc->'languages', '[]'))),
+           CAST(doc->>'copyright' AS boolean),
+           doc->>'media_type',
+           COALESCE(doc->'formats', '{}'),
+           COALESCE(CAST(doc->>'download_count' AS integer), 0),
+           md5(CAST(doc AS text)),
+           now()
+    FROM incoming
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        summaries = EXCLUDED.summaries,
+        bookshelves = EXCLUDED.bookshelves,
+        languages = EXCLUDED.languages,
+        copyright = EXCLUDED.copyright,
+        media_type = EXCLUDED.media_type,
+        formats = EXCLUDED.formats,
+        download_count = EXCLUDED.download_count,
+        payload_hash = EXCLUDED.payload_hash,
+        synced_at = EXCLUDED.synced_at
+    WHERE books.payload_hash <> EXCLUDED.payload_hash
+    RETURNING id
+"""
+
+# People (authors and translators) of the changed books, in Gutendex order
+CHANGED_PEOPLE = """
+    SELECT CAST(doc->>'id' AS integer) AS book_id,
+           CAST(r.role AS book_person_role) AS role,
+           p.position,
+           p.person->>'name' AS name,
+           CAST(p.person->>'birth_year' AS integer) AS birth_year,
+           CAST(p.person->>'death_year' AS integer) AS death_year
+    FROM jsonb_array_elements(CAST(:books AS jsonb)) AS doc,
+         LATERAL (VALUES ('author', doc->'authors'), ('translator', doc->'translators'))
+             AS r(role, people),
+         LATERAL jsonb_array_elements(COALESCE(r.people, '[]'))
+             WITH ORDINALITY AS p(person, position)
+    WHERE CAST(doc->>'id' AS integer) = ANY(:changed)
+"""
+
+CHANGED_SUBJECTS = """
+    SELECT CAST(doc->>'id' AS integer) AS book_id, s.name, s.position
+    FROM jsonb_array_elements(CAST(:books AS jsonb)) AS doc,
+         LATERAL jsonb_array_elements_text(COALESCE(doc->'subjects', '[]'))
+             WITH ORDINALITY AS s(name, position)
+    WHERE CAST(doc->>'id' AS integer) = ANY(:changed)
+"""
+
+RELINK_STATEMENTS = (
+    "DELETE FROM book_authors WHERE book_id = ANY(:changed)",
+    "DELETE FROM book_subjects WHERE book_id = ANY(:changed)",
+    f"""INSERT INTO authors (name, birth_year, death_year)
+        SELECT DISTINCT name, birth_year, death_year FROM ({CHANGED_PEOPLE}) people
+        ON CONFLICT ON CONSTRAINT uq_authors_person DO NOTHING""",
+    f"""INSERT INTO book_authors (book_id, author_id, role, position)
+        SELECT people.book_id, a.id, people.role, people.position
+        FROM ({CHANGED_PEOPLE}) people
+        JOIN authors a ON a.name = people.name
+            AND a.birth_year IS NOT DISTINCT FROM people.birth_year
+            AND a.death_year IS NOT DISTINCT FROM people.death_year""",
+    f"""INSERT INTO subjects (name)
+        SELECT DISTINCT name FROM ({CHANGED_SUBJECTS}) changed
+        ON CONFLICT (name) DO NOTHING""",
+    f"""INSERT INTO book_subjects (book_id, subject_id, position)
+        SELECT DISTINCT ON (changed.book_id, s.id) changed.book_id, s.id, changed.position
+        FROM ({CHANGED_SUBJECTS}) changed JOIN subjects s ON s.name = changed.name""",
+    # Search columns are derived from the links above, so they go last
+    "SELECT refresh_book_search(:changed)",
+)
+
+
+@timed
+async def upsert_books(db: AsyncSession, books: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert or update Gutendex payloads in the mirror.
+
+    Books whose payload did not change since the last sync are left alone,
+    so re-running a sync over the same pages is cheap. The caller commits.
+
+    Args:
+        db: Async database session.
+        books: Gutendex book payloads.
+
+    Returns:
+        IDs of the books that were inserted or changed.
+    """
+    unique = list({book["id"]: book for book in books}.values())
+    if not unique:
+        return []
+    payload = json.dumps(unique)
+    result = await db.execute(text(UPSERT_BOOKS), {"books": payload})
+    changed = [row[0] for row in result.all()]
+    if changed:
+        for statement in RELINK_STATEMENTS:
+            await db.execute(text(statement), {"books": payload, "changed": changed})
+    return changed
@@ -0,0 +1,53 @@
+"""
+Opaque pagination cursors.
+
+A cursor carries the sort key of the row a page starts after, so the next
+query can continue with `WHERE (key, id) > (:key, :id)` instead of skipping
+rows with OFFSET. Clients get it as a URL-safe base64 JSON token and send it
+back unchanged.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Pack the keyset values of a row into an opaque token."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """
+    Unpack a token created by `encode_cursor`.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(values, dict):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def encode_row_cursor(at: datetime, book_id: int) -> str:
+    """Cursor pointing after a row of a user's list ordered by (timestamp, book_id)."""
+    return encode_cursor({"at": at.isoformat(), "id": book_id})
+
+
+def decode_row_cursor(token: str) -> Tuple[datetime, int]:
+    """
+    Unpack a token created by `encode_row_cursor`.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    values = decode_cursor(token)
+    try:
+        return datetime.fromisoformat(values["at"]), int(values["id"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
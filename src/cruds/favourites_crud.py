@@ -5,45 +5,114 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from sqlalchemy import text
 
+from src.cruds.cursors import decode_row_cursor, encode_row_cursor
+from src.cruds.query_metrics import timed
 
-async def get_all_favourites_of_user(user: UserFromDB, db: AsyncSession) \
-                -> dict[int, datetime]:
-    result = await db.execute(text(
-        """SELECT book_id, created_at FROM favourite_books WHERE
-        user_id = :user_id ORDER BY created_at DESC"""
-        ), {"user_id": user.id},
+
+@timed
+async def get_favourites_page(
+    user: UserFromDB,
+    db: AsyncSession,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> tuple[list[tuple[int, datetime]], Optional[str]]:
+    """
+    Read one page of the user's favourites, most recently added first.
+
+    With a cursor the page continues right after the row it points to, which
+    is a range scan of the (user_id, created_at, book_id) index however deep
+    the page is; `offset` is only applied when no cursor is given.
+
+    Args:
+        user: The user whose favourites are listed.
+        db: Async database session.
+        limit: Maximum number of rows to return.
+        offset: Number of rows to skip (legacy pagination).
+        cursor: Token returned for the previous page.
+
+    Returns:
+        A tuple (rows, next_cursor) where:
+            - rows: (book_id, created_at) pairs.
+            - next_cursor: Token for the following page, None on the last one.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    keyset, params = "TRUE", {"user_id": user.id, "limit": limit + 1, "offset": offset}
+    if cursor is not None:
+        after_at, after_id = decode_row_cursor(cursor)
+        keyset = "(created_at, book_id) < (:after_at, :after_id)"
+        params.update(after_at=after_at, after_id=after_id, offset=0)
+    result = await db.execute(
+        text(
+            f"""SELECT book_id, created_at FROM favourite_books
+            WHERE user_id = :user_id AND {keyset}
+            ORDER BY created_at DESC, book_id DESC OFFSET :offset LIMIT :limit"""
+        ),
+        params,
     )
     rows = result.all()
-    return {id: added_at for id, added_at in rows}
+    if limit <= 0 or len(rows) <= limit:
+        return rows[:max(limit, 0)], None
+    book_id, created_at = rows[limit - 1]
+    return rows[:limit], encode_row_cursor(created_at, book_id)
 
 
-async def book_favourite_of_user(
+@timed
+async def add_favourites(
     user: UserFromDB,
-    book_id: int,
-    db: AsyncSession
-) -> tuple[bool, Optional[datetime]]:
+    db: AsyncSession,
+    book_ids: list[int],
+    added_at: datetime,
+) -> set[int]:
     """
-    Check if a book is in the user's favourites.
+    Add several books to the user's favourites with one multi-row INSERT.
+
+    Books that already are favourites are left untouched. The caller commits.
 
     Args:
-        user: The user to check for.
-        book_id: The ID of the book.
+        user: The user whose favourites are extended.
         db: Async database session.
+        book_ids: IDs of the books to add.
+        added_at: Timestamp stored for the new favourites.
 
     Returns:
-        A tuple (exists, created_at) where:
-            - exists: True if the favourite exists, else False.
-            - created_at: Timestamp when it was added, or None if not found.
+        IDs of the books that were not favourites before.
     """
+    if not book_ids:
+        return set()
     result = await db.execute(
-        text("""
-            SELECT created_at FROM favourite_books
-            WHERE user_id = :user_id AND book_id = :book_id
-        """),
-        {"user_id": str(user.id), "book_id": book_id},
+        text(
+            """INSERT INTO favourite_books (user_id, book_id, created_at, updated_at)
+            SELECT CAST(:user_id AS uuid), t.book_id, :added_at, :added_at
+            FROM unnest(CAST(:book_ids AS integer[])) AS t(book_id)
+            ON CONFLICT DO NOTHING RETURNING book_id"""
+        ),
+        {"user_id": str(user.id), "book_ids": book_ids, "added_at": added_at},
     )
+    return set(result.scalars())
+
+
+@timed
+async def remove_favourites(
+    user: UserFromDB,
+    db: AsyncSession,
+    book_ids: list[int],
+) -> set[int]:
+    """
+    Remove several books from the user's favourites with one DELETE.
 
-    row = result.first()
-    if row:
-        return True, row[0]
-    return False, None
+    The caller commits.
+
+    Returns:
+        IDs of the books that were favourites and have been removed.
+    """
+    result = await db.execute(
+        text(
+            """DELETE FROM favourite_books
+            WHERE user_id = :user_id AND book_id = ANY(:book_ids) RETURNING book_id"""
+        ),
+        {"user_id": str(user.id), "book_ids": book_ids},
+    )
+    return set(result.scalars())
@@ -0,0 +1,73 @@
+"""
+Reads of a user's whole library (favourites and reading list), for exports
+and the summary counters.
+"""
+from typing import AsyncIterator, Optional, Sequence
+
+from sqlalchemy import Row, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cruds.query_metrics import timed
+from src.models.user_schemas import UserFromDB
+
+# One row per book that is a favourite, on the reading list or both
+LIBRARY_QUERY = text(
+    """SELECT book_id,
+           f.created_at AS favourite_since,
+           r.status AS reading_status,
+           r.created_at AS reading_since,
+           r.updated_at AS reading_updated_at
+    FROM (SELECT book_id, created_at FROM favourite_books WHERE user_id = :user_id) AS f
+    FULL JOIN (
+        SELECT book_id, status, created_at, updated_at FROM reading_list WHERE user_id = :user_id
+    ) AS r USING (book_id)
+    ORDER BY book_id"""
+)
+
+
+async def stream_library(
+    user: UserFromDB, db: AsyncSession, chunk_size: int
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    Yield the user's library in chunks of at most `chunk_size` rows, by book ID.
+
+    Rows are fetched from a server-side cursor, so only one chunk is held in
+    memory however large the library is. The session must stay open (and its
+    transaction running) while the chunks are consumed.
+
+    Args:
+        user: The user whose library is read.
+        db: Async database session.
+        chunk_size: Rows fetched from the cursor at a time.
+
+    Yields:
+        Rows with book_id, favourite_since, reading_status, reading_since and
+        reading_updated_at; the columns of the missing side are None.
+    """
+    result = await db.stream(
+        LIBRARY_QUERY, {"user_id": str(user.id)}, execution_options={"yield_per": chunk_size}
+    )
+    async for chunk in result.partitions(chunk_size):
+        yield chunk
+
+
+@timed
+async def get_library_summary(user: UserFromDB, db: AsyncSession) -> Optional[Row]:
+    """
+    Read the user's library counters with one primary key lookup.
+
+    The counters are kept by database triggers in the transaction of every
+    favourite and reading list write (see the user_library_stats migration).
+
+    Returns:
+        Row with favourites, want_to_read, reading and done, or None if the
+        user never had a favourite or reading list entry.
+    """
+    result = await db.execute(
+        text(
+            """SELECT favourites, want_to_read, reading, done
+            FROM user_library_stats WHERE user_id = :user_id"""
+        ),
+        {"user_id": str(user.id)},
+    )
+    return result.first()
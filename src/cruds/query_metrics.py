@@ -0,0 +1,28 @@
+"""
+Latency of the CRUD functions, observed per function in `db_query_seconds`.
+
+The generic HTTP metrics cannot tell whether a slow endpoint waited for
+Postgres, Gutendex or serialization; this tells the database part apart.
+"""
+import functools
+import time
+from typing import Any, Awaitable, Callable, TypeVar
+
+from src.metrics import DB_QUERY_SECONDS
+
+T = TypeVar("T")
+
+
+def timed(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Observe the duration of every call of the async function `func`, failed ones included."""
+    histogram = DB_QUERY_SECONDS.labels(func.__name__)
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - started)
+
+    return wrapper
@@ -0,0 +1,169 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cruds.cursors import decode_row_cursor, encode_row_cursor
+from src.cruds.query_metrics import timed
+from src.models.schemas import ReadingStatus
+from src.models.user_schemas import UserFromDB
+
+
+@timed
+async def get_reading_list_page(
+    user: UserFromDB,
+    db: AsyncSession,
+    limit: int,
+    offset: int = 0,
+    status: ReadingStatus = ReadingStatus.ALL,
+    cursor: Optional[str] = None,
+) -> tuple[list[tuple[int, str, datetime, datetime]], Optional[str]]:
+    """
+    Read one page of the user's reading list, most recently updated first.
+
+    With a cursor the page continues right after the row it points to, which
+    is a range scan of the (user_id[, status], updated_at, book_id) indexes
+    however deep the page is; `offset` is only applied when no cursor is given.
+
+    Args:
+        user: The user whose reading list is read.
+        db: Async database session.
+        limit: Maximum number of rows to return.
+        offset: Number of rows to skip (legacy pagination).
+        status: Only return entries with this status (all by default).
+        cursor: Token returned for the previous page.
+
+    Returns:
+        A tuple (rows, next_cursor) where:
+            - rows: (book_id, status, created_at, updated_at) tuples.
+            - next_cursor: Token for the following page, None on the last one.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    clauses = ["user_id = :user_id"]
+    params = {"user_id": str(user.id), "limit": limit + 1, "offset": offset}
+    if status != ReadingStatus.ALL:
+        clauses.append("status = :status")
+        params["status"] = status.value
+    if cursor is not None:
+        after_at, after_id = decode_row_cursor(cursor)
+        clauses.append("(updated_at, book_id) < (:after_at, :after_id)")
+        params.update(after_at=after_at, after_id=after_id, offset=0)
+    result = await db.execute(
+        text(
+            f"""SELECT book_id, status, created_at, updated_at FROM reading_list
+            WHERE {" AND ".join(clauses)}
+            ORDER BY updated_at DESC, book_id DESC LIMIT :limit OFFSET :offset"""
+        ),
+        params,
+    )
+    rows = result.all()
+    if limit <= 0 or len(rows) <= limit:
+        return rows[:max(limit, 0)], None
+    book_id, _, _, updated_at = rows[limit - 1]
+    return rows[:limit], encode_row_cursor(updated_at, book_id)
+
+
+@timed
+async def add_reading_list_entries(
+    user: UserFromDB,
+    db: AsyncSession,
+    statuses: dict[int, ReadingStatus],
+    created_at: datetime,
+) -> set[int]:
+    """
+    Add several books to the user's reading list with one multi-row INSERT.
+
+    Books already on the list keep their current entry. The caller commits.
+
+    Args:
+        user: The user whose reading list is extended.
+        db: Async database session.
+        statuses: Reading status of each book to add, keyed by book ID.
+        created_at: Timestamp stored for the new entries.
+
+    Returns:
+        IDs of the books that were not on the reading list before.
+    """
+    if not statuses:
+        return set()
+    result = await db.execute(
+        text(
+            """INSERT INTO reading_list (book_id, user_id, status, created_at, updated_at)
+            SELECT t.book_id, CAST(:user_id AS uuid), CAST(t.status AS reading_status),
+                   :created_at, :created_at
+            FROM unnest(CAST(:book_ids AS integer[]), CAST(:statuses AS text[]))
+                AS t(book_id, status)
+            ON CONFLICT DO NOTHING RETURNING book_id"""
+        ),
+        {"user_id": str(user.id), "created_at": created_at, **_status_arrays(statuses)},
+    )
+    return set(result.scalars())
+
+
+@timed
+async def update_reading_list_entries(
+    user: UserFromDB,
+    db: AsyncSession,
+    statuses: dict[int, ReadingStatus],
+    updated_at: datetime,
+) -> dict[int, ReadingStatus]:
+    """
+    Change the status of several reading list entries with one UPDATE.
+
+    The caller commits.
+
+    Returns:
+        Previous status of the entries that were found and updated, by book ID.
+    """
+    if not statuses:
+        return {}
+    # Joining the table to itself exposes the row as it was before the UPDATE
+    result = await db.execute(
+        text(
+            """UPDATE reading_list r
+            SET status = CAST(t.status AS reading_status), updated_at = :updated_at
+            FROM unnest(CAST(:book_ids AS integer[]), CAST(:statuses AS text[]))
+                AS t(book_id, status), reading_list old
+            WHERE r.user_id = :user_id AND r.book_id = t.book_id
+                AND old.user_id = r.user_id AND old.book_id = r.book_id
+            RETURNING r.book_id, old.status"""
+        ),
+        {"user_id": str(user.id), "updated_at": updated_at, **_status_arrays(statuses)},
+    )
+    return {book_id: ReadingStatus(status) for book_id, status in result}
+
+
+@timed
+async def remove_reading_list_entries(
+    user: UserFromDB,
+    db: AsyncSession,
+    book_ids: list[int],
+) -> dict[int, ReadingStatus]:
+    """
+    Remove several books from the user's reading list with one DELETE.
+
+    The caller commits.
+
+    Returns:
+        Status of the entries that were on the list and have been removed, by book ID.
+    """
+    result = await db.execute(
+        text(
+            """DELETE FROM reading_list
+            WHERE user_id = :user_id AND book_id = ANY(:book_ids) RETURNING book_id, status"""
+        ),
+        {"user_id": str(user.id), "book_ids": book_ids},
+    )
+    return {book_id: ReadingStatus(status) for book_id, status in result}
+
+
+def _status_arrays(statuses: dict[int, ReadingStatus]) -> dict[str, list]:
+    # Two parallel arrays keep the statement (and its prepared plan) the same
+    # whatever the batch size, unlike a VALUES list with one row per book
+    return {
+        "book_ids": list(statuses),
+        "statuses": [status.value for status in statuses.values()],
+    }
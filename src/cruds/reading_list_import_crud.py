@@ -0,0 +1,87 @@
+"""
+Bulk load of imported reading list entries: the rows are copied into a
+temporary staging table, then merged into the reading list with one upsert.
+"""
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cruds.query_metrics import timed
+from src.models.schemas import ReadingStatus
+from src.models.user_schemas import UserFromDB
+
+STAGING_TABLE = "reading_list_import"
+STAGING_COLUMNS = ("line", "book_id", "status", "created_at", "updated_at")
+# (line, book_id, status, created_at, updated_at)
+StagedRow = Tuple[int, int, str, datetime, datetime]
+# (book_id, previous status or None if added, new status)
+Change = Tuple[int, Optional[ReadingStatus], ReadingStatus]
+
+# Dropped with the transaction, whether the import is committed or not
+CREATE_STAGING = text(
+    f"""CREATE TEMPORARY TABLE {STAGING_TABLE} (
+        line integer NOT NULL,
+        book_id integer NOT NULL,
+        status text NOT NULL,
+        created_at timestamp NOT NULL,
+        updated_at timestamp NOT NULL
+    ) ON COMMIT DROP"""
+)
+
+# The last row of a book wins; `previous` still sees the list as it was
+# before the INSERT, which gives the old status of the updated entries
+MERGE_STAGING = text(
+    f"""WITH incoming AS (
+        SELECT DISTINCT ON (book_id) book_id, CAST(status AS reading_status) AS status,
+               created_at, updated_at
+        FROM {STAGING_TABLE} ORDER BY book_id, line DESC
+    ), previous AS (
+        SELECT book_id, status FROM reading_list
+        WHERE user_id = :user_id AND book_id IN (SELECT book_id FROM incoming)
+    ), merged AS (
+        INSERT INTO reading_list (book_id, user_id, status, created_at, updated_at)
+        SELECT book_id, CAST(:user_id AS uuid), status, created_at, updated_at FROM incoming
+        ON CONFLICT (book_id, user_id) DO UPDATE
+            SET status = EXCLUDED.status, updated_at = EXCLUDED.updated_at
+            WHERE reading_list.status <> EXCLUDED.status
+        RETURNING book_id, status
+    )
+    SELECT merged.book_id, previous.status, merged.status
+    FROM merged LEFT JOIN previous USING (book_id)"""
+)
+
+
+@timed
+async def create_staging_table(db: AsyncSession) -> None:
+    """Create the staging table in the session's transaction."""
+    await db.execute(CREATE_STAGING)
+
+
+@timed
+async def copy_staged_rows(db: AsyncSession, rows: List[StagedRow]) -> None:
+    """Load rows into the staging table with COPY, bypassing statement parsing."""
+    if not rows:
+        return
+    connection = await (await db.connection()).get_raw_connection()
+    await connection.driver_connection.copy_records_to_table(
+        STAGING_TABLE, records=rows, columns=STAGING_COLUMNS
+    )
+
+
+@timed
+async def merge_staged_rows(user: UserFromDB, db: AsyncSession) -> List[Change]:
+    """
+    Upsert the staged rows into the user's reading list. The caller commits.
+
+    Entries already on the list take the imported status; entries whose
+    status does not change are left untouched.
+
+    Returns:
+        A `Change` for every entry that was added or changed.
+    """
+    result = await db.execute(MERGE_STAGING, {"user_id": str(user.id)})
+    return [
+        (book_id, old and ReadingStatus(old), ReadingStatus(new)) for book_id, old, new in result
+    ]
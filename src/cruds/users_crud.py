@@ -8,9 +8,11 @@ from datetime import datetime
 import uuid
 
 from src.database import get_async_session
+from src.cruds.query_metrics import timed
 import src.models.orm_models as models
 from src.models.user_schemas import UserCreate, UserFromDB
-from src.oauth.password_utils import verify_password, get_password_hash
+from src.oauth.password_utils import check_password, hash_password
+from src.oauth.principal_cache import principal_cache
 from src.config import JWT_TOKEN_SECRET
 from src.oauth.auth_algorithm import ALGORITHM
 
@@ -18,6 +20,7 @@ router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/token")
 
 
+@timed
 async def get_user_by_login(db: AsyncSession, login: str) -> models.User | None:
     """
     Retrieve a user by login from the database.
@@ -31,6 +34,19 @@ async def get_user_by_login(db: AsyncSession, login: str) -> models.User | None:
     return result.scalar_one_or_none()
 
 
+@timed
+async def get_user_by_id(db: AsyncSession, user_id: str) -> models.User | None:
+    """
+    Retrieve a user by primary key.
+
+    :param db: Async database session
+    :param user_id: User UUID as a string
+    :return: User instance or None if not found
+    :raises ValueError: If user_id is not a valid UUID
+    """
+    return await db.get(models.User, uuid.UUID(user_id))
+
+
 async def create_user(db: AsyncSession, user: UserCreate) -> models.User:
     """
     Create and persist a new user in the database.
@@ -43,7 +59,7 @@ async def create_user(db: AsyncSession, user: UserCreate) -> models.User:
         id=uuid.uuid4(),
         created_at=datetime.now(),
         **user.model_dump(exclude={"password"}),
-        hashed_password=get_password_hash(user.password),
+        hashed_password=await hash_password(user.password),
     )
     db.add(db_user)
     await db.commit()
@@ -57,14 +73,23 @@ async def authenticate_user(
     """
     Authenticate a user by login and password.
 
+    A password stored with a deprecated scheme or outdated cost settings is
+    rehashed with the current ones once it has been verified.
+
     :param db: Async database session
     :param login: Login of the user
     :param password: Plain password to verify
     :return: Authenticated User instance or None
     """
     user = await get_user_by_login(db, login)
-    if not user or not verify_password(password, user.hashed_password):
+    if not user:
+        return None
+    valid, new_hash = await check_password(password, user.hashed_password)
+    if not valid:
         return None
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
     return user
 
 
@@ -75,6 +100,9 @@ async def get_current_user(
     """
     Extract the currently authenticated user from the token.
 
+    Tokens verified before are answered from the principal cache, without
+    decoding the JWT or querying the database again.
+
     :param token: Bearer JWT access token
     :param db: Async database session
     :return: Pydantic UserInfo object representing the current user
@@ -85,16 +113,24 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    cached = principal_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(token, JWT_TOKEN_SECRET, algorithms=[ALGORITHM])
         login: str = payload.get("login")
         if login is None:
             raise credentials_exception
-    except JWTError:
+        # Tokens issued before `uid` was added are resolved by login
+        if payload.get("uid"):
+            user = await get_user_by_id(db, payload["uid"])
+        else:
+            user = await get_user_by_login(db, login=login)
+    except (JWTError, ValueError):
         raise credentials_exception
 
-    user = await get_user_by_login(db, login=login)
-    if user is None:
+    if user is None or user.login != login:
         raise credentials_exception
 
-    return user
+    return principal_cache.set(token, user, payload.get("exp"))
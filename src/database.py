@@ -4,11 +4,40 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import DeclarativeMeta, declarative_base
 from sqlalchemy.orm import sessionmaker
 
-from .config import DATABASE_URL
+from .config import (
+    ACTIVITY_LOG,
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_STATEMENT_CACHE_SIZE,
+)
+from .database_pool import InstrumentedPool
 
 Base: DeclarativeMeta = declarative_base()
 
-engine = create_async_engine(DATABASE_URL)
+# With the application-side activity log the log triggers skip our writes,
+# see db/migration/v-1.2/scripts/2026-10-18--004-structure-log.sql
+server_settings = {"booktrack.log_triggers": "off"} if ACTIVITY_LOG == "app" else {}
+
+# The only engine (and connection pool) of the process
+engine = create_async_engine(
+    DATABASE_URL,
+    poolclass=InstrumentedPool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    connect_args={
+        "server_settings": server_settings,
+        # SQLAlchemy's cache of prepared statements, and asyncpg's own
+        "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+    },
+)
 async_session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
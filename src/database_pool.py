@@ -0,0 +1,50 @@
+"""
+Instrumented connection pool of the SQLAlchemy engine.
+
+`InstrumentedPool` is the asyncio queue pool SQLAlchemy uses by default,
+reporting how long checkouts wait, how many connections are in use and
+when the pool overflows, so that DB_POOL_SIZE can be sized against real
+traffic (see the db_pool_* metrics in src/metrics.py).
+"""
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from src.metrics import (
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_CONNECTIONS,
+    DB_POOL_OVERFLOWS,
+    DB_POOL_TIMEOUTS,
+)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """`AsyncAdaptedQueuePool` exporting its usage as Prometheus metrics."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
+        self._report()
+        return connection
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        # Called once the new connection is counted: overflow() runs from
+        # -pool_size up, so a positive value means it is beyond the pool size
+        if self.overflow() > 0:
+            DB_POOL_OVERFLOWS.inc()
+        return super()._create_connection()
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self._report()
+
+    def _report(self) -> None:
+        DB_POOL_CONNECTIONS.labels("in_use").set(self.checkedout())
+        DB_POOL_CONNECTIONS.labels("idle").set(self.checkedin())
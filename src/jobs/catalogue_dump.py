@@ -0,0 +1,27 @@
+"""
+Readers for catalogue dumps loaded by `src.jobs.catalogue_sync --dump`.
+
+A dump is either a JSON Lines file with one Gutendex book per line, or a
+JSON file holding a list of books or a Gutendex page ({"results": [...]}).
+"""
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+def read_dump(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the books of a catalogue dump without loading JSON Lines files whole."""
+    with path.open(encoding="utf-8") as dump:
+        if path.suffix == ".jsonl":
+            yield from (json.loads(line) for line in dump if line.strip())
+            return
+        data = json.load(dump)
+    yield from data["results"] if isinstance(data, dict) else data
+
+
+def batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most `size` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
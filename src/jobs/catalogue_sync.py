@@ -0,0 +1,122 @@
+"""
+Synchronise the local catalogue mirror with Gutendex.
+
+Pages through the Gutendex listing (or reads a catalogue dump) and upserts
+every book into the mirror tables. Books whose payload did not change since
+the previous run are skipped, so the job is safe to re-run periodically.
+
+Usage:
+    python -m src.jobs.catalogue_sync [--start-page N] [--max-pages N]
+    python -m src.jobs.catalogue_sync --dump catalogue.jsonl
+
+See `src.jobs.catalogue_dump` for the supported dump formats.
+"""
+import argparse
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.clients.gutendex_api import GutendexAPI
+from src.jobs.catalogue_dump import batched, read_dump
+from src.cruds.catalogue_sync_crud import upsert_books
+from src.database import async_session_maker
+
+# Books upserted per transaction when loading a dump
+DUMP_BATCH_SIZE = 500
+# Attempts per listing page before the sync gives up
+PAGE_RETRIES = 3
+
+
+@dataclass
+class SyncStats:
+    """
+    Outcome of a sync run.
+
+    Attributes:
+        pages (int): Number of batches (listing pages or dump chunks) stored.
+        seen (int): Number of books received.
+        changed (int): Number of books inserted or updated in the mirror.
+    """
+
+    pages: int = 0
+    seen: int = 0
+    changed: int = 0
+
+
+async def store_books(books: List[Dict[str, Any]], stats: SyncStats, session_maker) -> None:
+    """Upsert one batch of books in its own transaction."""
+    async with session_maker() as session:
+        changed = await upsert_books(session, books)
+        await session.commit()
+    stats.pages += 1
+    stats.seen += len(books)
+    stats.changed += len(changed)
+
+
+async def fetch_page(api: GutendexAPI, page: int) -> Dict[str, Any]:
+    """Fetch a listing page, retrying transient failures with a growing delay."""
+    for attempt in range(1, PAGE_RETRIES + 1):
+        try:
+            # Ascending IDs keep the paging stable while download counts change
+            return await api.fetch_list({"page": page, "sort": "ascending"})
+        except Exception:
+            if attempt == PAGE_RETRIES:
+                raise
+            await asyncio.sleep(2 ** attempt)
+
+
+async def sync_from_gutendex(
+    api: GutendexAPI,
+    start_page: int = 1,
+    max_pages: Optional[int] = None,
+    session_maker=async_session_maker,
+) -> SyncStats:
+    """
+    Copy the Gutendex catalogue into the mirror, one listing page at a time.
+
+    Args:
+        api: Gutendex API wrapper.
+        start_page: First listing page to fetch, to resume an interrupted run.
+        max_pages: Stop after this many pages (all pages if None).
+        session_maker: Factory of async database sessions.
+
+    Returns:
+        SyncStats: Number of pages, books seen and books inserted or changed.
+    """
+    stats = SyncStats()
+    page: Optional[int] = start_page
+    while page is not None and (max_pages is None or stats.pages < max_pages):
+        payload = await fetch_page(api, page)
+        await store_books(payload["results"], stats, session_maker)
+        page = page + 1 if payload.get("next") else None
+    return stats
+
+
+async def sync_from_dump(path: Path, session_maker=async_session_maker) -> SyncStats:
+    """Load a catalogue dump into the mirror in batches of DUMP_BATCH_SIZE books."""
+    stats = SyncStats()
+    for books in batched(read_dump(path), DUMP_BATCH_SIZE):
+        await store_books(books, stats, session_maker)
+    return stats
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the sync requested on the command line and report what changed."""
+    if args.dump:
+        stats = await sync_from_dump(args.dump)
+    else:
+        api = GutendexAPI()
+        try:
+            stats = await sync_from_gutendex(api, args.start_page, args.max_pages)
+        finally:
+            await api.aclose()
+    print(f"Synced {stats.seen} books in {stats.pages} batches, {stats.changed} changed")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync the local Gutendex catalogue mirror")
+    parser.add_argument("--dump", type=Path, help="Load books from a dump instead of Gutendex")
+    parser.add_argument("--start-page", type=int, default=1)
+    parser.add_argument("--max-pages", type=int, default=None)
+    asyncio.run(main(parser.parse_args()))
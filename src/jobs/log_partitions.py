@@ -0,0 +1,85 @@
+"""
+Maintain the monthly partitions of the activity log.
+
+Creates the partitions for the next LOG_PARTITIONS_AHEAD months and drops
+those older than LOG_RETENTION_MONTHS (none by default). Both steps are idempotent, so the
+job can run from cron as well as from every API worker (see `lifespan`).
+
+Usage:
+    python -m src.jobs.log_partitions [--ahead N] [--keep N]
+"""
+import argparse
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Optional
+
+from src.config import LOG_MAINTENANCE_INTERVAL, LOG_PARTITIONS_AHEAD, LOG_RETENTION_MONTHS
+from src.cruds.activity_crud import maintain_log_partitions
+from src.database import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+
+async def maintain(
+    months_ahead: int = LOG_PARTITIONS_AHEAD,
+    keep_months: int = LOG_RETENTION_MONTHS,
+    session_maker=async_session_maker,
+) -> tuple[int, int]:
+    """Run one maintenance pass; returns the number of partitions created and dropped."""
+    async with session_maker() as session:
+        counts = await maintain_log_partitions(session, months_ahead, keep_months)
+        await session.commit()
+    return counts
+
+
+async def maintain_periodically(interval: float) -> None:
+    """Run `maintain` now and every `interval` seconds until cancelled."""
+    while True:
+        try:
+            created, dropped = await maintain()
+            if created or dropped:
+                logger.info("Log partitions: %d created, %d dropped", created, dropped)
+        except Exception:
+            # The default partition catches writes until the next pass succeeds
+            logger.exception("Log partition maintenance failed")
+        await asyncio.sleep(interval)
+
+
+class PeriodicMaintenance:
+    """Background task of an API worker running `maintain` periodically."""
+
+    def __init__(self, interval: float = LOG_MAINTENANCE_INTERVAL):
+        """
+        Args:
+            interval (float): Seconds between two passes, 0 disables the task.
+        """
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the task (from within the event loop)."""
+        if self.interval and self._task is None:
+            self._task = asyncio.create_task(maintain_periodically(self.interval))
+
+    async def aclose(self) -> None:
+        """Stop the task."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run one pass with the months given on the command line."""
+    created, dropped = await maintain(args.ahead, args.keep)
+    print(f"Log partitions: {created} created, {dropped} dropped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain the activity log partitions")
+    parser.add_argument("--ahead", type=int, default=LOG_PARTITIONS_AHEAD)
+    parser.add_argument("--keep", type=int, default=LOG_RETENTION_MONTHS,
+                        help="Months of history to keep, 0 to keep everything")
+    asyncio.run(main(parser.parse_args()))
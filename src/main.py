@@ -1,13 +1,51 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from src.routers import books, favourites, reading_list, users
-from config import APP_META, IS_E2E
+from src.clients.gutendex_client import GutendexClient
+from src.clients.catalogue_mirror import CatalogueMirror
+from src.cache.redis_backend import RedisBackend
+from src.activity.writer import activity_log
+from src.database import engine
+from src.jobs.log_partitions import PeriodicMaintenance
+from src.oauth.password_executor import PasswordHashingBusy
+from src.middleware.compression import CompressionMiddleware
+from config import APP_META, IS_E2E, CATALOGUE_MIRROR, CACHE_REDIS_URL
 import coverage_setup
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One Gutendex client per process: its connection pool and metadata
+    # caches are shared by every request instead of being rebuilt each time.
+    mirror = CatalogueMirror() if CATALOGUE_MIRROR != "off" else None
+    # With a shared cache, workers also reuse the metadata fetched by each other
+    shared_cache = RedisBackend.from_url(CACHE_REDIS_URL) if CACHE_REDIS_URL else None
+    app.state.gutendex_client = GutendexClient(mirror=mirror, shared_cache=shared_cache)
+    # Activity events are written in batches by a background task, drained on shutdown
+    activity_log.start()
+    # Monthly log partitions are created ahead of time and expired ones dropped
+    log_maintenance = PeriodicMaintenance()
+    log_maintenance.start()
+    try:
+        yield
+    finally:
+        await log_maintenance.aclose()
+        await activity_log.aclose()
+        await app.state.gutendex_client.aclose()
+        if shared_cache is not None:
+            await shared_cache.aclose()
+        # Close the pooled database connections instead of dropping them
+        await engine.dispose()
+
+
 app = FastAPI(
-    **APP_META
+    **APP_META,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -16,7 +54,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
+# Listings are repetitive JSON: compressing them saves most of the bandwidth
+app.add_middleware(CompressionMiddleware)
+
+
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    # Shed logins and sign-ups instead of queueing them without bound
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many logins in progress, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
 
 app.include_router(favourites.router, prefix="/favourites", tags=["favourites"])
 app.include_router(reading_list.router, prefix="/reading-list", tags=["reading-list"])
@@ -0,0 +1,114 @@
+"""
+Application metrics.
+
+They are registered in the default Prometheus registry, so they are served
+on /metrics together with the HTTP metrics of prometheus-fastapi-instrumentator.
+"""
+from prometheus_client import Counter, Gauge, Histogram
+
+# Password hashing runs on a bounded thread pool, see src/oauth/password_executor.py
+PASSWORD_HASH_QUEUE = Gauge(
+    "password_hash_queue_depth",
+    "Password hashing jobs waiting for a free worker thread",
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Time a request waits for a password to be hashed or verified, queueing included",
+    ["operation"],
+)
+PASSWORD_HASH_COMPUTE_SECONDS = Histogram(
+    "password_hash_compute_seconds",
+    "Time spent hashing or verifying a password on a worker thread, queueing excluded",
+    ["operation"],
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hashing jobs refused because the queue was full",
+)
+
+# Tiered metadata caches, see src/cache/tiered.py
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Cache lookups per cache, level (l1 in-process, l2 shared) and result (hit or miss)",
+    ["cache", "level", "result"],
+)
+CACHE_REFRESHES = Counter(
+    "cache_refreshes_total",
+    "Background refreshes of stale cache entries per cache and result (ok or error)",
+    ["cache", "result"],
+)
+CACHE_ERRORS = Counter(
+    "cache_backend_errors_total",
+    "Calls to the shared cache that failed and were served as misses",
+    ["operation"],
+)
+# Cache sizes and evictions are read at scrape time, see src/cache/stats.py
+
+# Gutendex calls, see src/clients/gutendex_api.py
+GUTENDEX_REQUEST_SECONDS = Histogram(
+    "gutendex_request_seconds",
+    "Latency of Gutendex calls per client method and status (HTTP code, or error)",
+    ["method", "status"],
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+# Circuit breaker in front of Gutendex, see src/clients/circuit_breaker.py
+GUTENDEX_BREAKER_STATE = Gauge(
+    "gutendex_breaker_state",
+    "State of the Gutendex circuit breaker: 0 closed, 1 half-open, 2 open",
+)
+GUTENDEX_BREAKER_TRIPS = Counter(
+    "gutendex_breaker_trips_total",
+    "Times the Gutendex circuit breaker opened",
+)
+
+# Batched activity log writer, see src/activity/writer.py
+ACTIVITY_EVENTS = Counter(
+    "activity_log_events_total",
+    "Activity log events per outcome (written, or dropped because the queue was full)",
+    ["outcome"],
+)
+ACTIVITY_FLUSHES = Counter(
+    "activity_log_flushes_total",
+    "Batched writes of the activity log per result (ok or error)",
+    ["result"],
+)
+ACTIVITY_QUEUE = Gauge(
+    "activity_log_queue_depth",
+    "Activity log events waiting to be written",
+)
+
+# Response compression, see src/middleware/compression.py
+RESPONSE_COMPRESSION_BYTES = Counter(
+    "http_response_compression_bytes_total",
+    "Response body bytes per coding, before (in) and after (out) compression",
+    ["coding", "stage"],
+)
+
+# Database connection pool of the worker, see src/database_pool.py
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time a request waits for a database connection, opening a new one included",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Open database connections of the pool by state (in_use or idle)",
+    ["state"],
+)
+DB_POOL_OVERFLOWS = Counter(
+    "db_pool_overflow_total",
+    "Connections opened beyond DB_POOL_SIZE because every pooled one was in use",
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT seconds without a free connection",
+)
+
+# Queries per CRUD function, see src/cruds/query_metrics.py
+DB_QUERY_SECONDS = Histogram(
+    "db_query_seconds",
+    "Latency of the CRUD functions, connection checkout included",
+    ["function"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
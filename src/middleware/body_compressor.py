@@ -0,0 +1,86 @@
+"""
+Compression of the body chunks of one response, see `CompressingSender`.
+
+gzip comes from the standard library and brotli is a dependency; zstd is
+offered when the optional `zstandard` package is installed. Each coding
+builds a streaming compressor, so large and streamed bodies are compressed
+chunk by chunk.
+"""
+import asyncio
+import zlib
+from typing import Callable, Dict
+
+import brotli
+
+from src.config import COMPRESSION_BROTLI_LEVEL, COMPRESSION_GZIP_LEVEL, COMPRESSION_ZSTD_LEVEL
+from src.metrics import RESPONSE_COMPRESSION_BYTES
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+class Compressor:
+    """Streaming compressor: `compress` chunks in order, then `finish` once."""
+
+    def __init__(self, compress: Callable[[bytes], bytes], finish: Callable[[], bytes]):
+        self.compress = compress
+        self.finish = finish
+
+
+def gzip_compressor() -> Compressor:
+    # wbits=31: DEFLATE with a gzip header and trailer
+    compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+    return Compressor(compressor.compress, compressor.flush)
+
+
+def brotli_compressor() -> Compressor:
+    compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_LEVEL)
+    return Compressor(compressor.process, compressor.finish)
+
+
+def zstd_compressor() -> Compressor:
+    compressor = zstandard.ZstdCompressor(level=COMPRESSION_ZSTD_LEVEL).compressobj()
+    return Compressor(compressor.compress, compressor.flush)
+
+
+# Codings in order of preference when a client accepts several equally
+CODINGS: Dict[str, Callable[[], Compressor]] = {
+    **({"zstd": zstd_compressor} if zstandard is not None else {}),
+    "br": brotli_compressor,
+    "gzip": gzip_compressor,
+}
+
+
+class BodyCompressor:
+    """Streaming compressor of one response body, counted in the metrics."""
+
+    def __init__(self, coding: str, thread_min_bytes: int):
+        """
+        Args:
+            coding (str): Content coding, a key of `CODINGS`.
+            thread_min_bytes (int): Smallest chunk compressed on a worker thread.
+        """
+        self.coding = coding
+        self.thread_min_bytes = thread_min_bytes
+        self._compressor = CODINGS[coding]()
+
+    async def compress(self, chunk: bytes, last: bool) -> bytes:
+        """
+        Compress the next chunk; `last` ends the stream.
+
+        Large chunks are compressed on a worker thread (zlib and brotli
+        release the GIL), so the event loop keeps serving other requests.
+        """
+        if len(chunk) >= self.thread_min_bytes:
+            body = await asyncio.to_thread(self._compress, chunk, last)
+        else:
+            body = self._compress(chunk, last)
+        RESPONSE_COMPRESSION_BYTES.labels(self.coding, "in").inc(len(chunk))
+        RESPONSE_COMPRESSION_BYTES.labels(self.coding, "out").inc(len(body))
+        return body
+
+    def _compress(self, chunk: bytes, last: bool) -> bytes:
+        body = self._compressor.compress(chunk)
+        return body + self._compressor.finish() if last else body
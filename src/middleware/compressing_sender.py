@@ -0,0 +1,69 @@
+"""
+Compression of one response, see `CompressionMiddleware`.
+"""
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message, Send
+
+from .body_compressor import BodyCompressor
+from .encodings import compressible, mark_encoded
+
+
+class CompressingSender:
+    """
+    `send` of one response: holds back the response start until the first
+    body chunk shows whether the response is worth compressing.
+    """
+
+    def __init__(self, send: Send, coding: str, min_bytes: int, thread_min_bytes: int):
+        """
+        Args:
+            send (Send): `send` of the server.
+            coding (str): Negotiated content coding.
+            min_bytes (int): Smallest complete body worth compressing.
+            thread_min_bytes (int): Smallest chunk compressed on a worker thread.
+        """
+        self._send = send
+        self.coding = coding
+        self.min_bytes = min_bytes
+        self.thread_min_bytes = thread_min_bytes
+        self._start: Optional[Message] = None
+        self._compressor: Optional[BodyCompressor] = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] == "http.response.body":
+            if self._start is not None:
+                self._begin(self._start, message)
+            if self._compressor is not None:
+                message = await self._compressed(message)
+        await self._send_start()
+        if message is not None:
+            await self._send(message)
+
+    def _begin(self, start: Message, first: Message) -> None:
+        """On the first chunk: decide whether to compress, and update the headers."""
+        headers = MutableHeaders(scope=start)
+        if not compressible(headers, first, self.min_bytes):
+            return
+        self._compressor = BodyCompressor(self.coding, self.thread_min_bytes)
+        mark_encoded(headers, self.coding)
+
+    async def _send_start(self) -> None:
+        if self._start is not None:
+            start, self._start = self._start, None
+            await self._send(start)
+
+    async def _compressed(self, message: Message) -> Optional[Message]:
+        """The compressed chunk, or None while the compressor buffers."""
+        more_body = message.get("more_body", False)
+        body = await self._compressor.compress(message.get("body", b""), not more_body)
+        if self._start is not None and not more_body:
+            # The whole body at once: its compressed length is known
+            MutableHeaders(scope=self._start)["Content-Length"] = str(len(body))
+        if more_body and not body:
+            return None
+        return {"type": "http.response.body", "body": body, "more_body": more_body}
@@ -0,0 +1,56 @@
+"""
+Response compression.
+
+`CompressionMiddleware` compresses JSON and text responses with the coding
+negotiated from Accept-Encoding (see `src.middleware.encodings`). Bodies
+below COMPRESSION_MIN_BYTES, responses that are already encoded and paths
+in COMPRESSION_EXCLUDE_PATHS are sent as they are. Chunks of at least
+COMPRESSION_THREAD_MIN_BYTES are compressed on a worker thread, so a large
+listing does not hold up the event loop; streamed responses are compressed
+chunk by chunk.
+"""
+from typing import Sequence
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config import (
+    COMPRESSION_EXCLUDE_PATHS,
+    COMPRESSION_MIN_BYTES,
+    COMPRESSION_THREAD_MIN_BYTES,
+)
+from .compressing_sender import CompressingSender
+from .encodings import negotiate
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses for clients that accept it."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        min_bytes: int = COMPRESSION_MIN_BYTES,
+        thread_min_bytes: int = COMPRESSION_THREAD_MIN_BYTES,
+        exclude_paths: Sequence[str] = COMPRESSION_EXCLUDE_PATHS,
+    ):
+        """
+        Args:
+            app (ASGIApp): The wrapped application.
+            min_bytes (int): Smallest complete body worth compressing.
+            thread_min_bytes (int): Smallest chunk compressed on a worker thread.
+            exclude_paths (Sequence[str]): Path prefixes never compressed.
+        """
+        self.app = app
+        self.min_bytes = min_bytes
+        self.thread_min_bytes = thread_min_bytes
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        coding = None
+        if scope["type"] == "http" and not scope["path"].startswith(self.exclude_paths):
+            coding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+        sender = CompressingSender(send, coding, self.min_bytes, self.thread_min_bytes)
+        await self.app(scope, receive, sender)
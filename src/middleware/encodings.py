@@ -0,0 +1,63 @@
+"""
+Negotiation of the content coding and the responses it applies to,
+see `CompressionMiddleware`.
+"""
+from typing import Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import Message
+
+from .body_compressor import CODINGS
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+def _parse(accept_encoding: str) -> Iterable[Tuple[str, float]]:
+    """(coding, q) pairs of an Accept-Encoding header; malformed weights count as 0."""
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        if coding.strip():
+            yield coding.strip().lower(), weight
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    The coding to use for a request, or None to send the body as is.
+
+    Follows RFC 9110: the highest weight wins, `*` stands for every coding
+    not listed and `q=0` refuses a coding; ties go to the server preference.
+    """
+    if not accept_encoding:
+        return None
+    weights = dict(_parse(accept_encoding))
+    wildcard = weights.get("*", 0.0)
+    best = max(CODINGS, key=lambda coding: weights.get(coding, wildcard))
+    return best if weights.get(best, wildcard) > 0 else None
+
+
+def compressible(headers: Headers, first: Message, min_bytes: int) -> bool:
+    """Whether a response is worth compressing, judging by its first body chunk."""
+    if "content-encoding" in headers:
+        return False
+    if not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES):
+        return False
+    return first.get("more_body", False) or len(first.get("body", b"")) >= min_bytes
+
+
+def mark_encoded(headers: MutableHeaders, coding: str) -> None:
+    """Describe the encoded body in the response headers."""
+    headers["Content-Encoding"] = coding
+    headers.add_vary_header("Accept-Encoding")
+    # The encoded body is another representation: a strong validator would lie
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = "W/" + etag
+    # Unknown for a streamed body, set again for a complete one once compressed
+    del headers["Content-Length"]
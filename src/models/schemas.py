@@ -3,7 +3,16 @@ from enum import Enum
 from typing import List, Optional, Dict
 from fastapi import Query
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.config import BATCH_MAX_ITEMS
+
+
+class ReadingStatus(str, Enum):
+    WANT_TO_READ = "want_to_read"
+    READING = "reading"
+    DONE = "done"
+    ALL = "all"
 
 
 class Person(BaseModel):
@@ -34,6 +43,7 @@ class Book(BookBase):
 class BookEnriched(BookBase):
     is_favourite: bool
     became_favourite_at: Optional[datetime]
+    reading_status: Optional[ReadingStatus] = None
 
 
 class FavouriteBook(BaseModel):
@@ -41,13 +51,6 @@ class FavouriteBook(BaseModel):
     added_at: datetime
 
 
-class ReadingStatus(str, Enum):
-    WANT_TO_READ = "want_to_read"
-    READING = "reading"
-    DONE = "done"
-    ALL = "all"
-
-
 class ReadingListEntryBase(BaseModel):
     status: ReadingStatus
 
@@ -77,6 +80,79 @@ class BookID(BaseModel):
     book_id: int
 
 
+class BookIDsBatch(BaseModel):
+    book_ids: List[int] = Field(min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+class ReadingListBatch(BaseModel):
+    entries: List[ReadingListEntryCreate] = Field(min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+class BatchItemStatus(str, Enum):
+    CREATED = "created"
+    EXISTS = "exists"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
+    INVALID = "invalid"
+
+
+class BatchItemResult(BaseModel):
+    book_id: int
+    result: BatchItemStatus
+
+
+class BatchResult(BaseModel):
+    results: List[BatchItemResult]
+
+
+class Action(str, Enum):
+    """Values of the `action` database enum, i.e. kinds of activity log entries."""
+
+    CREATE_ACCOUNT = "create_account"
+    ADD_FAVOURITE = "add_favourite"
+    REMOVE_FAVOURITE = "remove_favourite"
+    ADD_TO_READING_LIST = "add_to_reading_list"
+    CHANGE_READING_STATUS = "change_reading_status"
+    REMOVE_FROM_READING_LIST = "remove_from_reading_list"
+
+
+class ActivityEntry(BaseModel):
+    action: Action
+    book_id: Optional[int] = None
+    old_status: Optional[ReadingStatus] = None
+    new_status: Optional[ReadingStatus] = None
+    created_at: datetime
+
+
+class LibrarySummary(BaseModel):
+    favourites: int = 0
+    want_to_read: int = 0
+    reading: int = 0
+    done: int = 0
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class UnmatchedRow(BaseModel):
+    line: int
+    title: str
+    author: str
+
+
+class ImportResult(BaseModel):
+    rows: int
+    skipped: int
+    matched: int
+    unmatched: int
+    created: int
+    updated: int
+    unmatched_rows: List[UnmatchedRow]
+
+
 class Error(BaseModel):
     code: int
     message: str
@@ -93,3 +169,4 @@ class ListBooksParams(BaseModel):
     search: Optional[str] = Query(default=None)
     topic: Optional[str] = Query(default=None)
     sort: Optional[str] = Query(default=None)
+    cursor: Optional[str] = Query(default=None)
@@ -36,4 +36,14 @@ def create_access_token(
 
 
 def create_access_token_from_user(user: UserBase) -> str:
-    return create_access_token({"login": user.login})
+    """
+    Create an access token for a user.
+
+    The token carries the login and, for stored users, their ID (`uid`),
+    so the user can be loaded by primary key when the token is resolved.
+    """
+    data = {"login": user.login}
+    user_id = getattr(user, "id", None)
+    if user_id is not None:
+        data["uid"] = str(user_id)
+    return create_access_token(data)
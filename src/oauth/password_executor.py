@@ -0,0 +1,82 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from src.metrics import (
+    PASSWORD_HASH_COMPUTE_SECONDS,
+    PASSWORD_HASH_QUEUE,
+    PASSWORD_HASH_REJECTED,
+    PASSWORD_HASH_SECONDS,
+)
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when too many password hashing jobs are already waiting."""
+
+
+class PasswordHashExecutor:
+    """
+    Bounded thread pool for password hashing.
+
+    Hashing is deliberately slow (tens of milliseconds); run inline it would
+    freeze the event loop and stall every other request of the worker.
+    argon2-cffi and bcrypt release the GIL while hashing, so the threads run
+    in parallel with the loop and with each other.
+
+    At most `workers` jobs run at once and at most `max_queue` more may wait;
+    beyond that `run` fails fast with PasswordHashingBusy instead of letting
+    a login storm build an unbounded backlog.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        """
+        Args:
+            workers (int): Number of hashing threads.
+            max_queue (int): Number of jobs allowed to wait for a thread.
+        """
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="password-hash")
+        self._workers = workers
+        self._max_queue = max_queue
+        # Submitted and unfinished jobs; only touched from the event loop
+        self._pending = 0
+
+    def _update_queue_depth(self) -> None:
+        PASSWORD_HASH_QUEUE.set(max(self._pending - self._workers, 0))
+
+    @staticmethod
+    def _timed(operation: str, func: Callable[..., T], *args: Any) -> T:
+        # Runs on the worker thread: the hashing cost alone, without the wait for a thread
+        with PASSWORD_HASH_COMPUTE_SECONDS.labels(operation).time():
+            return func(*args)
+
+    async def run(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run `func(*args)` on a hashing thread.
+
+        Args:
+            operation (str): Metric label, e.g. "hash" or "verify".
+            func (Callable): The blocking hashing function.
+            *args: Its arguments.
+
+        Returns:
+            Whatever `func` returns.
+
+        Raises:
+            PasswordHashingBusy: If the queue is full.
+        """
+        if self._pending >= self._workers + self._max_queue:
+            PASSWORD_HASH_REJECTED.inc()
+            raise PasswordHashingBusy()
+        self._pending += 1
+        self._update_queue_depth()
+        try:
+            with PASSWORD_HASH_SECONDS.labels(operation).time():
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._executor, self._timed, operation, func, *args
+                )
+        finally:
+            self._pending -= 1
+            self._update_queue_depth()
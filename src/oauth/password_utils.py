@@ -1,4 +1,10 @@
+from typing import Optional, Tuple
+
+from src.config import PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE
 from .auth_algorithm import pwd_context
+from .password_executor import PasswordHashExecutor
+
+password_hasher = PasswordHashExecutor(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE)
 
 
 def verify_password(plain_password, hashed_password):
@@ -7,3 +13,22 @@ def verify_password(plain_password, hashed_password):
 
 def get_password_hash(password):
     return pwd_context.hash(password)
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password with the default scheme without blocking the event loop."""
+    return await password_hasher.run("hash", pwd_context.hash, password)
+
+
+async def check_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password without blocking the event loop.
+
+    Returns:
+        A tuple (valid, new_hash) where new_hash is set when the stored hash
+        uses a deprecated scheme (bcrypt) or outdated cost settings and should
+        be replaced by it.
+    """
+    return await password_hasher.run(
+        "verify", pwd_context.verify_and_update, plain_password, hashed_password
+    )
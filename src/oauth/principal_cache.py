@@ -0,0 +1,89 @@
+"""
+Cache of authenticated principals.
+
+Resolving a bearer token costs a JWT signature check and a SELECT of the
+user on every authenticated request. Once a token has been verified, the
+user it resolved to is kept here, keyed by a digest of the token, so later
+requests with the same token skip both.
+
+Entries never outlive their token and expire after PRINCIPAL_CACHE_TTL
+seconds at the latest. Changes to a user made through the ORM drop that
+user's entries in this process; other workers notice within the TTL.
+"""
+import hashlib
+import time
+from typing import Optional
+
+from sqlalchemy import event
+
+from src.cache.memory import LRUCache
+from src.cache.stats import track_cache
+from src.config import PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL
+from src.models.orm_models import User
+from src.models.user_schemas import UserFromDB
+
+
+class PrincipalCache:
+    """Bounded TTL cache from token digest to a `UserFromDB` snapshot."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize (int): Maximum number of tokens remembered.
+            ttl (float): Longest time an entry is trusted, 0 disables the cache.
+        """
+        self.ttl = ttl
+        self._entries = LRUCache(maxsize)
+        track_cache("principals", self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        # Tokens are credentials: only their digest is kept around
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[UserFromDB]:
+        """The user a previously verified token resolved to, or None."""
+        return self._entries.get(self._key(token))
+
+    def set(self, token: str, user: User, expires_at: Optional[float] = None) -> UserFromDB:
+        """
+        Remember the user a token was verified for.
+
+        Args:
+            token (str): The verified bearer token.
+            user (User): The user it resolved to.
+            expires_at (Optional[float]): The token's `exp` claim (UNIX time).
+
+        Returns:
+            UserFromDB: The snapshot handed out for this token from now on.
+        """
+        snapshot = UserFromDB(
+            id=str(user.id),
+            login=user.login,
+            username=user.username,
+            created_at=user.created_at,
+        )
+        ttl = self.ttl
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl > 0:
+            self._entries.set(self._key(token), snapshot, ttl=ttl)
+        return snapshot
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Forget every token of a user, e.g. after the user changed."""
+        self._entries.remove_if(lambda snapshot: snapshot.id == user_id)
+
+    def clear(self) -> None:
+        """Forget every token."""
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _forget_changed_user(mapper, connection, target: User) -> None:
+    """ORM hook: a changed or deleted user must be looked up again."""
+    principal_cache.invalidate_user(str(target.id))
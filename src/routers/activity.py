@@ -0,0 +1,52 @@
+"""
+The user's own activity feed, read from the partitioned activity log.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cruds.activity_crud import get_activity_page
+from src.cruds.users_crud import get_current_user
+from src.database import get_async_session
+from src.models.schemas import ActivityEntry
+from src.models.user_schemas import UserInfo
+
+router = APIRouter()
+
+
+@router.get("/me/activity", response_model=List[ActivityEntry], summary="Get own activity")
+async def get_activity(
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    user: UserInfo = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+) -> List[ActivityEntry]:
+    """
+    List the current user's activity (favourites, reading list changes), newest first.
+
+    - **since**, **until**: Optional time range, only the log partitions it
+      overlaps are read
+    - **cursor**: `X-Next-Cursor` header of the previous page
+    - **returns**: Activity entries; `X-Next-Cursor` is set when more follow
+    """
+    try:
+        rows, next_cursor = await get_activity_page(user, db, limit, since, until, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return [
+        ActivityEntry(
+            action=row.action,
+            book_id=row.book_id,
+            old_status=row.old_status,
+            new_status=row.new_status,
+            created_at=row.created_at,
+        )
+        for row in rows
+    ]
@@ -0,0 +1,69 @@
+from typing import Dict, Iterable, List
+
+from src.clients.gutendex_client import GutendexClient
+
+from src.models.schemas import (
+    BatchItemResult,
+    BatchItemStatus,
+    BatchResult,
+    ReadingListBatch,
+    ReadingStatus,
+)
+from .error_conversions import GUTENDEX_ERRORS, httpx_error_to_fastapi_error
+
+
+def batch_results(
+    book_ids: Iterable[int],
+    outcomes: Dict[int, BatchItemStatus],
+    default: BatchItemStatus,
+) -> BatchResult:
+    """
+    Build the per-item response of a bulk endpoint.
+
+    Args:
+        book_ids: Requested IDs, in request order and without duplicates.
+        outcomes: Result of the items that were found and written.
+        default: Result of every other item (e.g. `exists` or `not_found`).
+    """
+    return BatchResult(
+        results=[
+            BatchItemResult(book_id=book_id, result=outcomes.get(book_id, default))
+            for book_id in book_ids
+        ]
+    )
+
+
+def batch_statuses(batch: ReadingListBatch) -> Dict[int, ReadingStatus]:
+    """
+    Requested status of each book in a reading list batch, in request order.
+
+    Later entries for the same book win, as if they had been sent one by one.
+    """
+    return {entry.book_id: entry.status for entry in batch.entries}
+
+
+def invalid_statuses(statuses: Dict[int, ReadingStatus]) -> Dict[int, BatchItemStatus]:
+    """Mark the books requested with `all`, a listing filter rather than a status."""
+    return {
+        book_id: BatchItemStatus.INVALID
+        for book_id, status in statuses.items() if status == ReadingStatus.ALL
+    }
+
+
+async def unknown_books(
+    client: GutendexClient, book_ids: List[int]
+) -> Dict[int, BatchItemStatus]:
+    """
+    Look up a whole batch with one Gutendex call and mark the unknown books.
+
+    Raises:
+        HTTPException: If Gutendex answers the lookup with 404,
+            or with 503 if Gutendex is unavailable.
+    """
+    try:
+        books = await client.get_books(book_ids)
+    except GUTENDEX_ERRORS as exc:
+        httpx_error_to_fastapi_error(exc, "Books not found in Gutendex")
+    return {
+        book_id: BatchItemStatus.NOT_FOUND for book_id in book_ids if book_id not in books
+    }
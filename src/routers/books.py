@@ -1,44 +1,68 @@
-import httpx
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
+from src.config import BOOK_MAX_AGE, BOOK_SEARCH_BACKEND, BOOKS_LIST_MAX_AGE
 from src.clients.gutendex_client import GutendexClient, get_gutendex_client
+from src.clients.gutendex_params import normalize_list_params
 from src.models.schemas import EnrichedBooksList, Error, ListBooksParams, BookEnriched
-from .error_conversions import httpx_error_to_fastapi_error
+from .conditional_get import conditional_response
+from .error_conversions import GUTENDEX_ERRORS, httpx_error_to_fastapi_error
 from .users import get_current_user, UserInfo
-from src.cruds.favourites_crud import get_all_favourites_of_user, book_favourite_of_user
+from src.cruds.book_states_crud import get_book_states
+from src.cruds.catalogue_search_crud import search_books
 from src.database import get_async_session, AsyncSession
 
 router = APIRouter()
 
 
-async def enrich_books(books, user, db):
+def enrich_books(books, states):
     """
-    Enrich a list of books with favourite metadata for a specific user.
+    Enrich a page of books with the user's favourite and reading list state.
 
-    Adds 'is_favourite' and 'became_favourite_at' fields to each book in the results
-    based on whether the book is marked as a favourite by the user.
+    Adds 'is_favourite', 'became_favourite_at' and 'reading_status' fields to
+    each book in the results.
 
     Args:
         books (dict): Dictionary containing book data with a 'results' list.
-        user (UserInfo): The currently authenticated user.
-        db (AsyncSession): Async SQLAlchemy database session.
+        states (dict): (became_favourite_at, reading_status) keyed by book ID,
+            as returned by `get_book_states` for the IDs of the page.
 
     Returns:
         dict: The enriched books dictionary with updated 'results'.
     """
-    user_current_favs = await get_all_favourites_of_user(user, db)
     for book in books['results']:
-        if book['id'] in user_current_favs:
-            book['is_favourite'] = True
-            book['became_favourite_at'] = user_current_favs[book['id']]
-        else:
-            book['is_favourite'] = False
-            book['became_favourite_at'] = None
+        became_favourite_at, reading_status = states.get(book['id'], (None, None))
+        book['is_favourite'] = became_favourite_at is not None
+        book['became_favourite_at'] = became_favourite_at
+        book['reading_status'] = reading_status
     return books
 
 
-@router.get("/", response_model=EnrichedBooksList)
+async def fetch_books(params: ListBooksParams, client: GutendexClient, db: AsyncSession):
+    """
+    Fetch a page of books from the configured source.
+
+    `search` and `topic` queries go to the local ranked search when
+    BOOK_SEARCH_BACKEND is "local"; everything else is listed by Gutendex.
+
+    Raises:
+        HTTPException (400): If the pagination cursor is malformed.
+    """
+    if BOOK_SEARCH_BACKEND != "local" or not (params.search or params.topic):
+        return await client.list_books(**params.model_dump(exclude_none=True, exclude={"cursor"}))
+    try:
+        return await search_books(db, dict(normalize_list_params(**params.model_dump())))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get(
+    "/",
+    response_model=EnrichedBooksList,
+    responses={304: {"description": "Not modified"}},
+)
 async def list_books(
+    request: Request,
+    response: Response,
     params: ListBooksParams = Depends(),
     client: GutendexClient = Depends(get_gutendex_client),
     user: UserInfo = Depends(get_current_user),
@@ -47,28 +71,41 @@ async def list_books(
     """
     Retrieve a list of books with optional filtering and enrichment for favourites.
 
-    Uses Gutendex API to fetch books and enriches them with favourite status for
-    the authenticated user.
+    Uses Gutendex API (or the local search, see `fetch_books`) to fetch books
+    and enriches them with the favourite and reading list state of the
+    authenticated user, looked up for the books of the page only.
+    The response is tagged for conditional requests, see `conditional_get`.
 
     Args:
+        request (Request): Incoming request, read for If-None-Match.
+        response (Response): Outgoing response, used to set the caching headers.
         params (ListBooksParams): Query parameters for filtering/sorting books.
         client (GutendexClient): Client for interacting with Gutendex API.
         user (UserInfo): The currently authenticated user.
         db (AsyncSession): Async SQLAlchemy session.
 
     Returns:
-        EnrichedBooksList: List of books with additional user-specific metadata.
+        EnrichedBooksList: List of books with additional user-specific metadata,
+        or an empty 304 if the client's copy (If-None-Match) is current.
     """
     try:
-        books = await client.list_books(**params.model_dump(exclude_none=True))
-        enriched = await enrich_books(books, user, db)
-        return EnrichedBooksList(**enriched)
-    except httpx.HTTPStatusError as exc:
+        books = await fetch_books(params, client, db)
+        states = await get_book_states(user, db, (book['id'] for book in books['results']))
+        enriched = enrich_books(books, states)
+        not_modified = conditional_response(request, response, enriched, BOOKS_LIST_MAX_AGE)
+        return not_modified or EnrichedBooksList(**enriched)
+    except GUTENDEX_ERRORS as exc:
         httpx_error_to_fastapi_error(exc, "Books are not found")
 
 
-@router.get("/{id}", response_model=BookEnriched, responses={404: {"model": Error}})
+@router.get(
+    "/{id}",
+    response_model=BookEnriched,
+    responses={304: {"description": "Not modified"}, 404: {"model": Error}},
+)
 async def get_book(
+    request: Request,
+    response: Response,
     id: int,
     client: GutendexClient = Depends(get_gutendex_client),
     user: UserInfo = Depends(get_current_user),
@@ -78,25 +115,30 @@ async def get_book(
     Retrieve a single book by its ID and enrich it with favourite metadata.
 
     Fetches book metadata from Gutendex API and annotates it with the
-    user's favourite status.
+    user's favourite and reading list state. The response is tagged for
+    conditional requests, see `conditional_get`.
 
     Args:
+        request (Request): Incoming request, read for If-None-Match.
+        response (Response): Outgoing response, used to set the caching headers.
         id (int): The ID of the book to retrieve.
         client (GutendexClient): Gutendex API client.
         user (UserInfo): The currently authenticated user.
         db (AsyncSession): Async SQLAlchemy session.
 
     Returns:
-        BookEnriched: Book data enriched with favourite status.
+        BookEnriched: Book data enriched with favourite and reading status,
+        or an empty 304 if the client's copy (If-None-Match) is current.
 
     Raises:
         HTTPException (404): If the book is not found in Gutendex.
+        HTTPException (503): If Gutendex is unavailable.
     """
     try:
         data = await client.get_book(id)
-        is_favourite, became_fav_at = await book_favourite_of_user(user, id, db)
-        return BookEnriched(**data,
-                            is_favourite=is_favourite,
-                            became_favourite_at=became_fav_at)
-    except httpx.HTTPStatusError as exc:
+        states = await get_book_states(user, db, [id])
+        book = enrich_books({'results': [data]}, states)['results'][0]
+        not_modified = conditional_response(request, response, book, BOOK_MAX_AGE)
+        return not_modified or BookEnriched(**book)
+    except GUTENDEX_ERRORS as exc:
         httpx_error_to_fastapi_error(exc, "Book not found")
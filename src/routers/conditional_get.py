@@ -0,0 +1,56 @@
+"""
+Conditional GET for the book endpoints.
+
+Responses carry a strong ETag computed from the enriched payload, i.e. the
+upstream book data plus the user's favourite and reading list state, and a
+private Cache-Control header. A client sending a matching If-None-Match gets
+an empty 304 instead of the full body.
+"""
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def payload_etag(payload: Any) -> str:
+    """Strong ETag of a JSON-like payload; datetimes are hashed as strings."""
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return '"{}"'.format(hashlib.blake2b(body.encode(), digest_size=16).hexdigest())
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header names `etag` (weak comparison, as RFC 9110 asks)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def conditional_response(
+    request: Request, response: Response, payload: Any, max_age: int
+) -> Optional[Response]:
+    """
+    Set the caching headers of a book response.
+
+    Args:
+        request (Request): Incoming request, read for If-None-Match.
+        response (Response): Outgoing response the headers are set on.
+        payload: The enriched payload about to be returned.
+        max_age (int): Seconds the client may reuse the response unchecked.
+
+    Returns:
+        Optional[Response]: An empty 304 to return instead of the payload if
+        the client already holds it, None otherwise.
+    """
+    headers = {
+        "ETag": payload_etag(payload),
+        "Cache-Control": f"private, max-age={max_age}",
+        # The payload depends on the user behind the token
+        "Vary": "Authorization",
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -1,8 +1,29 @@
 import httpx
 from fastapi import HTTPException
 
+from src.clients.gutendex_errors import GutendexUnavailable, is_upstream_failure
 
-def httpx_error_to_fastapi_error(exc: httpx.HTTPStatusError, not_found_message: str):
-    if exc.response.status_code == 404:
+# Everything a Gutendex lookup may raise that `httpx_error_to_fastapi_error` handles
+GUTENDEX_ERRORS = (httpx.HTTPStatusError, httpx.TransportError, GutendexUnavailable)
+
+
+def httpx_error_to_fastapi_error(exc: Exception, not_found_message: str):
+    """
+    Turn a failed Gutendex lookup into the matching API error.
+
+    Raises:
+        HTTPException: 404 with `not_found_message` if the book is unknown
+            (also when the 404 was served from the negative cache), 503 with
+            Retry-After if Gutendex is down or its circuit breaker is open.
+        Exception: `exc` itself for any other error.
+    """
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 404:
         raise HTTPException(status_code=404, detail=not_found_message)
+    if is_upstream_failure(exc):
+        retry_after = getattr(exc, "retry_after", 1)
+        raise HTTPException(
+            status_code=503,
+            detail="Gutendex is unavailable, please retry later",
+            headers={"Retry-After": str(retry_after)},
+        )
     raise exc
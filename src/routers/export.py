@@ -0,0 +1,81 @@
+"""
+Export of the user's whole library (favourites and reading list) as NDJSON or CSV.
+
+Rows are read through a server-side cursor and the metadata of their books
+is resolved one chunk at a time with a batched Gutendex lookup, so the
+export is streamed with flat memory use however large the library is.
+"""
+import logging
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from src.clients.gutendex_client import GutendexClient, get_gutendex_client
+from src.config import EXPORT_CHUNK_SIZE
+from src.cruds.library_crud import stream_library
+from src.cruds.users_crud import get_current_user
+from src.database import async_session_maker
+from src.models.schemas import ExportFormat
+from src.models.user_schemas import UserInfo
+from .error_conversions import GUTENDEX_ERRORS
+from .export_formats import EXPORT_WRITERS, Books, ExportWriter
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/me/export",
+    summary="Export own library",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+)
+async def export_library(
+    format: ExportFormat = ExportFormat.NDJSON,
+    user: UserInfo = Depends(get_current_user),
+    gut_client: GutendexClient = Depends(get_gutendex_client),
+) -> StreamingResponse:
+    """
+    Download every favourite and reading list entry of the current user.
+
+    - **format**: `ndjson` (one JSON object per book, with its full metadata)
+      or `csv` (main book fields as columns)
+    - **returns**: The export, streamed as it is read; books whose metadata
+      cannot be resolved are exported without it
+    """
+    writer = EXPORT_WRITERS[format]
+    return StreamingResponse(
+        export_lines(user, gut_client, writer),
+        media_type=writer.media_type,
+        headers={"Content-Disposition": f'attachment; filename="library.{format.value}"'},
+    )
+
+
+async def export_lines(
+    user: UserInfo, client: GutendexClient, writer: ExportWriter
+) -> AsyncIterator[bytes]:
+    """
+    Produce the export chunk by chunk.
+
+    The response dependencies are finished once streaming starts, so the
+    export reads through a session of its own.
+    """
+    yield writer.header
+    async with async_session_maker() as session:
+        async for rows in stream_library(user, session, EXPORT_CHUNK_SIZE):
+            books = await lookup_books(client, [row.book_id for row in rows])
+            yield writer.encode(rows, books)
+
+
+async def lookup_books(client: GutendexClient, book_ids) -> Books:
+    """
+    Metadata of one chunk; none if Gutendex fails, as the response has started already.
+    The books are not added to the cache: a whole library would evict the working set.
+    """
+    try:
+        return await client.get_books(book_ids, populate=False)
+    except GUTENDEX_ERRORS as exc:
+        logger.warning("Export continues without metadata for %d books: %r", len(book_ids), exc)
+        return {}
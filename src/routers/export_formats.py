@@ -0,0 +1,81 @@
+"""
+Serialization of library exports, one chunk of rows at a time.
+
+Every row is a book of the library with its favourite and reading list
+state; `book` is its Gutendex metadata, None when it could not be resolved.
+"""
+import csv
+import io
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence
+
+import orjson
+
+from src.models.schemas import ExportFormat
+
+Books = Dict[int, Dict[str, Any]]
+
+CSV_COLUMNS = (
+    "book_id", "title", "authors", "languages",
+    "favourite_since", "reading_status", "reading_since", "reading_updated_at",
+)
+
+
+class ExportWriter(NamedTuple):
+    """How an export format starts and encodes its chunks."""
+
+    media_type: str
+    header: bytes
+    encode: Callable[[Sequence[Any], Books], bytes]
+
+
+def _record(row, book: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "book_id": row.book_id,
+        "favourite_since": row.favourite_since,
+        "reading_status": row.reading_status,
+        "reading_since": row.reading_since,
+        "reading_updated_at": row.reading_updated_at,
+        "book": book,
+    }
+
+
+def ndjson_chunk(rows: Sequence[Any], books: Books) -> bytes:
+    """One JSON object per line, with the full book metadata."""
+    return b"".join(
+        orjson.dumps(_record(row, books.get(row.book_id))) + b"\n" for row in rows
+    )
+
+
+def _csv_line(record: Dict[str, Any]) -> list:
+    book = record.pop("book") or {}
+    record.update(
+        title=book.get("title"),
+        authors="; ".join(author["name"] for author in book.get("authors", [])),
+        languages="; ".join(book.get("languages", [])),
+    )
+    # Timestamps in ISO 8601, as in the JSON responses
+    return [
+        value.isoformat() if hasattr(value, "isoformat") else value
+        for value in map(record.get, CSV_COLUMNS)
+    ]
+
+
+def csv_chunk(rows: Sequence[Any], books: Books) -> bytes:
+    """CSV lines with the main book fields flattened into columns."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        _csv_line(_record(row, books.get(row.book_id))) for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+def _csv_header() -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(CSV_COLUMNS)
+    return buffer.getvalue().encode()
+
+
+EXPORT_WRITERS = {
+    ExportFormat.NDJSON: ExportWriter("application/x-ndjson", b"", ndjson_chunk),
+    ExportFormat.CSV: ExportWriter("text/csv", _csv_header(), csv_chunk),
+}
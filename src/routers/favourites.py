@@ -2,63 +2,81 @@ from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.database import get_async_session
-from sqlalchemy import text
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from src.models.schemas import Book, FavouriteBook, BookID
 from src.models.user_schemas import UserFromDB
 from .users import get_current_user, UserInfo
+from .error_conversions import GUTENDEX_ERRORS, httpx_error_to_fastapi_error
+from .favourites_batch import router as batch_router
+from .json_responses import book_payload, json_response
 
-from typing import List
+from typing import List, Optional
 
 from src.clients.gutendex_client import GutendexClient, get_gutendex_client
+from src.clients.book_loader import BookLoader, get_book_loader
+from src.cruds.favourites_crud import add_favourites, get_favourites_page, remove_favourites
+from src.activity.events import Action
+from src.activity.writer import activity_log
 
 router = APIRouter()
+# Included first: `/{book_id}` would otherwise try to parse "batch" as an ID
+router.include_router(batch_router)
 
 
 @router.get("/", response_model=List[FavouriteBook])
 async def get_favourites(
+    response: Response,
     offset: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     user: UserFromDB = Depends(get_current_user),
-    gut_client: GutendexClient = Depends(get_gutendex_client),
+    book_loader: BookLoader = Depends(get_book_loader),
     db: AsyncSession = Depends(get_async_session),
 ):
     """
     Retrieve a paginated list of the current user's favourite books.
 
+    When more favourites follow, the `X-Next-Cursor` response header holds a
+    token to pass as `cursor` for the next page. Cursor pages stay fast however
+    deep they are; `offset` is kept for existing clients.
+
     Args:
+        response (Response): Outgoing response, used to set `X-Next-Cursor`.
         offset (int): Number of records to skip for pagination. Default is 0.
         limit (int): Maximum number of records to return. Default is 20.
+        cursor (Optional[str]): `X-Next-Cursor` of the previous page; takes
+            precedence over `offset`.
         user (UserFromDB): The currently authenticated user.
-        gut_client (GutendexClient): Client to fetch book metadata from Gutendex.
+        book_loader (BookLoader): Batch loader for book metadata from Gutendex.
         db (AsyncSession): Database session dependency.
 
     Returns:
         List[FavouriteBook]: A list of the user's favourite books with metadata and timestamps.
 
     Raises:
-        HTTPException: If a book is not found in Gutendex.
+        HTTPException: If the cursor is malformed (400), a book is not
+            found in Gutendex (404) or Gutendex is unavailable (503).
     """
-    result = await db.execute(
-        text(
-            """SELECT book_id, created_at FROM favourite_books WHERE
-             user_id = :user_id ORDER BY created_at DESC OFFSET :offset LIMIT :limit"""
-        ),
-        {"user_id": user.id, "offset": offset, "limit": limit},
-    )
-    rows = result.all()
-    favourites: List[FavouriteBook] = []
-    for book_id, added_at in rows:
-        try:
-            metadata = await gut_client.get_book(book_id)
-        except Exception:
+    try:
+        rows, next_cursor = await get_favourites_page(user, db, limit, offset, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    try:
+        books = await book_loader.load_many(book_id for book_id, _ in rows)
+    except GUTENDEX_ERRORS as exc:
+        httpx_error_to_fastapi_error(exc, "Books not found in Gutendex")
+    favourites = []
+    for (book_id, added_at), metadata in zip(rows, books):
+        if metadata is None:
             raise HTTPException(
                 status_code=404, detail=f"Book {book_id} not found in Gutendex"
             )
-        book = Book(**metadata)
-        favourites.append(FavouriteBook(book=book, added_at=added_at))
-    return favourites
+        favourites.append({"book": book_payload(metadata), "added_at": added_at})
+    # Built from validated parts: skips the re-validation against the response model
+    return json_response(favourites, response)
 
 
 @router.post("/", response_model=FavouriteBook, status_code=201)
@@ -81,24 +99,18 @@ async def add_favourite(
         FavouriteBook: The newly added favourite book with metadata and timestamp.
 
     Raises:
-        HTTPException: If the book is not found in Gutendex.
+        HTTPException: If the book is not found in Gutendex (404)
+            or Gutendex is unavailable (503).
     """
     try:
         data = await gut_client.get_book(book.book_id)
-    except Exception:
-        raise HTTPException(
-            status_code=404, detail=f"Book {book.book_id} not found in Gutendex"
-        )
+    except GUTENDEX_ERRORS as exc:
+        httpx_error_to_fastapi_error(exc, f"Book {book.book_id} not found in Gutendex")
     added_at = datetime.now()
-    await session.execute(
-        text(
-            "INSERT INTO favourite_books (user_id, book_id, created_at, updated_at)"
-            " VALUES (:user_id, :book_id, :added_at, :added_at)"
-            " ON CONFLICT DO NOTHING"
-        ),
-        {"user_id": str(user.id), "book_id": book.book_id, "added_at": added_at},
-    )
+    created = await add_favourites(user, session, [book.book_id], added_at)
     await session.commit()
+    for book_id in created:
+        activity_log.record(Action.ADD_FAVOURITE, user.id, book_id)
     inserted_book = Book(**data)
     return FavouriteBook(book=inserted_book, added_at=added_at)
 
@@ -123,10 +135,7 @@ async def remove_favourite(
     Notes:
         Returns a 204 No Content status on successful deletion.
     """
-    await session.execute(
-        text(
-            "DELETE FROM favourite_books WHERE user_id = :user_id AND book_id = :book_id"
-        ),
-        {"user_id": str(user.id), "book_id": book_id},
-    )
+    deleted = await remove_favourites(user, session, [book_id])
     await session.commit()
+    if deleted:
+        activity_log.record(Action.REMOVE_FAVOURITE, user.id, book_id)
@@ -0,0 +1,83 @@
+"""
+Bulk variants of the favourites endpoints, for clients syncing a library.
+
+A batch is validated with one Gutendex lookup and written with one statement
+in one transaction; the response reports the outcome of every book.
+"""
+from datetime import datetime
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.activity.events import Action
+from src.activity.writer import activity_log
+from src.clients.gutendex_client import GutendexClient, get_gutendex_client
+from src.config import BATCH_MAX_ITEMS
+from src.cruds.favourites_crud import add_favourites, remove_favourites
+from src.database import get_async_session
+from src.models.schemas import BatchItemStatus, BatchResult, BookIDsBatch
+from .batch_results import batch_results, unknown_books
+from .users import get_current_user, UserInfo
+
+router = APIRouter()
+
+
+@router.post("/batch", response_model=BatchResult)
+async def add_favourites_batch(
+    batch: BookIDsBatch,
+    user: UserInfo = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+    gut_client: GutendexClient = Depends(get_gutendex_client),
+):
+    """
+    Add several books to the current user's favourites at once.
+
+    All books are checked with one batched Gutendex lookup and written with one
+    INSERT in a single transaction.
+
+    Args:
+        batch (BookIDsBatch): IDs of the books to add, at most BATCH_MAX_ITEMS.
+        user (UserInfo): The currently authenticated user.
+        session (AsyncSession): Database session dependency.
+        gut_client (GutendexClient): Client to fetch book metadata from Gutendex.
+
+    Returns:
+        BatchResult: Per book `created`, `exists` (already a favourite)
+            or `not_found` (unknown to Gutendex, not added).
+    """
+    book_ids = list(dict.fromkeys(batch.book_ids))
+    outcomes = await unknown_books(gut_client, book_ids)
+    found = [book_id for book_id in book_ids if book_id not in outcomes]
+    created = await add_favourites(user, session, found, datetime.now())
+    await session.commit()
+    for book_id in created:
+        activity_log.record(Action.ADD_FAVOURITE, user.id, book_id)
+    outcomes.update(dict.fromkeys(created, BatchItemStatus.CREATED))
+    return batch_results(book_ids, outcomes, BatchItemStatus.EXISTS)
+
+
+@router.delete("/batch", response_model=BatchResult)
+async def remove_favourites_batch(
+    book_ids: List[int] = Query(..., min_length=1, max_length=BATCH_MAX_ITEMS),
+    user: UserInfo = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Remove several books from the current user's favourites at once.
+
+    Args:
+        book_ids (List[int]): IDs to remove, repeated as `?book_ids=1&book_ids=2`.
+        user (UserInfo): The currently authenticated user.
+        session (AsyncSession): Database session dependency.
+
+    Returns:
+        BatchResult: Per book `deleted` or `not_found` (was not a favourite).
+    """
+    book_ids = list(dict.fromkeys(book_ids))
+    deleted = await remove_favourites(user, session, book_ids)
+    await session.commit()
+    for book_id in deleted:
+        activity_log.record(Action.REMOVE_FAVOURITE, user.id, book_id)
+    outcomes = dict.fromkeys(deleted, BatchItemStatus.DELETED)
+    return batch_results(book_ids, outcomes, BatchItemStatus.NOT_FOUND)
@@ -0,0 +1,91 @@
+"""
+Rows of an uploaded reading history CSV file, read incrementally.
+
+Two layouts are understood: Goodreads exports ("Title", "Author",
+"Exclusive Shelf", "Date Added", "Date Read"), whose books are matched
+by title and author, and the CSV library export of this API ("book_id",
+"reading_status", "reading_since", "reading_updated_at").
+"""
+import csv
+import io
+from datetime import datetime
+from itertools import islice
+from typing import IO, AsyncIterator, Dict, List, NamedTuple, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.models.schemas import ReadingStatus
+
+GOODREADS_SHELVES = {
+    "to-read": ReadingStatus.WANT_TO_READ,
+    "currently-reading": ReadingStatus.READING,
+    "read": ReadingStatus.DONE,
+}
+EXPORTED_STATUSES = {
+    status.value: status for status in ReadingStatus if status != ReadingStatus.ALL
+}
+
+
+class ImportRow(NamedTuple):
+    """One data row; `status` is None for rows that are not on a reading shelf."""
+
+    line: int
+    book_id: Optional[int]
+    title: str
+    author: str
+    status: Optional[ReadingStatus]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+def _field(record: Dict[str, Optional[str]], *names: str) -> str:
+    """The first non-empty of the named fields, stripped."""
+    return next((value.strip() for value in map(record.get, names) if value), "")
+
+
+def _date(value: str) -> Optional[datetime]:
+    # Goodreads writes 2025/05/01, the export ISO 8601 timestamps
+    try:
+        return datetime.fromisoformat(value.replace("/", "-")).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def parse_row(line: int, record: Dict[str, Optional[str]]) -> ImportRow:
+    """Read a CSV record in either layout."""
+    book_id = _field(record, "book_id")
+    if "reading_status" in record:
+        status = EXPORTED_STATUSES.get(_field(record, "reading_status"))
+    else:
+        status = GOODREADS_SHELVES.get(_field(record, "Exclusive Shelf"))
+    return ImportRow(
+        line=line,
+        book_id=int(book_id) if book_id.isdigit() else None,
+        title=_field(record, "Title", "title"),
+        author=_field(record, "Author", "authors"),
+        status=status,
+        created_at=_date(_field(record, "Date Added", "reading_since")),
+        updated_at=_date(_field(record, "Date Read", "reading_updated_at")),
+    )
+
+
+async def read_rows(file: IO[bytes], batch_size: int) -> AsyncIterator[List[ImportRow]]:
+    """
+    Yield the rows of an uploaded CSV file in batches of `batch_size`.
+
+    The file is decoded and parsed on a worker thread one batch at a time,
+    so neither the event loop nor memory depends on the size of the upload.
+
+    Raises:
+        csv.Error: If the file is not valid CSV.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", errors="replace", newline="")
+    reader = csv.DictReader(text)
+
+    def next_batch() -> List[ImportRow]:
+        return [parse_row(reader.line_num, record) for record in islice(reader, batch_size)]
+
+    while batch := await run_in_threadpool(next_batch):
+        yield batch
+    # Leave the upload open for the request to close
+    text.detach()
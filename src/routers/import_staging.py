@@ -0,0 +1,111 @@
+"""
+Staging of reading history imports: the books of every batch of rows are
+resolved, and the outcome of the import is counted.
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.clients.book_matcher import BookMatcher, match_key
+from src.clients.gutendex_client import GutendexClient
+from src.config import IMPORT_MAX_REPORTED
+from src.cruds.reading_list_import_crud import Change, StagedRow
+from src.models.schemas import ImportResult, UnmatchedRow
+from .import_rows import ImportRow
+
+
+async def resolve_books(
+    rows: Sequence[ImportRow], client: GutendexClient, matcher: BookMatcher
+) -> List[Optional[int]]:
+    """
+    Find the Gutendex book of every row.
+
+    Rows with a book ID are checked with one batched lookup, the others are
+    matched by title and author; both run concurrently.
+
+    Args:
+        rows (Sequence[ImportRow]): A batch of rows.
+        client (GutendexClient): Client checking the book IDs.
+        matcher (BookMatcher): Matcher of the titles and authors.
+
+    Returns:
+        list: Book ID of each row, None for rows without a match.
+    """
+    book_ids = [row.book_id for row in rows if row.book_id is not None]
+    keys = [match_key(row.title, row.author) for row in rows]
+    known, matches = await asyncio.gather(
+        _known_books(client, book_ids),
+        matcher.match(key for row, key in zip(rows, keys) if row.book_id is None),
+    )
+    return [
+        # A row with an unknown book ID is not matched by its title instead
+        matches[key] if row.book_id is None else (row.book_id if row.book_id in known else None)
+        for row, key in zip(rows, keys)
+    ]
+
+
+async def _known_books(client: GutendexClient, book_ids: List[int]) -> Dict[int, Any]:
+    """Books among `book_ids` that Gutendex knows; no lookup at all for none."""
+    return await client.get_books(book_ids) if book_ids else {}
+
+
+class ImportSummary:
+    """
+    Counts of an import in progress, with the first IMPORT_MAX_REPORTED
+    unmatched rows.
+    """
+
+    def __init__(self, client: GutendexClient, matcher: BookMatcher):
+        """
+        Args:
+            client (GutendexClient): Client checking the book IDs.
+            matcher (BookMatcher): Matcher of the titles and authors.
+        """
+        self.client = client
+        self.matcher = matcher
+        self.rows = self.skipped = self.matched = self.unmatched = 0
+        self.reported: List[UnmatchedRow] = []
+
+    async def stage(self, rows: Sequence[ImportRow]) -> List[StagedRow]:
+        """
+        Resolve the books of a batch and count its rows.
+
+        Rows that are not on a reading shelf are skipped. Dates missing
+        from a row default to the time of the import.
+
+        Returns:
+            list: Staging table rows of the matched books.
+        """
+        shelved = [row for row in rows if row.status is not None]
+        self.rows += len(rows)
+        self.skipped += len(rows) - len(shelved)
+        now = datetime.now()
+        staged = []
+        for row, book_id in zip(shelved, await resolve_books(shelved, self.client, self.matcher)):
+            if book_id is None:
+                self._unmatched(row)
+                continue
+            created_at = row.created_at or now
+            staged.append(
+                (row.line, book_id, row.status.value, created_at, row.updated_at or created_at)
+            )
+        self.matched += len(staged)
+        return staged
+
+    def _unmatched(self, row: ImportRow) -> None:
+        self.unmatched += 1
+        if len(self.reported) < IMPORT_MAX_REPORTED:
+            self.reported.append(UnmatchedRow(line=row.line, title=row.title, author=row.author))
+
+    def result(self, changes: Sequence[Change]) -> ImportResult:
+        """The outcome of the import, given the entries the merge changed."""
+        created = sum(old_status is None for _, old_status, _ in changes)
+        return ImportResult(
+            rows=self.rows,
+            skipped=self.skipped,
+            matched=self.matched,
+            unmatched=self.unmatched,
+            created=created,
+            updated=len(changes) - created,
+            unmatched_rows=self.reported,
+        )
@@ -0,0 +1,44 @@
+"""
+Fast JSON path for the list endpoints.
+
+When a handler returns models, FastAPI validates them again against the
+`response_model` and serializes them once more. The favourites and reading
+list pages instead assemble plain dicts around book payloads that are
+validated by the Gutendex client already, and return them as a `FastJSONResponse`,
+which FastAPI passes through as is; `response_model` still documents them.
+"""
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from src.clients.book_record import validated
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which also handles datetimes and enums."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def book_payload(metadata: dict) -> dict:
+    """
+    The `Book` fields of a Gutendex payload, validated and ready for JSON.
+
+    Payloads handed out by the Gutendex client, from any cache level or
+    upstream, are `BookPayload`s already and returned as they are.
+    """
+    return validated(metadata)
+
+
+def json_response(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    """
+    Wrap already validated content, keeping the headers set on `response`.
+
+    FastAPI ignores the injected response once a handler returns its own,
+    so headers such as `X-Next-Cursor` are carried over here.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return FastJSONResponse(content, headers=headers)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from .users import get_current_user, UserInfo
 
 from src.database import get_async_session
@@ -8,8 +8,20 @@ from sqlalchemy import text
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.clients.gutendex_client import GutendexClient, get_gutendex_client
+from src.clients.book_loader import BookLoader, get_book_loader
+from .error_conversions import GUTENDEX_ERRORS, httpx_error_to_fastapi_error
+from .reading_list_batch import router as batch_router
+from .reading_list_import import router as import_router
+from .json_responses import book_payload, json_response
+from src.cruds.reading_list_crud import (
+    add_reading_list_entries,
+    get_reading_list_page,
+    remove_reading_list_entries,
+)
+from src.activity.events import Action
+from src.activity.writer import activity_log
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from src.models.schemas import Book, ReadingStatus
 from src.models.schemas import (
@@ -19,63 +31,61 @@ from src.models.schemas import (
 )
 
 router = APIRouter()
+# Included first: `/{book_id}` would otherwise try to parse "batch" as an ID
+router.include_router(batch_router)
+router.include_router(import_router)
 
 
 @router.get("/", response_model=List[ReadingListEntry])
 async def get_reading_list(
+    response: Response,
     offset: int = 0,
     limit: int = 20,
     status: ReadingStatus = ReadingStatus.ALL,
+    cursor: Optional[str] = None,
     user: UserInfo = Depends(get_current_user),
     session: AsyncSession = Depends(get_async_session),
-    gut_client: GutendexClient = Depends(get_gutendex_client),
+    book_loader: BookLoader = Depends(get_book_loader),
 ):
     """
     Get the reading list of currently authorized user.
 
+    Book metadata for the whole page is resolved with one batched lookup.
+    When more entries follow, the `X-Next-Cursor` response header holds the
+    token for the next page.
+
+    - **offset**: Number of entries to skip (ignored when `cursor` is given)
+    - **limit**: Maximum number of entries to return
+    - **status**: Only return entries with this status (all by default)
+    - **cursor**: `X-Next-Cursor` of the previous page
     - **returns**: User reading list
     """
-    if status == ReadingStatus.ALL:
-        result = await session.execute(
-            text(
-                """SELECT book_id, status, created_at, updated_at FROM reading_list WHERE
-                    user_id = :user_id ORDER BY updated_at DESC LIMIT :limit OFFSET :offset"""
-            ),
-            {"user_id": str(user.id), "limit": limit, "offset": offset},
-        )
-    else:
-        result = await session.execute(
-            text(
-                """SELECT book_id, status, created_at, updated_at FROM reading_list
-                    WHERE user_id = :user_id AND status = :status
-                    ORDER BY updated_at DESC LIMIT :limit OFFSET :offset"""
-            ),
-            {
-                "user_id": str(user.id),
-                "status": status,
-                "limit": limit,
-                "offset": offset,
-            },
+    try:
+        rows, next_cursor = await get_reading_list_page(
+            user, session, limit, offset, status, cursor
         )
-    rows = result.all()
-    reading_list: List[ReadingListEntry] = []
-    for book_id, status, created_at, updated_at in rows:
-        try:
-            metadata = await gut_client.get_book(book_id)
-        except Exception:
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    try:
+        books = await book_loader.load_many(row[0] for row in rows)
+    except GUTENDEX_ERRORS as exc:
+        httpx_error_to_fastapi_error(exc, "Books not found in Gutendex")
+    reading_list = []
+    for (book_id, status, created_at, updated_at), metadata in zip(rows, books):
+        if metadata is None:
             raise HTTPException(
                 status_code=404, detail=f"Book {book_id} not found in Gutendex"
             )
-        book = Book(**metadata)
-        reading_list.append(
-            ReadingListEntry(
-                status=ReadingStatus(status),
-                book=book,
-                created_at=created_at,
-                updated_at=updated_at,
-            )
-        )
-    return reading_list
+        reading_list.append({
+            "status": ReadingStatus(status),
+            "book": book_payload(metadata),
+            "created_at": created_at,
+            "updated_at": updated_at,
+        })
+    # Built from validated parts: skips the re-validation against the response model
+    return json_response(reading_list, response)
 
 
 @router.post("/", response_model=ReadingListEntry, status_code=201)
@@ -92,25 +102,17 @@ async def add_to_reading_list(
     """
     try:
         data = await gut_client.get_book(entry.book_id)
-    except Exception:
-        raise HTTPException(
-            status_code=404, detail=f"Book {entry.book_id} not found in Gutendex"
-        )
+    except GUTENDEX_ERRORS as exc:
+        httpx_error_to_fastapi_error(exc, f"Book {entry.book_id} not found in Gutendex")
     created_at = datetime.now()
-    await session.execute(
-        text(
-            """INSERT INTO reading_list (book_id, user_id, status, created_at, updated_at)
-        VALUES (:book_id, :user_id, :status, :created_at, :created_at)
-        ON CONFLICT DO NOTHING"""
-        ),
-        {
-            "user_id": str(user.id),
-            "book_id": entry.book_id,
-            "status": entry.status.value,
-            "created_at": created_at,
-        },
+    created = await add_reading_list_entries(
+        user, session, {entry.book_id: entry.status}, created_at
     )
     await session.commit()
+    if created:
+        activity_log.record(
+            Action.ADD_TO_READING_LIST, user.id, entry.book_id, new_status=entry.status
+        )
     return ReadingListEntry(
         status=ReadingStatus(entry.status.value),
         book=Book(**data),
@@ -134,16 +136,18 @@ async def update_reading_status(
     """
     try:
         data = await gut_client.get_book(book_id)
-    except Exception:
-        raise HTTPException(
-            status_code=404, detail=f"Book {book_id} not found in Gutendex"
-        )
+    except GUTENDEX_ERRORS as exc:
+        httpx_error_to_fastapi_error(exc, f"Book {book_id} not found in Gutendex")
 
     updated_at = datetime.now()
-    created_at = await session.execute(
+    # Joining the table to itself exposes the status before the UPDATE
+    result = await session.execute(
         text(
-            """UPDATE reading_list SET status = :status, updated_at = :updated_at
-        WHERE book_id = :book_id AND user_id = :user_id RETURNING created_at"""
+            """UPDATE reading_list r SET status = :status, updated_at = :updated_at
+        FROM reading_list old
+        WHERE r.book_id = :book_id AND r.user_id = :user_id
+            AND old.user_id = r.user_id AND old.book_id = r.book_id
+        RETURNING r.created_at, old.status"""
         ),
         {
             "book_id": book_id,
@@ -152,8 +156,11 @@ async def update_reading_status(
             "updated_at": updated_at,
         },
     )
-    created_at = created_at.scalar_one()
+    created_at, old_status = result.one()
     await session.commit()
+    activity_log.record(
+        Action.CHANGE_READING_STATUS, user.id, book_id, ReadingStatus(old_status), update.status
+    )
 
     return ReadingListEntry(
         status=update.status,
@@ -174,10 +181,7 @@ async def remove_from_reading_list(
 
     - **returns**: 204 on successful delete
     """
-    await session.execute(
-        text(
-            "DELETE FROM reading_list WHERE user_id = :user_id AND book_id = :book_id"
-        ),
-        {"user_id": str(user.id), "book_id": book_id},
-    )
+    deleted = await remove_reading_list_entries(user, session, [book_id])
     await session.commit()
+    for old_status in deleted.values():
+        activity_log.record(Action.REMOVE_FROM_READING_LIST, user.id, book_id, old_status)
@@ -0,0 +1,109 @@
+"""
+Bulk variants of the reading list endpoints, for clients syncing a library.
+
+A batch is validated with at most one Gutendex lookup and written with one
+statement in one transaction; the response reports the outcome of every book.
+"""
+from datetime import datetime
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.activity.events import Action
+from src.activity.writer import activity_log
+from src.clients.gutendex_client import GutendexClient, get_gutendex_client
+from src.config import BATCH_MAX_ITEMS
+from src.cruds.reading_list_crud import (
+    add_reading_list_entries,
+    remove_reading_list_entries,
+    update_reading_list_entries,
+)
+from src.database import get_async_session
+from src.models.schemas import BatchItemStatus, BatchResult, ReadingListBatch
+from .batch_results import batch_results, batch_statuses, invalid_statuses, unknown_books
+from .users import get_current_user, UserInfo
+
+router = APIRouter()
+
+
+@router.post("/batch", response_model=BatchResult)
+async def add_to_reading_list_batch(
+    batch: ReadingListBatch,
+    user: UserInfo = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+    gut_client: GutendexClient = Depends(get_gutendex_client),
+):
+    """
+    Add several books to the reading list of authorized user at once
+
+    Books are checked with one batched Gutendex lookup and written with one
+    INSERT in a single transaction.
+
+    - **entries**: Book ID and status of each book, at most `BATCH_MAX_ITEMS`
+    - **returns**: Per book `created`, `exists` (already on the list, left
+      unchanged), `not_found` (unknown to Gutendex) or `invalid` (status `all`)
+    """
+    statuses = batch_statuses(batch)
+    outcomes = invalid_statuses(statuses)
+    candidates = [book_id for book_id in statuses if book_id not in outcomes]
+    outcomes.update(await unknown_books(gut_client, candidates))
+    found = {book_id: statuses[book_id] for book_id in candidates if book_id not in outcomes}
+    created = await add_reading_list_entries(user, session, found, datetime.now())
+    await session.commit()
+    for book_id in created:
+        activity_log.record(
+            Action.ADD_TO_READING_LIST, user.id, book_id, new_status=found[book_id]
+        )
+    outcomes.update(dict.fromkeys(created, BatchItemStatus.CREATED))
+    return batch_results(statuses, outcomes, BatchItemStatus.EXISTS)
+
+
+@router.patch("/batch", response_model=BatchResult)
+async def update_reading_status_batch(
+    batch: ReadingListBatch,
+    user: UserInfo = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Update several of authorized user's reading list entries at once
+
+    All entries are changed with one UPDATE in a single transaction. Only
+    books already on the list are touched, so Gutendex is not consulted.
+
+    - **entries**: Book ID and new status of each entry, at most `BATCH_MAX_ITEMS`
+    - **returns**: Per book `updated`, `not_found` (not on the reading list)
+      or `invalid` (status `all`)
+    """
+    statuses = batch_statuses(batch)
+    outcomes = invalid_statuses(statuses)
+    valid = {book_id: status for book_id, status in statuses.items() if book_id not in outcomes}
+    updated = await update_reading_list_entries(user, session, valid, datetime.now())
+    await session.commit()
+    for book_id, old_status in updated.items():
+        activity_log.record(
+            Action.CHANGE_READING_STATUS, user.id, book_id, old_status, valid[book_id]
+        )
+    outcomes.update(dict.fromkeys(updated, BatchItemStatus.UPDATED))
+    return batch_results(statuses, outcomes, BatchItemStatus.NOT_FOUND)
+
+
+@router.delete("/batch", response_model=BatchResult)
+async def remove_from_reading_list_batch(
+    book_ids: List[int] = Query(..., min_length=1, max_length=BATCH_MAX_ITEMS),
+    user: UserInfo = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Delete several of authorized user's reading list entries at once
+
+    - **book_ids**: IDs to remove, repeated as `?book_ids=1&book_ids=2`
+    - **returns**: Per book `deleted` or `not_found` (not on the reading list)
+    """
+    book_ids = list(dict.fromkeys(book_ids))
+    deleted = await remove_reading_list_entries(user, session, book_ids)
+    await session.commit()
+    for book_id, old_status in deleted.items():
+        activity_log.record(Action.REMOVE_FROM_READING_LIST, user.id, book_id, old_status)
+    outcomes = dict.fromkeys(deleted, BatchItemStatus.DELETED)
+    return batch_results(book_ids, outcomes, BatchItemStatus.NOT_FOUND)
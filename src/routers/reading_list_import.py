@@ -0,0 +1,80 @@
+"""
+Import of a reading history from a CSV file, e.g. a Goodreads export.
+
+The upload is read IMPORT_BATCH_SIZE rows at a time. The books of a batch
+are resolved with one batched lookup (rows with a book ID) and cached
+title and author searches (the other rows), and the batch is COPY'd into a
+staging table; one upsert then merges it into the reading list. Nothing is
+imported if any step fails.
+"""
+import csv
+
+from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.activity.events import Action
+from src.activity.writer import activity_log
+from src.clients.book_matcher import BookMatcher
+from src.clients.gutendex_client import GutendexClient, get_gutendex_client
+from src.config import IMPORT_BATCH_SIZE, IMPORT_MAX_ROWS
+from src.cruds.reading_list_import_crud import (
+    copy_staged_rows,
+    create_staging_table,
+    merge_staged_rows,
+)
+from src.database import get_async_session
+from src.models.schemas import ImportResult
+from .error_conversions import GUTENDEX_ERRORS, httpx_error_to_fastapi_error
+from .import_rows import read_rows
+from .import_staging import ImportSummary
+from .users import get_current_user, UserInfo
+
+router = APIRouter()
+
+
+@router.post("/import", response_model=ImportResult)
+async def import_reading_list(
+    file: UploadFile,
+    user: UserInfo = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+    gut_client: GutendexClient = Depends(get_gutendex_client),
+):
+    """
+    Import a reading history from a CSV file into the reading list of authorized user
+
+    Rows of a Goodreads export are matched to Gutendex books by title and
+    author, its "to-read", "currently-reading" and "read" shelves becoming
+    `want_to_read`, `reading` and `done`. The CSV library export of this API
+    is imported by book ID. Books already on the list take the imported
+    status; when a book appears several times, its last row wins.
+
+    - **file**: CSV file with at most `IMPORT_MAX_ROWS` rows
+    - **returns**: Number of rows read, skipped (not on a reading shelf),
+      matched and unmatched, of entries created and updated, and the first
+      `IMPORT_MAX_REPORTED` unmatched rows
+    """
+    summary = ImportSummary(gut_client, BookMatcher(gut_client))
+    await create_staging_table(session)
+    try:
+        async for rows in read_rows(file.file, IMPORT_BATCH_SIZE):
+            if summary.rows + len(rows) > IMPORT_MAX_ROWS:
+                raise HTTPException(
+                    status_code=413, detail=f"At most {IMPORT_MAX_ROWS} rows can be imported"
+                )
+            await copy_staged_rows(session, await summary.stage(rows))
+    except csv.Error as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid CSV file: {exc}")
+    except GUTENDEX_ERRORS as exc:
+        httpx_error_to_fastapi_error(exc, "Books not found in Gutendex")
+    changes = await merge_staged_rows(user, session)
+    await session.commit()
+    for book_id, old_status, new_status in changes:
+        if old_status is None:
+            activity_log.record(
+                Action.ADD_TO_READING_LIST, user.id, book_id, new_status=new_status
+            )
+        else:
+            activity_log.record(
+                Action.CHANGE_READING_STATUS, user.id, book_id, old_status, new_status
+            )
+    return summary.result(changes)
@@ -0,0 +1,31 @@
+"""
+Counters of the user's library, for badges like "12 reading, 40 done".
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cruds.library_crud import get_library_summary
+from src.cruds.users_crud import get_current_user
+from src.database import get_async_session
+from src.models.schemas import LibrarySummary
+from src.models.user_schemas import UserInfo
+
+router = APIRouter()
+
+
+@router.get("/me/summary", response_model=LibrarySummary, summary="Get own library counters")
+async def get_summary(
+    user: UserInfo = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+) -> LibrarySummary:
+    """
+    Count the current user's favourites and reading list entries by status.
+
+    The counters are maintained with every write, so this is a single
+    primary key lookup however large the library is.
+
+    - **returns**: Number of favourites and of `want_to_read`, `reading`
+      and `done` entries
+    """
+    row = await get_library_summary(user, db)
+    return LibrarySummary(**row._mapping) if row else LibrarySummary()
@@ -3,6 +3,8 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
 
+from src.activity.events import Action
+from src.activity.writer import activity_log
 from src.database import get_async_session
 from src.models.user_schemas import UserCreate, UserInfo
 from src.oauth.schemas import Token
@@ -14,7 +16,14 @@ from src.cruds.users_crud import (
     get_current_user,
 )
 
+from .activity import router as activity_router
+from .export import router as export_router
+from .summary import router as summary_router
+
 router = APIRouter()
+router.include_router(activity_router)
+router.include_router(export_router)
+router.include_router(summary_router)
 
 
 @router.post("/new", response_model=Token, summary="Register a new user")
@@ -36,6 +45,7 @@ async def post_new_user(
         )
 
     created_user = await create_user(db, user)
+    activity_log.record(Action.CREATE_ACCOUNT, created_user.id)
     issued_token = create_access_token_from_user(created_user)
 
     return Token(access_token=issued_token, token_type="bearer")
@@ -0,0 +1,98 @@
+"""
+Shared fixtures for the unit tests: a fake Gutendex upstream served through
+httpx.MockTransport, a GutendexClient wired to it, wall and monotonic
+clocks moved by hand, and an empty principal cache for every test.
+"""
+import time
+
+import httpx
+import pytest
+
+from src.clients.gutendex_client import GutendexClient
+from src.oauth.principal_cache import principal_cache
+
+
+class FakeGutendex:
+    """
+    In-memory stand-in for gutendex.com, served through httpx.MockTransport.
+
+    Every book ID except MISSING_BOOK_ID exists. All received requests are
+    recorded in `calls`, so tests can count upstream round trips.
+    """
+
+    MISSING_BOOK_ID = 404
+
+    def __init__(self):
+        self.calls: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request)
+        if request.url.path == "/books/":
+            return httpx.Response(200, json=self.list_books(request.url.params))
+        # Otherwise a single book, /books/{id}/
+        book_id = int(request.url.path.strip("/").split("/")[-1])
+        if book_id == self.MISSING_BOOK_ID:
+            return httpx.Response(404, json={"detail": "Not found."})
+        return httpx.Response(200, json=self.make_book(book_id))
+
+    def list_books(self, params: httpx.QueryParams) -> dict:
+        """Listing payload; only the `ids` filter is honoured."""
+        ids = [int(book_id) for book_id in params.get("ids", "").split(",") if book_id]
+        books = [self.make_book(book_id) for book_id in ids if book_id != self.MISSING_BOOK_ID]
+        return {"count": len(books), "next": None, "previous": None, "results": books}
+
+    @staticmethod
+    def make_book(book_id: int) -> dict:
+        """Build a minimal Gutendex book payload."""
+        return {
+            "id": book_id,
+            "title": f"Book {book_id}",
+            "media_type": "Text",
+            "download_count": 1,
+        }
+
+    def make_client(self, shared_cache=None) -> GutendexClient:
+        """Create a GutendexClient talking to this fake, as one API worker would."""
+        transport = httpx.MockTransport(self)
+        return GutendexClient(
+            httpx.AsyncClient(base_url=GutendexClient.BASE_URL, transport=transport),
+            shared_cache=shared_cache,
+        )
+
+
+@pytest.fixture
+def fake_gutendex():
+    """Fixture providing a fresh fake Gutendex upstream."""
+    return FakeGutendex()
+
+
+@pytest.fixture
+async def gutendex_client(fake_gutendex):
+    """Fixture yielding a GutendexClient wired to the fake upstream."""
+    client = fake_gutendex.make_client()
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture(autouse=True)
+def empty_principal_cache():
+    """Fixture keeping tokens resolved by one test from leaking into the next."""
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fixture providing a wall clock (`time.time`) the test moves forward by hand."""
+    now = [time.time()]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def monotonic(monkeypatch):
+    """Fixture providing a monotonic clock the test moves forward by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
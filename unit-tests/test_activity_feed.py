@@ -0,0 +1,68 @@
+"""
+Tests for the activity feed: the `/users/me/activity` endpoint, its cursor
+pagination and the partition-pruning bounds of its query.
+"""
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.cruds.activity_crud import get_activity_page
+from src.cruds.cursors import encode_row_cursor
+from src.database import get_async_session
+from src.routers import users
+from src.routers.users import get_current_user
+
+ROW = SimpleNamespace(
+    id=7, action="add_favourite", book_id=1, old_status=None, new_status=None,
+    created_at=datetime(2026, 10, 1, 12),
+)
+
+
+def make_client() -> TestClient:
+    """Mount the users router with the user and session stubbed."""
+    app = FastAPI()
+    app.include_router(users.router, prefix="/users")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    app.dependency_overrides[get_async_session] = lambda: AsyncMock()
+    return TestClient(app)
+
+
+@patch("src.routers.activity.get_activity_page", return_value=([ROW], "next"))
+def test_activity_page(mock_page):
+    """Entries are listed with the cursor of the next page in a header."""
+    response = make_client().get("/users/me/activity", params={"limit": 1})
+
+    # Assert that the entry and the cursor are returned
+    assert response.status_code == 200
+    assert response.json()[0]["action"] == "add_favourite"
+    assert response.headers["x-next-cursor"] == "next"
+
+
+def test_malformed_cursor_is_rejected():
+    """A cursor that cannot be decoded is a client error."""
+    response = make_client().get("/users/me/activity", params={"cursor": "???"})
+
+    # Assert that the request fails with 400
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_query_bounds_partition_key():
+    """Time range and cursor become plain `created_at` bounds, in local time."""
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(all=lambda: [])
+    cursor = encode_row_cursor(ROW.created_at, ROW.id)
+    since = datetime(2026, 9, 1, tzinfo=timezone.utc)
+
+    await get_activity_page(SimpleNamespace(id=uuid.uuid4()), db, 20, since=since, cursor=cursor)
+
+    statement, params = db.execute.await_args.args
+    # Assert that both bounds can prune partitions
+    assert "created_at >= :since" in str(statement)
+    assert "created_at <= :after_at" in str(statement)
+    assert params["since"].tzinfo is None
@@ -0,0 +1,79 @@
+"""
+Tests for the batched activity log writer: flushing on batch size and on
+time, draining on shutdown and keeping the events of a failed write.
+"""
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.activity.events import Action
+from src.activity.writer import ActivityLogWriter
+
+
+@asynccontextmanager
+async def fake_session():
+    """Session factory standing in for the database."""
+    yield AsyncMock()
+
+
+def make_writer(**kwargs) -> ActivityLogWriter:
+    """Create an enabled writer on the fake session factory."""
+    options = {"batch_size": 100, "flush_interval": 60, "max_queue": 100, **kwargs}
+    return ActivityLogWriter(enabled=True, session_maker=fake_session, **options)
+
+
+def written(mock_insert) -> list:
+    """Number of events passed to each INSERT."""
+    return [len(call.args[1]) for call in mock_insert.await_args_list]
+
+
+@patch("src.activity.writer.insert_activity")
+@pytest.mark.asyncio
+async def test_full_batch_is_written_at_once(mock_insert):
+    """A batch is written as soon as it is full, without waiting for the interval."""
+    writer = make_writer(batch_size=2)
+    writer.start()
+    for book_id in range(3):
+        writer.record(Action.ADD_FAVOURITE, uuid.uuid4(), book_id)
+    await asyncio.sleep(0.01)
+
+    # Assert that one INSERT carried the first two events
+    assert written(mock_insert) == [2]
+
+    await writer.aclose()
+
+    # Assert that the remaining event was written on shutdown
+    assert written(mock_insert) == [2, 1]
+
+
+@patch("src.activity.writer.insert_activity")
+@pytest.mark.asyncio
+async def test_partial_batch_is_written_after_interval(mock_insert):
+    """An event does not wait longer than the flush interval."""
+    writer = make_writer(flush_interval=0.01)
+    writer.start()
+    writer.record(Action.CREATE_ACCOUNT, uuid.uuid4())
+    await asyncio.sleep(0.05)
+
+    # Assert that the lone event was written by the background task
+    assert written(mock_insert) == [1]
+    await writer.aclose()
+
+
+@patch("src.activity.writer.insert_activity", side_effect=[OperationalError("", {}, None), None])
+@pytest.mark.asyncio
+async def test_failed_batch_is_written_on_shutdown(mock_insert):
+    """Events of a failed write are kept and written again."""
+    writer = make_writer(batch_size=1)
+    writer.start()
+    writer.record(Action.REMOVE_FAVOURITE, uuid.uuid4(), 7)
+    await asyncio.sleep(0.01)
+    await writer.aclose()
+
+    # Assert that the same event was attempted twice
+    assert written(mock_insert) == [1, 1]
+    assert mock_insert.await_args_list[0].args[1] == mock_insert.await_args_list[1].args[1]
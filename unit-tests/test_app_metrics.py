@@ -0,0 +1,72 @@
+"""
+Tests for the application metrics: Gutendex calls per method and status,
+sizes and evictions of the in-process caches and CRUD latencies.
+"""
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from src.cache.memory import LRUCache
+from src.cache.stats import track_cache
+from src.cruds.query_metrics import timed
+
+
+def sample(name: str, **labels) -> float:
+    """Current value of a sample in the default registry, 0 if not exported yet."""
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def gutendex_calls(method: str, status: str) -> float:
+    """Number of Gutendex calls observed for a method and status."""
+    return sample("gutendex_request_seconds_count", method=method, status=status)
+
+
+@pytest.mark.asyncio
+async def test_gutendex_calls_per_method_and_status(gutendex_client, fake_gutendex):
+    """Every call is observed under the calling method and the response status."""
+    series = [("fetch_book", "200"), ("fetch_book", "404"), ("fetch_books", "200")]
+    before = [gutendex_calls(*labels) for labels in series]
+
+    await gutendex_client.get_book(1)
+    with pytest.raises(httpx.HTTPStatusError):
+        await gutendex_client._api.fetch_book(fake_gutendex.MISSING_BOOK_ID)
+    await gutendex_client._api.fetch_books([2, 3])
+
+    # Assert that each call landed in its own series
+    assert [gutendex_calls(*labels) for labels in series] == [count + 1 for count in before]
+
+
+def test_cache_size_and_evictions_are_scraped():
+    """Tracked caches report their entries and evictions at every scrape."""
+    cache = LRUCache(2)
+    track_cache("test_lru", cache)
+
+    for key in range(5):
+        cache.set(key, key)
+
+    # Assert that the three oldest entries were evicted to make room
+    assert sample("cache_entries", cache="test_lru") == 2
+    assert sample("cache_evictions_total", cache="test_lru") == 3
+    del cache
+    # Assert that a dropped cache leaves the metrics
+    assert REGISTRY.get_sample_value("cache_entries", {"cache": "test_lru"}) is None
+
+
+@pytest.mark.asyncio
+async def test_crud_latency_per_function():
+    """Calls are observed under the function name, failed ones included."""
+
+    @timed
+    async def get_test_rows(fail: bool):
+        if fail:
+            raise ValueError()
+        return ["row"]
+
+    calls = sample("db_query_seconds_count", function="get_test_rows")
+
+    assert await get_test_rows(False) == ["row"]
+    with pytest.raises(ValueError):
+        await get_test_rows(True)
+
+    # Assert that both calls were timed
+    assert sample("db_query_seconds_count", function="get_test_rows") == calls + 2
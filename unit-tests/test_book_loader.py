@@ -0,0 +1,54 @@
+import pytest
+
+from src.clients.book_loader import BookLoader
+
+
+@pytest.mark.asyncio
+async def test_load_many_uses_one_upstream_call(gutendex_client, fake_gutendex):
+    """A page of books is resolved with a single `/books/?ids=` request."""
+    loader = BookLoader(gutendex_client)
+
+    books = await loader.load_many([5, 3, 9, 3])
+
+    # Assert that the rows keep their order and duplicates are resolved too
+    assert [book["id"] for book in books] == [5, 3, 9, 3]
+    assert len(fake_gutendex.calls) == 1
+    assert fake_gutendex.calls[0].url.params["ids"] == "5,3,9"
+
+
+@pytest.mark.asyncio
+async def test_load_many_serves_cached_books(gutendex_client, fake_gutendex):
+    """Books already in the client cache are not requested again."""
+    await gutendex_client.get_book(3)
+    loader = BookLoader(gutendex_client)
+
+    await loader.load_many([3, 4])
+
+    # Assert that only the uncached book went upstream
+    assert len(fake_gutendex.calls) == 2
+    assert fake_gutendex.calls[1].url.params["ids"] == "4"
+
+
+@pytest.mark.asyncio
+async def test_load_many_missing_book(gutendex_client, fake_gutendex):
+    """Unknown IDs resolve to None instead of failing the whole batch."""
+    loader = BookLoader(gutendex_client)
+
+    books = await loader.load_many([1, fake_gutendex.MISSING_BOOK_ID])
+
+    # Assert that the missing book is reported as None
+    assert books[0]["id"] == 1
+    assert books[1] is None
+
+
+@pytest.mark.asyncio
+async def test_large_batches_are_split_into_pages(gutendex_client, fake_gutendex):
+    """More IDs than fit in one Gutendex page are fetched page by page."""
+    loader = BookLoader(gutendex_client)
+    book_ids = list(range(1, 2 * gutendex_client.PAGE_SIZE + 2))
+
+    books = await loader.load_many(book_ids)
+
+    # Assert that all books arrived using one request per page
+    assert [book["id"] for book in books] == book_ids
+    assert len(fake_gutendex.calls) == 3
@@ -0,0 +1,60 @@
+"""
+Tests for matching books by title and author: normalization, the choice
+among search results and the per-process match cache.
+"""
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.cache.memory import LRUCache
+from src.clients.book_matcher import BookMatcher, match_key
+
+
+def search_page(*books) -> dict:
+    """A search result page with (id, title, author) books."""
+    results = [
+        {"id": book_id, "title": title, "authors": [{"name": author}]}
+        for book_id, title, author in books
+    ]
+    return {"count": len(results), "results": results}
+
+
+def test_match_key_ignores_subtitle_case_and_first_names():
+    """Goodreads and Gutendex spellings of a book give the same key."""
+    # Assert that both spellings match
+    assert match_key("Frankenstein: or, The Modern Prometheus", "Mary Shelley") == (
+        "frankenstein", "shelley"
+    )
+    assert match_key("Frankenstein; Or, The Modern Prometheus", "")[0] == "frankenstein"
+    assert match_key("Pride and Prejudice", "") == ("pride and prejudice", "")
+
+
+@pytest.mark.asyncio
+async def test_match_searches_each_book_once():
+    """Duplicates share a search, and the book by the right author wins."""
+    client = Mock(find_books=AsyncMock(return_value=search_page(
+        (1, "Emma: A Study", "Tennant, Emma"), (158, "Emma", "Austen, Jane"),
+    )))
+    matcher = BookMatcher(client, cache=LRUCache(10))
+    emma = match_key("Emma", "Jane Austen")
+
+    matches = await matcher.match([emma, emma, match_key("", "Nobody")])
+
+    # Assert that the untitled row was not searched for
+    assert matches == {emma: 158, ("", "nobody"): None}
+    client.find_books.assert_awaited_once_with("emma austen")
+
+
+@pytest.mark.asyncio
+async def test_match_remembers_books_without_match():
+    """Unmatched books are cached too, so a later import does not search again."""
+    client = Mock(find_books=AsyncMock(return_value=search_page()))
+    cache = LRUCache(10)
+    key = match_key("Unknown Book", "Anonymous")
+
+    first = await BookMatcher(client, cache=cache).match([key])
+    second = await BookMatcher(client, cache=cache).match([key])
+
+    # Assert that only the first matcher searched
+    assert first == second == {key: None}
+    assert client.find_books.await_count == 1
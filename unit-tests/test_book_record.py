@@ -0,0 +1,64 @@
+"""
+Tests for the compact book records of the metadata cache and the
+byte-sized in-process level keeping them.
+"""
+import pytest
+
+from src.cache.local import RecordBackend
+from src.cache.memory import LRUCache
+from src.clients.book_record import BookPayload, BookRecord
+from src.models.schemas import Book
+
+
+def make_book(book_id: int) -> dict:
+    """A Gutendex payload with people, shared strings and bulky formats."""
+    return {
+        "id": book_id,
+        "title": f"Book {book_id}",
+        "authors": [{"name": "Verne, Jules", "birth_year": 1828, "death_year": 1905}],
+        "subjects": ["Science fiction"],
+        "languages": ["fr"],
+        "media_type": "Text",
+        "formats": {"text/html": f"https://www.gutenberg.org/ebooks/{book_id}.html" * 10},
+        "download_count": 3,
+        "unknown_field": True,
+    }
+
+
+def test_record_rebuilds_the_book():
+    """A record gives back the validated `Book` fields, sharing repeated strings."""
+    first, second = BookRecord(make_book(1)), BookRecord(make_book(2))
+    payload = first.to_dict()
+
+    # Assert that the payload equals the `Book` dump and is marked as validated
+    assert payload == Book(**make_book(1)).model_dump(mode="json")
+    assert isinstance(payload, BookPayload)
+    assert first.authors[0][0] is second.authors[0][0]
+
+
+def test_lru_is_bounded_by_weight():
+    """With a weight function, the least recently used entries go once the budget is spent."""
+    cache = LRUCache(10, weigh=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    cache.set("c", "xxxx")
+    cache.set("d", "x" * 11)
+
+    # Assert that "a" was evicted and an oversized value is not kept
+    assert "a" not in cache and "b" in cache
+    assert "d" not in cache
+    assert cache.weight == 8
+
+
+@pytest.mark.asyncio
+async def test_record_backend_keeps_records():
+    """Entries are stored packed, within the byte budget, and rebuilt on each hit."""
+    backend = RecordBackend(BookRecord, maxbytes=1_000_000)
+    await backend.set_many({"book:1": [None, make_book(1)]})
+    first = await backend.get_many(["book:1"])
+    second = await backend.get_many(["book:1"])
+
+    # Assert that hits are fresh copies of the book and the budget is accounted
+    assert first == second
+    assert first["book:1"][1] is not second["book:1"][1]
+    assert 0 < backend.nbytes < 1_000_000
@@ -0,0 +1,69 @@
+"""
+Tests for the choice of source of GET /books/: the local ranked search for
+`search`/`topic` queries when BOOK_SEARCH_BACKEND is "local", Gutendex otherwise.
+"""
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.clients.gutendex_client import get_gutendex_client
+from src.database import get_async_session
+from src.routers import books
+from src.routers.users import get_current_user
+
+# A page of the local search, told apart from Gutendex's by its title
+LOCAL_BOOK = {"id": 2, "title": "Local", "media_type": "Text", "download_count": 1}
+LOCAL_PAGE = {"count": 1, "next": None, "previous": None, "results": [LOCAL_BOOK]}
+
+
+def make_client(fake_gutendex) -> TestClient:
+    """Mount the books router with the user, session and Gutendex client stubbed."""
+    app = FastAPI()
+    app.include_router(books.router, prefix="/books")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    app.dependency_overrides[get_async_session] = lambda: AsyncMock()
+    app.dependency_overrides[get_gutendex_client] = fake_gutendex.make_client
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("name", ["search", "topic"])
+@patch("src.routers.books.get_book_states", return_value={})
+@patch("src.routers.books.search_books", return_value=LOCAL_PAGE)
+@patch("src.routers.books.BOOK_SEARCH_BACKEND", "local")
+def test_searches_go_to_the_local_catalogue(mock_search, mock_states, name, fake_gutendex):
+    """With the local backend, search and topic queries never reach Gutendex."""
+    response = make_client(fake_gutendex).get(f"/books/?{name}=war&page=2")
+
+    # Assert that the local page is served, with the normalized parameters
+    assert response.json()["results"][0]["title"] == "Local"
+    assert fake_gutendex.calls == []
+    assert mock_search.await_args.args[1] == {name: "war", "page": 2}
+
+
+@pytest.mark.parametrize("backend, query", [("local", "languages=fr"), ("gutendex", "search=war")])
+@patch("src.routers.books.get_book_states", return_value={})
+@patch("src.routers.books.search_books")
+def test_other_queries_go_to_gutendex(mock_search, mock_states, backend, query, fake_gutendex):
+    """Plain listings, and every query with the Gutendex backend, are listed upstream."""
+    with patch("src.routers.books.BOOK_SEARCH_BACKEND", backend):
+        response = make_client(fake_gutendex).get(f"/books/?{query}")
+
+    # Assert that Gutendex answered and the local search was not queried
+    assert response.status_code == 200
+    assert len(fake_gutendex.calls) == 1
+    mock_search.assert_not_awaited()
+
+
+@patch("src.routers.books.search_books", side_effect=ValueError("Invalid cursor"))
+@patch("src.routers.books.BOOK_SEARCH_BACKEND", "local")
+def test_invalid_cursor_is_a_bad_request(mock_search, fake_gutendex):
+    """A cursor the local search cannot decode is the client's mistake."""
+    response = make_client(fake_gutendex).get("/books/?search=war&cursor=garbage")
+
+    # Assert that the error is a 400, not a 500
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
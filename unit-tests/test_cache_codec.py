@@ -0,0 +1,23 @@
+"""
+Tests for the encoding of values stored in the shared cache.
+"""
+import pytest
+
+from src.cache.codec import decode, encode
+
+
+def test_codec_compresses_large_values():
+    """Large values are stored compressed, small ones as plain JSON."""
+    small, large = {"id": 1}, {"id": 2, "title": "x" * 4096}
+
+    # Assert that both survive the round trip and only the large one is shrunk
+    assert decode(encode(small)) == small
+    assert decode(encode(large)) == large
+    assert encode(small).startswith(b"j")
+    assert len(encode(large)) < 200
+
+
+def test_codec_rejects_unknown_format():
+    """Values written in another format are refused rather than misread."""
+    with pytest.raises(ValueError):
+        decode(b"x{}")
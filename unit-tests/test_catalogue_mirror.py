@@ -0,0 +1,43 @@
+import httpx
+import pytest
+
+from src.clients.catalogue_mirror import CatalogueMirror
+
+
+def upstream_down():
+    """Build an upstream call failing the way an unreachable Gutendex does."""
+    async def call():
+        raise httpx.ConnectError("Gutendex is down")
+    return call
+
+
+def returning(value):
+    """Build a mirror or upstream call resolving to `value`."""
+    async def call():
+        return value
+    return call
+
+
+@pytest.mark.asyncio
+async def test_prefer_mode_serves_mirror_first():
+    """In prefer mode a complete mirror result is served without asking Gutendex."""
+    mirror = CatalogueMirror(mode="prefer", session_maker=None)
+
+    # Assert that the upstream is never called when the mirror has the data
+    assert await mirror.fetch(returning("local"), upstream_down()) == "local"
+    # Assert that a miss in the mirror falls through to Gutendex
+    assert await mirror.fetch(returning(None), returning("remote")) == "remote"
+
+
+@pytest.mark.asyncio
+async def test_fallback_mode_serves_mirror_when_upstream_fails():
+    """In fallback mode the mirror is only read while Gutendex is failing."""
+    mirror = CatalogueMirror(mode="fallback", session_maker=None)
+
+    # Assert that a healthy upstream wins over the mirror
+    assert await mirror.fetch(returning("local"), returning("remote")) == "remote"
+    # Assert that the mirror covers for an unreachable upstream
+    assert await mirror.fetch(returning("local"), upstream_down()) == "local"
+    # Assert that the original error surfaces when the mirror has nothing either
+    with pytest.raises(httpx.ConnectError):
+        await mirror.fetch(returning(None), upstream_down())
@@ -0,0 +1,61 @@
+"""
+Tests for the ranked catalogue search: pages, the next/previous links and
+the page URLs they point to. Walking backwards and empty results are in
+test_catalogue_search_keyset.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from src.cruds.catalogue_search_crud import PAGE_SIZE, search_books
+from src.cruds.cursors import decode_cursor
+
+
+def session_returning(book_ids, count: int) -> AsyncMock:
+    """Session whose single query returns the books `book_ids`, ranked 1/id."""
+    rows = [
+        SimpleNamespace(count=count, id=book_id, rank=1 / book_id, document={"id": book_id})
+        for book_id in book_ids
+    ]
+    db = AsyncMock()
+    db.execute.return_value = SimpleNamespace(all=lambda: rows)
+    return db
+
+
+def link_query(url: str) -> dict:
+    """Query parameters of a next/previous link, the cursor decoded."""
+    query = {name: values[0] for name, values in parse_qs(urlsplit(url).query).items()}
+    return {**query, "cursor": decode_cursor(query["cursor"])}
+
+
+@pytest.mark.asyncio
+async def test_first_page_links_forward_only():
+    """The first page of many has a next link after its last row, and no previous one."""
+    # One row more than a page: there is a next page
+    db = session_returning(range(1, PAGE_SIZE + 2), count=100)
+
+    page = await search_books(db, {"search": "war", "page": 1})
+
+    # Assert that the extra row is dropped and the search is carried on, not the page
+    assert len(page["results"]) == PAGE_SIZE and page["previous"] is None
+    assert link_query(page["next"]) == {
+        "search": "war",
+        "cursor": {"dir": "next", "rank": 1 / PAGE_SIZE, "id": PAGE_SIZE},
+    }
+    assert db.execute.await_args.args[1]["offset"] == 0
+
+
+@pytest.mark.asyncio
+async def test_numbered_page_links_back():
+    """A `page` beyond the first is skipped to with OFFSET and links back."""
+    # The rest of the matches, less than a page
+    db = session_returning(range(33, 41), count=40)
+
+    page = await search_books(db, {"search": "war", "page": 2})
+
+    # Assert that the last page only links back, to before its first row
+    assert db.execute.await_args.args[1]["offset"] == PAGE_SIZE
+    assert page["next"] is None
+    assert link_query(page["previous"])["cursor"] == {"dir": "prev", "rank": 1 / 33, "id": 33}
@@ -0,0 +1,64 @@
+"""
+Tests for the keyset handling of the ranked catalogue search: `prev`
+cursors, empty results and cursors it did not issue.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from src.cruds.catalogue_search_crud import search_books
+from src.cruds.cursors import decode_cursor, encode_cursor
+
+
+def session_returning(rows) -> AsyncMock:
+    """Session whose single query returns `rows`."""
+    db = AsyncMock()
+    db.execute.return_value = SimpleNamespace(all=lambda: rows)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_previous_cursor_walks_backwards():
+    """A `prev` cursor reads rows in reverse order and returns them best first."""
+    cursor = encode_cursor({"dir": "prev", "rank": 0.25, "id": 4})
+    # Rows as the query returns them walking backwards: worst match first
+    db = session_returning([
+        SimpleNamespace(count=50, id=book_id, rank=1 / book_id, document={"id": book_id})
+        for book_id in (3, 2, 1)
+    ])
+
+    page = await search_books(db, {"search": "war", "cursor": cursor})
+
+    # Assert that the keyset is bound, rows are flipped and only next is linked
+    query, binds = db.execute.await_args.args
+    assert "rank ASC, id DESC" in str(query)
+    assert binds["after_rank"] == 0.25 and binds["after_id"] == 4
+    assert [book["id"] for book in page["results"]] == [1, 2, 3]
+    assert page["previous"] is None
+    next_cursor = parse_qs(urlsplit(page["next"]).query)["cursor"][0]
+    assert decode_cursor(next_cursor) == {"dir": "next", "rank": 1 / 3, "id": 3}
+
+
+@pytest.mark.asyncio
+async def test_no_matches():
+    """Without matches the count row alone comes back: an empty page without links."""
+    db = session_returning([SimpleNamespace(count=0, id=None)])
+
+    page = await search_books(db, {"search": "zzz"})
+
+    # Assert that the page is empty
+    assert page == {"count": 0, "next": None, "previous": None, "results": []}
+
+
+@pytest.mark.parametrize("values", [{"dir": "up", "rank": 1, "id": 1}, {"dir": "next"}])
+@pytest.mark.asyncio
+async def test_foreign_cursor_is_rejected(values):
+    """Cursors without a known direction or keyset are refused before querying."""
+    db = session_returning([])
+
+    # Assert that ValueError is raised and nothing is queried
+    with pytest.raises(ValueError):
+        await search_books(db, {"search": "war", "cursor": encode_cursor(values)})
+    db.execute.assert_not_awaited()
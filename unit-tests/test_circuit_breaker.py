@@ -0,0 +1,77 @@
+"""
+Tests for the Gutendex circuit breaker: tripping after consecutive failures,
+failing fast while open, and half-open probing.
+"""
+import httpx
+import pytest
+
+from src.clients.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.clients.gutendex_api import GutendexAPI
+from src.clients.gutendex_errors import GutendexUnavailable
+
+
+def make_api(handler, breaker: CircuitBreaker) -> GutendexAPI:
+    """Create a GutendexAPI whose upstream is answered by `handler`."""
+    transport = httpx.MockTransport(handler)
+    return GutendexAPI(
+        httpx.AsyncClient(base_url=GutendexAPI.BASE_URL, transport=transport), breaker
+    )
+
+
+def test_breaker_opens_after_consecutive_failures(monotonic):
+    """The breaker refuses calls once the failure threshold is reached."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    # Two failed calls in a row
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+
+    # Assert that the next call fails fast and tells when to retry
+    assert breaker.state == OPEN
+    with pytest.raises(GutendexUnavailable) as info:
+        breaker.before_call()
+    assert info.value.retry_after == 30
+
+
+def test_breaker_probes_once_when_half_open(monotonic):
+    """After the reset timeout a single probe goes through and closes the breaker."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.before_call()
+    breaker.record_failure()
+    # Wait past the reset timeout
+    monotonic[0] += 31
+
+    probe = breaker.before_call()
+
+    # Assert that concurrent calls are refused while the probe is in flight
+    assert probe and breaker.state == HALF_OPEN
+    with pytest.raises(GutendexUnavailable):
+        breaker.before_call()
+
+    breaker.record_success(probe)
+
+    # Assert that the successful probe closes the breaker
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+@pytest.mark.asyncio
+async def test_api_trips_breaker_on_server_errors(monotonic):
+    """5xx answers count as failures; further calls never reach the upstream."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(502)
+
+    api = make_api(handler, CircuitBreaker(failure_threshold=2, reset_timeout=30))
+    # The upstream errors are still surfaced as they are
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await api.fetch_book(1)
+
+    # Assert that the third call fails fast without an upstream request
+    with pytest.raises(GutendexUnavailable):
+        await api.fetch_book(1)
+    assert len(calls) == 2
+    await api.aclose()
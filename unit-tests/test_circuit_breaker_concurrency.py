@@ -0,0 +1,92 @@
+"""
+Tests for the Gutendex circuit breaker under concurrent calls: outcomes of
+calls in flight when the breaker opened must not re-trip, extend or close it.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from src.clients.circuit_breaker import HALF_OPEN, OPEN, CircuitBreaker
+from src.clients.gutendex_api import GutendexAPI
+from src.clients.gutendex_errors import GutendexUnavailable
+from src.metrics import GUTENDEX_BREAKER_TRIPS
+
+
+def test_late_failures_trip_the_breaker_once(monotonic):
+    """Failures of calls in flight when the breaker opened neither re-trip nor extend it."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    trips = GUTENDEX_BREAKER_TRIPS._value.get()
+    # Five calls in flight at once, failing one second after the other;
+    # the second failure opens the breaker
+    for probe in [breaker.before_call() for _ in range(5)]:
+        breaker.record_failure(probe)
+        monotonic[0] += 1
+
+    # Assert that the breaker opened once and reopens 30s after the second failure
+    assert GUTENDEX_BREAKER_TRIPS._value.get() == trips + 1
+    monotonic[0] += 26
+    assert breaker.before_call()
+
+
+def test_late_success_does_not_close_the_breaker(monotonic):
+    """Only the probe closes the breaker, not a call that started before it opened."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    # Two calls in flight; the first one to answer fails and opens the breaker
+    late, failing = breaker.before_call(), breaker.before_call()
+    breaker.record_failure(failing)
+
+    breaker.record_success(late)
+
+    # Assert that the breaker stays open
+    assert breaker.state == OPEN
+    with pytest.raises(GutendexUnavailable):
+        breaker.before_call()
+
+
+def test_late_failure_leaves_the_probe_in_flight(monotonic):
+    """While half-open, only the probe's own failure re-opens the breaker."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    late, failing = breaker.before_call(), breaker.before_call()
+    breaker.record_failure(failing)
+    # The probe goes out after the reset timeout, before the late call answers
+    monotonic[0] += 31
+    probe = breaker.before_call()
+
+    breaker.record_failure(late)
+
+    # Assert that the probe is still the only call let through
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(GutendexUnavailable):
+        breaker.before_call()
+    # Its own failure does re-open the breaker
+    breaker.record_failure(probe)
+    assert breaker.state == OPEN
+
+
+@pytest.mark.asyncio
+async def test_api_counts_one_trip_for_concurrent_failures(monotonic):
+    """Concurrent requests failing together open the breaker a single time."""
+    answer, arrived = asyncio.Event(), []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # Hold every request until all of them reached the upstream
+        arrived.append(request)
+        await answer.wait()
+        return httpx.Response(503)
+
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    transport = httpx.MockTransport(handler)
+    client = httpx.AsyncClient(base_url=GutendexAPI.BASE_URL, transport=transport)
+    api = GutendexAPI(client, breaker)
+    trips = GUTENDEX_BREAKER_TRIPS._value.get()
+    calls = [asyncio.ensure_future(api.fetch_book(book_id)) for book_id in range(5)]
+    # Answer once all five are in flight, all with a 503
+    while len(arrived) < 5:
+        await asyncio.sleep(0)
+    answer.set()
+    await asyncio.gather(*calls, return_exceptions=True)
+
+    # Assert that the breaker opened once
+    assert GUTENDEX_BREAKER_TRIPS._value.get() == trips + 1
+    await api.aclose()
@@ -0,0 +1,60 @@
+"""
+Tests for CompressionMiddleware: compressed listings, the size threshold
+and the /metrics bypass.
+"""
+import json
+
+import brotli
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from src.middleware.compression import CompressionMiddleware
+
+LISTING = [{"id": book_id, "formats": {"text/html": "https://www.gutenberg.org"}}
+           for book_id in range(200)]
+
+
+def make_client() -> TestClient:
+    """An app with a large listing, a small body and /metrics."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, min_bytes=512)
+
+    @app.get("/listing")
+    async def listing(response: Response):
+        response.headers["ETag"] = '"listing"'
+        return LISTING
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/metrics")
+    async def metrics():
+        return PlainTextResponse("metric 1\n" * 200)
+
+    return TestClient(app)
+
+
+def test_large_body_is_compressed():
+    """A large JSON listing is sent compressed, with its compressed length and a weak ETag."""
+    client = make_client()
+    with client.stream("GET", "/listing", headers={"Accept-Encoding": "br"}) as response:
+        body = b"".join(response.iter_raw())
+
+    # Assert that the body decodes to the listing and the headers describe it
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["content-length"] == str(len(body))
+    assert response.headers["etag"] == 'W/"listing"'
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert json.loads(brotli.decompress(body)) == LISTING
+
+
+def test_small_and_excluded_bodies_are_sent_as_is():
+    """Bodies below the threshold and /metrics are never compressed."""
+    client = make_client()
+    headers = {"Accept-Encoding": "gzip"}
+
+    # Assert that neither response is encoded
+    assert "content-encoding" not in client.get("/small", headers=headers).headers
+    assert "content-encoding" not in client.get("/metrics", headers=headers).headers
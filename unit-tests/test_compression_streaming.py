@@ -0,0 +1,37 @@
+"""
+Tests for CompressionMiddleware on streamed responses.
+"""
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.middleware.compression import CompressionMiddleware
+
+LINES = [json.dumps({"id": book_id, "title": f"Book {book_id}"}) + "\n" for book_id in range(500)]
+
+
+def make_client() -> TestClient:
+    """An app streaming an NDJSON export line by line."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/export")
+    async def export():
+        return StreamingResponse(iter(LINES), media_type="application/x-ndjson")
+
+    return TestClient(app)
+
+
+def test_streamed_body_is_compressed():
+    """A streamed export is compressed chunk by chunk without a Content-Length."""
+    client = make_client()
+    with client.stream("GET", "/export", headers={"Accept-Encoding": "gzip"}) as response:
+        body = b"".join(response.iter_raw())
+
+    # Assert that the gzip stream holds every line
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert len(gzip.decompress(body).splitlines()) == len(LINES)
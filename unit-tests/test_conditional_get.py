@@ -0,0 +1,65 @@
+"""
+Tests for conditional GET on the book endpoints: ETag computation,
+If-None-Match handling and the 304 served to clients with a current copy.
+"""
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.clients.gutendex_client import get_gutendex_client
+from src.database import get_async_session
+from src.routers import books
+from src.routers.conditional_get import etag_matches, payload_etag
+from src.routers.users import get_current_user
+
+
+def make_app(gutendex_client) -> FastAPI:
+    """Mount the books router with the user, session and Gutendex client stubbed."""
+    app = FastAPI()
+    app.include_router(books.router, prefix="/books")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    app.dependency_overrides[get_async_session] = lambda: AsyncMock()
+    app.dependency_overrides[get_gutendex_client] = lambda: gutendex_client
+    return app
+
+
+def test_etag_depends_on_user_state():
+    """The same book with another favourite state gets another ETag."""
+    book = {"id": 1, "title": "Book 1", "is_favourite": False, "became_favourite_at": None}
+    favourite = {**book, "is_favourite": True, "became_favourite_at": datetime(2025, 5, 1)}
+
+    # Assert that the ETag is stable, strong and follows the state
+    assert payload_etag(book) == payload_etag(dict(book))
+    assert payload_etag(book).startswith('"')
+    assert payload_etag(book) != payload_etag(favourite)
+
+
+def test_if_none_match_parsing():
+    """Lists, weak validators and the wildcard match as RFC 9110 describes."""
+    # Assert that any listed tag, weak or not, matches
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+
+
+@patch("src.routers.books.get_book_states", return_value={})
+def test_get_book_not_modified(mock_states, fake_gutendex):
+    """A client sending the current ETag gets an empty 304."""
+    client = TestClient(make_app(fake_gutendex.make_client()))
+    first = client.get("/books/7")
+
+    # Assert that the response is tagged for private caching
+    assert first.status_code == 200
+    assert first.headers["cache-control"].startswith("private, max-age=")
+
+    second = client.get("/books/7", headers={"If-None-Match": first.headers["etag"]})
+
+    # Assert that the body is not sent again
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == first.headers["etag"]
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+import pytest
+
+from src.cruds.cursors import (
+    decode_cursor,
+    decode_row_cursor,
+    encode_cursor,
+    encode_row_cursor,
+)
+
+
+def test_cursor_round_trip():
+    """A cursor decodes back to exactly the keyset values it was built from."""
+    values = {"dir": "next", "rank": 0.123456789, "id": 1342}
+    token = encode_cursor(values)
+
+    # Assert that the token is URL-safe and carries the values unchanged
+    assert "=" not in token and "/" not in token and "+" not in token
+    assert decode_cursor(token) == values
+
+
+@pytest.mark.parametrize("token", ["not a cursor", encode_cursor([1, 2])[:-1], "W10"])
+def test_malformed_cursor_is_rejected(token):
+    """Tokens that were not issued by `encode_cursor` raise ValueError."""
+    # Assert that garbage and non-object payloads are refused
+    with pytest.raises(ValueError):
+        decode_cursor(token)
+
+
+def test_row_cursor_keeps_microseconds():
+    """Row cursors restore the exact timestamp, so no row is skipped or repeated."""
+    at = datetime(2026, 10, 18, 9, 30, 15, 123456)
+
+    # Assert that the (timestamp, book_id) position survives the round trip
+    assert decode_row_cursor(encode_row_cursor(at, 84)) == (at, 84)
+    # Assert that a search cursor is not accepted as a row cursor
+    with pytest.raises(ValueError):
+        decode_row_cursor(encode_cursor({"dir": "next", "rank": 1.0, "id": 84}))
@@ -0,0 +1,33 @@
+"""
+Tests for the instrumented connection pool: in-use connections, overflow
+and timeout events.
+"""
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from src.database_pool import InstrumentedPool
+from src.metrics import DB_POOL_CONNECTIONS, DB_POOL_OVERFLOWS, DB_POOL_TIMEOUTS
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_usage():
+    """Connections beyond the pool size and checkouts that time out are counted."""
+    pool = InstrumentedPool(creator=Mock, pool_size=1, max_overflow=1, timeout=0.01)
+    overflows = DB_POOL_OVERFLOWS._value.get()
+    timeouts = DB_POOL_TIMEOUTS._value.get()
+
+    connections = [await greenlet_spawn(pool.connect) for _ in range(2)]
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    # Assert that only the second connection overflowed the pool
+    assert DB_POOL_OVERFLOWS._value.get() == overflows + 1
+    assert DB_POOL_TIMEOUTS._value.get() == timeouts + 1
+    assert DB_POOL_CONNECTIONS.labels("in_use")._value.get() == 2
+    await greenlet_spawn(connections[0].close)
+    # Assert that a returned connection is idle again
+    assert DB_POOL_CONNECTIONS.labels("in_use")._value.get() == 1
+    assert DB_POOL_CONNECTIONS.labels("idle")._value.get() == 1
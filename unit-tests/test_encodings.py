@@ -0,0 +1,27 @@
+"""
+Tests for the Accept-Encoding negotiation of the compression middleware.
+"""
+from src.middleware.body_compressor import CODINGS
+from src.middleware.encodings import negotiate
+
+
+def test_negotiation_follows_weights():
+    """The heaviest accepted coding wins; ties go to the server preference."""
+    # Assert that weights, refusals and the wildcard are honoured
+    assert negotiate("gzip, br") == "br"
+    assert negotiate("br;q=0.5, gzip") == "gzip"
+    assert negotiate("br;q=0, gzip;q=0") is None
+    assert negotiate("*;q=0.1, br;q=0") == "gzip"
+    assert negotiate("identity") is None
+    assert negotiate(None) is None
+
+
+def test_codings_round_trip():
+    """Every offered coding compresses a body in several chunks."""
+    for coding, make_compressor in CODINGS.items():
+        compressor = make_compressor()
+        body = compressor.compress(b"book " * 100) + compressor.compress(b"end")
+        body += compressor.finish()
+
+        # Assert that the stream is smaller than its input
+        assert 0 < len(body) < 503, coding
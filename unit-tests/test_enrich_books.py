@@ -0,0 +1,35 @@
+"""
+Tests for the annotation of book pages with the user's favourite and
+reading list state.
+"""
+from datetime import datetime
+
+from src.models.schemas import BookEnriched
+from src.routers.books import enrich_books
+
+
+def test_enrich_books_marks_state_per_book():
+    """Each book gets the state looked up for its ID, or none at all."""
+    added_at = datetime(2025, 4, 27)
+    books = {"results": [{"id": 1}, {"id": 2}, {"id": 3}]}
+    states = {1: (added_at, None), 2: (added_at, "reading"), 3: (None, "done")}
+
+    enriched = enrich_books(books, states)["results"]
+
+    # Assert that favourites and reading statuses are reported independently
+    assert [book["is_favourite"] for book in enriched] == [True, True, False]
+    assert [book["reading_status"] for book in enriched] == [None, "reading", "done"]
+    assert enriched[0]["became_favourite_at"] == added_at
+
+
+def test_enrich_books_without_state():
+    """Books the user never touched are plain, and still valid BookEnriched."""
+    book = {"id": 7, "title": "Book 7", "media_type": "Text", "download_count": 1}
+
+    enriched = enrich_books({"results": [book]}, {})["results"][0]
+
+    # Assert that the defaults validate against the response model
+    model = BookEnriched(**enriched)
+    assert model.is_favourite is False
+    assert model.became_favourite_at is None
+    assert model.reading_status is None
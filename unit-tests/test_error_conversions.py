@@ -0,0 +1,30 @@
+"""
+Tests for the conversion of failed Gutendex lookups into API errors.
+"""
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from src.clients.gutendex_errors import GutendexUnavailable, book_not_found
+from src.routers.error_conversions import httpx_error_to_fastapi_error
+
+
+def test_not_found_is_converted_to_404():
+    """A Gutendex 404, cached or not, is reported with the given message."""
+    with pytest.raises(HTTPException) as info:
+        httpx_error_to_fastapi_error(book_not_found(1), "Book not found")
+
+    # Assert that the caller's message is used
+    assert info.value.status_code == 404
+    assert info.value.detail == "Book not found"
+
+
+@pytest.mark.parametrize("exc", [GutendexUnavailable(12), httpx.ConnectTimeout("timeout")])
+def test_unavailable_upstream_is_converted_to_503(exc):
+    """An open breaker or an unreachable upstream is reported as 503."""
+    with pytest.raises(HTTPException) as info:
+        httpx_error_to_fastapi_error(exc, "Book not found")
+
+    # Assert that clients are told when to retry
+    assert info.value.status_code == 503
+    assert int(info.value.headers["Retry-After"]) >= 1
@@ -0,0 +1,71 @@
+"""
+Tests for the streamed library export endpoint.
+"""
+import json
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.clients.gutendex_client import get_gutendex_client
+from src.routers import users
+from src.routers.users import get_current_user
+
+ADDED_AT = datetime(2025, 5, 1, 12, 30)
+
+
+def library_row(book_id: int) -> SimpleNamespace:
+    """A library row: a favourite that is also being read."""
+    return SimpleNamespace(
+        book_id=book_id,
+        favourite_since=ADDED_AT,
+        reading_status="reading",
+        reading_since=ADDED_AT,
+        reading_updated_at=ADDED_AT,
+    )
+
+
+async def fake_library(user, db, chunk_size):
+    """Two chunks, the second one with a book unknown to Gutendex."""
+    yield [library_row(1), library_row(2)]
+    yield [library_row(404)]
+
+
+def make_client(gutendex_client) -> TestClient:
+    """Mount the users router with the user and Gutendex client stubbed."""
+    app = FastAPI()
+    app.include_router(users.router, prefix="/users")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    app.dependency_overrides[get_gutendex_client] = lambda: gutendex_client
+    return TestClient(app)
+
+
+@patch("src.routers.export.stream_library", fake_library)
+def test_ndjson_export(fake_gutendex):
+    """Every book is one JSON line; unknown books are exported without metadata."""
+    response = make_client(fake_gutendex.make_client()).get("/users/me/export")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    # Assert that all rows are streamed with their state and metadata
+    assert response.headers["content-disposition"] == 'attachment; filename="library.ndjson"'
+    assert [line["book_id"] for line in lines] == [1, 2, 404]
+    assert lines[1]["reading_status"] == "reading"
+    assert lines[0]["book"]["title"] == "Book 1"
+    assert lines[2]["book"] is None
+
+
+@patch("src.routers.export.stream_library", fake_library)
+def test_export_leaves_the_book_cache_alone(fake_gutendex):
+    """A whole library is not cached: each export asks Gutendex again."""
+    # Two exports of the same library through the same Gutendex client
+    client = make_client(fake_gutendex.make_client())
+
+    for _ in range(2):
+        client.get("/users/me/export")
+
+    # Assert that both exports requested both chunks upstream
+    # (with the books cached, the second one would only ask for book 404)
+    assert len(fake_gutendex.calls) == 4
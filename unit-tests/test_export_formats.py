@@ -0,0 +1,32 @@
+"""
+Tests for the CSV serialization of library exports.
+"""
+import csv
+import io
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.models.schemas import ExportFormat
+from src.routers.export_formats import EXPORT_WRITERS
+
+ADDED_AT = datetime(2025, 5, 1, 12, 30)
+
+
+def test_csv_export_flattens_books():
+    """CSV rows get the main book fields as columns, empty for unknown books."""
+    writer = EXPORT_WRITERS[ExportFormat.CSV]
+    rows = [
+        SimpleNamespace(book_id=book_id, favourite_since=None, reading_status="done",
+                        reading_since=ADDED_AT, reading_updated_at=ADDED_AT)
+        for book_id in (1, 2)
+    ]
+    authors = [{"name": "A"}, {"name": "B"}]
+    books = {1: {"title": "Book 1", "authors": authors, "languages": ["en"]}}
+    data = (writer.header + writer.encode(rows, books)).decode()
+    exported = list(csv.DictReader(io.StringIO(data)))
+
+    # Assert that the header names the columns and the values are flattened
+    assert exported[0]["authors"] == "A; B"
+    assert exported[0]["reading_since"] == ADDED_AT.isoformat()
+    assert exported[0]["favourite_since"] == ""
+    assert exported[1]["title"] == ""
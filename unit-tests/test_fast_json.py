@@ -0,0 +1,59 @@
+"""
+Tests for the fast JSON path of the list endpoints: book payloads validated
+once by the Gutendex client, and the responses built from them without
+re-validation.
+"""
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.clients.book_record import BookPayload
+from src.clients.gutendex_client import get_gutendex_client
+from src.database import get_async_session
+from src.models.schemas import FavouriteBook
+from src.routers import favourites
+from src.routers.json_responses import book_payload
+from src.routers.users import get_current_user
+
+
+def make_app(gutendex_client) -> FastAPI:
+    """Mount the favourites router with the user, session and Gutendex client stubbed."""
+    app = FastAPI()
+    app.include_router(favourites.router, prefix="/favourites")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    app.dependency_overrides[get_async_session] = lambda: AsyncMock()
+    app.dependency_overrides[get_gutendex_client] = lambda: gutendex_client
+    return app
+
+
+def test_book_payload_validates_plain_metadata(fake_gutendex):
+    """Metadata from elsewhere is validated, dropping fields `Book` does not have."""
+    payload = book_payload({**fake_gutendex.make_book(501), "is_favourite": True})
+
+    # Assert that a validated projection is returned
+    assert isinstance(payload, BookPayload)
+    assert "is_favourite" not in payload
+
+
+@patch("src.routers.favourites.get_favourites_page")
+def test_favourites_match_the_response_model(mock_page, fake_gutendex):
+    """The fast path returns what the validated path returned, cursor header included."""
+    added_at = datetime(2025, 5, 1, 12, 30)
+    mock_page.return_value = ([(7, added_at), (8, added_at)], "next-page")
+    client = TestClient(make_app(fake_gutendex.make_client()))
+    response = client.get("/favourites/")
+
+    expected = [
+        FavouriteBook(book=fake_gutendex.make_book(book_id), added_at=added_at)
+        .model_dump(mode="json")
+        for book_id in (7, 8)
+    ]
+
+    # Assert that the body is unchanged and the cursor header is kept
+    assert response.status_code == 200
+    assert response.json() == expected
+    assert response.headers["x-next-cursor"] == "next-page"
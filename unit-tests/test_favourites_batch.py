@@ -0,0 +1,67 @@
+"""
+Tests for the bulk favourites endpoints: one upstream lookup and one write
+per batch, per-item results and the route order.
+"""
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.models.schemas import BookIDsBatch
+from src.database import get_async_session
+from src.routers import favourites, favourites_batch
+from src.routers.users import get_current_user
+
+
+@patch("src.routers.favourites_batch.add_favourites", return_value={1})
+@pytest.mark.asyncio
+async def test_add_favourites_batch(mock_add, gutendex_client, fake_gutendex):
+    """Known books are added with one lookup and one write, unknown ones reported."""
+    session = AsyncMock()
+    batch = BookIDsBatch(book_ids=[1, 2, fake_gutendex.MISSING_BOOK_ID, 1])
+
+    result = await favourites_batch.add_favourites_batch(
+        batch, SimpleNamespace(id=uuid.uuid4()), session, gutendex_client
+    )
+
+    # Assert that each book is reported once, in request order
+    assert [(item.book_id, item.result) for item in result.results] == [
+        (1, "created"), (2, "exists"), (404, "not_found"),
+    ]
+    # Assert that the batch cost one upstream call and one transaction
+    assert len(fake_gutendex.calls) == 1
+    assert mock_add.await_args.args[2] == [1, 2]
+    session.commit.assert_awaited_once()
+
+
+@patch("src.routers.favourites_batch.remove_favourites", return_value={1})
+@pytest.mark.asyncio
+async def test_remove_favourites_batch(mock_remove):
+    """Books that were not favourites are reported as not found."""
+    result = await favourites_batch.remove_favourites_batch(
+        [1, 2, 2], SimpleNamespace(id=uuid.uuid4()), AsyncMock()
+    )
+
+    # Assert that duplicates were dropped before the delete
+    assert [(item.book_id, item.result) for item in result.results] == [
+        (1, "deleted"), (2, "not_found"),
+    ]
+    assert mock_remove.await_args.args[2] == [1, 2]
+
+
+@patch("src.routers.favourites_batch.remove_favourites", return_value=set())
+def test_batch_route_precedes_book_id_route(mock_remove):
+    """`DELETE /favourites/batch` is not taken for `DELETE /favourites/{book_id}`."""
+    app = FastAPI()
+    app.include_router(favourites.router, prefix="/favourites")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    app.dependency_overrides[get_async_session] = lambda: AsyncMock()
+
+    response = TestClient(app).delete("/favourites/batch?book_ids=7")
+
+    # Assert that the bulk endpoint answered
+    assert response.status_code == 200
+    assert response.json() == {"results": [{"book_id": 7, "result": "not_found"}]}
@@ -0,0 +1,72 @@
+"""
+Tests for GutendexClient: caching of single books, batches and listings,
+including the background refresh of stale books.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from src.config import GUTENDEX_CACHE_SOFT_TTL
+from src.models.schemas import Book
+
+
+@pytest.mark.asyncio
+async def test_get_book_is_cached(gutendex_client, fake_gutendex):
+    """Repeated lookups of the same book hit the upstream only once."""
+    first = await gutendex_client.get_book(7)
+    second = await gutendex_client.get_book(7)
+
+    # Assert that the `Book` fields are returned and the second call was served from cache
+    assert first == second == Book(**fake_gutendex.make_book(7)).model_dump(mode="json")
+    assert len(fake_gutendex.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_book_not_found(gutendex_client, fake_gutendex):
+    """A 404 from Gutendex is surfaced as an HTTPStatusError."""
+    # Assert that the upstream 404 is not swallowed
+    with pytest.raises(httpx.HTTPStatusError):
+        await gutendex_client.get_book(fake_gutendex.MISSING_BOOK_ID)
+
+
+@pytest.mark.asyncio
+async def test_list_books_normalizes_cache_key(gutendex_client, fake_gutendex):
+    """Equivalent filters share a cache entry and are sent in canonical form."""
+    await gutendex_client.list_books(languages="fr, en", ids="3,1,3", search="  war  and peace ")
+    await gutendex_client.list_books(languages="en,fr", ids="1,3", search="war and peace")
+
+    # Assert that only one upstream call was made, with canonical parameters
+    assert len(fake_gutendex.calls) == 1
+    params = fake_gutendex.calls[0].url.params
+    assert params["languages"] == "en,fr"
+    assert params["ids"] == "1,3"
+    assert params["search"] == "war and peace"
+
+
+@pytest.mark.asyncio
+async def test_stale_books_are_refreshed_in_one_batch(clock, gutendex_client, fake_gutendex):
+    """Stale books of a batch lookup are reloaded with a single listing call."""
+    await gutendex_client.get_books([1, 2])
+    clock[0] += GUTENDEX_CACHE_SOFT_TTL + 1
+
+    books = await gutendex_client.get_books([1, 2])
+    await asyncio.sleep(0.01)
+
+    # Assert that the answer came from cache and one refresh went upstream
+    assert sorted(books) == [1, 2]
+    assert len(fake_gutendex.calls) == 2
+    assert fake_gutendex.calls[1].url.params["ids"] == "1,2"
+
+
+@pytest.mark.asyncio
+async def test_bulk_reads_do_not_populate_the_cache(gutendex_client, fake_gutendex):
+    """With populate=False cached books are used, but fetched ones are not kept."""
+    await gutendex_client.get_books([1])
+
+    books = await gutendex_client.get_books([1, 2], populate=False)
+    await gutendex_client.get_books([2])
+
+    # Assert that book 1 came from cache and book 2 was fetched both times
+    assert sorted(books) == [1, 2]
+    assert [call.url.params["ids"] for call in fake_gutendex.calls] == ["1", "2", "2"]
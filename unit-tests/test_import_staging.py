@@ -0,0 +1,50 @@
+"""
+Tests for reading an import in the layout of the API's own CSV export:
+parsing, the skipped rows and the book ID lookup.
+"""
+import io
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.models.schemas import ReadingStatus
+from src.routers.import_rows import read_rows
+from src.routers.import_staging import ImportSummary
+
+EXPORT_CSV = b"""\
+book_id,title,authors,languages,favourite_since,reading_status,reading_since,reading_updated_at
+7,Book 7,,en,,done,2025-05-01T12:30:00,2025-05-02T08:00:00
+404,Book 404,,en,,reading,2025-05-01T12:30:00,2025-05-01T12:30:00
+9,Book 9,,en,2025-05-01T12:30:00,,,
+"""
+
+
+@pytest.mark.asyncio
+async def test_read_rows_in_batches():
+    """Rows are parsed a batch at a time, with their line number."""
+    batches = [batch async for batch in read_rows(io.BytesIO(EXPORT_CSV), batch_size=2)]
+
+    # Assert that the last batch holds the remaining row
+    assert [[row.line for row in batch] for batch in batches] == [[2, 3], [4]]
+    first = batches[0][0]
+    assert (first.book_id, first.status) == (7, ReadingStatus.DONE)
+    assert first.updated_at == datetime(2025, 5, 2, 8)
+    # Assert that a favourite that is not on the reading list has no status
+    assert batches[1][0].status is None
+
+
+@pytest.mark.asyncio
+async def test_stage_checks_book_ids(gutendex_client, fake_gutendex):
+    """Rows with a book ID are checked with one lookup, without searches."""
+    gutendex_client.find_books = AsyncMock()
+    summary = ImportSummary(gutendex_client, AsyncMock(match=AsyncMock(return_value={})))
+
+    rows = [row async for batch in read_rows(io.BytesIO(EXPORT_CSV), 10) for row in batch]
+    staged = await summary.stage(rows)
+
+    # Assert that the unknown ID is unmatched and the favourite-only row skipped
+    assert [row[:3] for row in staged] == [(2, 7, "done")]
+    assert (summary.matched, summary.unmatched, summary.skipped) == (1, 1, 1)
+    assert len(fake_gutendex.calls) == 1
+    gutendex_client.find_books.assert_not_awaited()
@@ -0,0 +1,44 @@
+"""
+Tests for the library counters endpoint.
+"""
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.database import get_async_session
+from src.routers import users
+from src.routers.users import get_current_user
+
+
+def make_client() -> TestClient:
+    """Mount the users router with the user and session stubbed."""
+    app = FastAPI()
+    app.include_router(users.router, prefix="/users")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    app.dependency_overrides[get_async_session] = lambda: AsyncMock()
+    return TestClient(app)
+
+
+@patch("src.routers.summary.get_library_summary")
+def test_summary_reads_counters(mock_summary):
+    """The counters row is returned as is."""
+    counters = {"favourites": 85, "want_to_read": 3, "reading": 12, "done": 40}
+    mock_summary.return_value = SimpleNamespace(_mapping=counters)
+
+    response = make_client().get("/users/me/summary")
+
+    # Assert that the counters come from the single lookup
+    assert response.json() == counters
+    mock_summary.assert_awaited_once()
+
+
+@patch("src.routers.summary.get_library_summary", return_value=None)
+def test_summary_of_empty_library(mock_summary):
+    """Users who never added a book have no counters row yet."""
+    response = make_client().get("/users/me/summary")
+
+    # Assert that every counter is zero
+    assert response.json() == {"favourites": 0, "want_to_read": 0, "reading": 0, "done": 0}
@@ -0,0 +1,61 @@
+"""
+Tests for single-flight loading and stale-while-revalidate in LoadingCache.
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.cache.loading import LoadingCache
+from src.cache.local import MemoryBackend
+
+
+async def settle():
+    """Let background refreshes run to completion."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    """Callers missing the same key together wait for a single load."""
+    cache = LoadingCache("test", MemoryBackend(8), ttl=60)
+    load = AsyncMock(return_value="value")
+
+    values = await asyncio.gather(*(cache.get_or_load("key", load) for _ in range(5)))
+
+    # Assert that every caller got the value from one upstream call
+    assert values == ["value"] * 5
+    load.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stale_value_is_served_and_refreshed(clock):
+    """Past the soft TTL the old value is returned at once and replaced behind it."""
+    cache = LoadingCache("test", MemoryBackend(8), ttl=600, soft_ttl=60)
+    await cache.set_many({"key": "old"})
+    clock[0] += 120
+    load = AsyncMock(return_value="new")
+
+    first = await cache.get_or_load("key", load)
+    second = await cache.get_or_load("key", load)
+    await settle()
+
+    # Assert that both callers were answered from cache by one refresh
+    assert first == second == "old"
+    load.assert_awaited_once()
+    assert await cache.get("key") == "new"
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_value(clock):
+    """An upstream error during a refresh leaves the stale value in place."""
+    cache = LoadingCache("test", MemoryBackend(8), ttl=600, soft_ttl=60)
+    await cache.set_many({"key": "old"})
+    clock[0] += 120
+
+    await cache.get_or_load("key", AsyncMock(side_effect=RuntimeError))
+    await settle()
+
+    # Assert that the stale value is still served
+    assert await cache.get("key") == "old"
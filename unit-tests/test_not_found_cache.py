@@ -0,0 +1,43 @@
+"""
+Tests for the negative cache of Gutendex 404s, on its own and as used by
+GutendexClient for single lookups and batches.
+"""
+import httpx
+import pytest
+
+from src.clients.not_found_cache import NotFoundCache
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_cached(gutendex_client, fake_gutendex):
+    """A 404 is remembered, so probing the same unknown ID stays local."""
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError) as info:
+            await gutendex_client.get_book(fake_gutendex.MISSING_BOOK_ID)
+
+    # Assert that the cached 404 looks like the upstream one
+    assert info.value.response.status_code == 404
+    assert len(fake_gutendex.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_batches_skip_cached_not_found(gutendex_client, fake_gutendex):
+    """Batches leave out IDs already known to be unknown."""
+    with pytest.raises(httpx.HTTPStatusError):
+        await gutendex_client.get_book(fake_gutendex.MISSING_BOOK_ID)
+
+    books = await gutendex_client.get_books([fake_gutendex.MISSING_BOOK_ID])
+
+    # Assert that the ID is absent and no listing call was made
+    assert books == {}
+    assert len(fake_gutendex.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_the_cache():
+    """With a TTL of 0 nothing is remembered."""
+    cache = NotFoundCache(ttl=0)
+    await cache.remember(1)
+
+    # Assert that the ID is not reported as missing
+    assert await cache.missing([1]) == set()
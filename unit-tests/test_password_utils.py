@@ -1,10 +1,78 @@
-from src.oauth.password_utils import get_password_hash, verify_password
+"""
+Tests for password hashing: the argon2id/bcrypt context and the bounded
+executor that keeps hashing off the event loop.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+from passlib.hash import bcrypt
+
+from src.metrics import PASSWORD_HASH_COMPUTE_SECONDS
+from src.oauth.password_executor import PasswordHashExecutor, PasswordHashingBusy
+from src.oauth.password_utils import (
+    check_password,
+    get_password_hash,
+    hash_password,
+    verify_password,
+)
 
 
 def test_password_hashing_sanity():
+    """The synchronous helpers hash and verify a password."""
     password = "Smack-test-1234"
 
     hashed_pass = get_password_hash(password)
     assert hashed_pass != password
 
     assert verify_password(password, hashed_pass)
+
+
+@pytest.mark.asyncio
+async def test_async_hashing_uses_argon2id():
+    """New hashes are argon2id and verify without needing an upgrade."""
+    hashed_pass = await hash_password("Smack-test-1234")
+
+    # Assert that the current scheme is used and accepted as is
+    assert hashed_pass.startswith("$argon2id$")
+    assert await check_password("Smack-test-1234", hashed_pass) == (True, None)
+    assert await check_password("wrong", hashed_pass) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_legacy_bcrypt_hash_is_upgraded():
+    """A valid bcrypt hash verifies and comes back with its argon2id replacement."""
+    legacy = bcrypt.using(rounds=4).hash("Smack-test-1234")
+
+    valid, new_hash = await check_password("Smack-test-1234", legacy)
+
+    # Assert that the password is accepted and rehashed with argon2id
+    assert valid
+    assert new_hash.startswith("$argon2id$")
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_jobs_beyond_queue():
+    """With every worker busy and the queue full, new jobs fail fast."""
+    executor = PasswordHashExecutor(workers=1, max_queue=0)
+    release = threading.Event()
+    running = asyncio.ensure_future(executor.run("hash", release.wait))
+    await asyncio.sleep(0)
+
+    # Assert that the second job is refused while the first one runs
+    with pytest.raises(PasswordHashingBusy):
+        await executor.run("hash", str)
+    release.set()
+    assert await running is True
+
+
+@pytest.mark.asyncio
+async def test_executor_times_hashing_on_worker():
+    """The time a job runs on its worker thread is observed per operation."""
+    executor = PasswordHashExecutor(workers=1, max_queue=1)
+
+    await executor.run("probe", time.sleep, 0.01)
+
+    # Assert that the hashing time was recorded under the operation label
+    assert PASSWORD_HASH_COMPUTE_SECONDS.labels("probe")._sum.get() >= 0.01
@@ -0,0 +1,73 @@
+"""
+Tests for the principal cache that lets authenticated requests skip the
+JWT decode and the user SELECT once a token has been verified.
+"""
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.cruds.users_crud import get_current_user
+from src.oauth.jwt_utils import create_access_token_from_user
+from src.oauth.principal_cache import PrincipalCache, principal_cache
+
+
+@pytest.fixture
+def mock_db():
+    """Fixture to mock database session"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_user():
+    """Fixture providing a stored user as returned by the ORM"""
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        login="testuser",
+        username="Test User",
+        created_at=datetime(2025, 4, 27),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_is_cached_per_token(mock_db, mock_user):
+    """Test that a verified token is resolved from the cache the next time"""
+    token = create_access_token_from_user(mock_user)
+
+    with patch("src.cruds.users_crud.get_user_by_id", return_value=mock_user) as lookup:
+        first = await get_current_user(token, db=mock_db)
+        with patch("src.oauth.jwt_utils.jwt.decode", side_effect=AssertionError):
+            second = await get_current_user(token, db=mock_db)
+
+    # Assert that the user is looked up by the token's uid only once
+    lookup.assert_awaited_once_with(mock_db, str(mock_user.id))
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_changed_user_is_looked_up_again(mock_db, mock_user):
+    """Test that invalidating a user drops their cached tokens"""
+    token = create_access_token_from_user(mock_user)
+
+    with patch("src.cruds.users_crud.get_user_by_id", return_value=mock_user) as lookup:
+        await get_current_user(token, db=mock_db)
+        principal_cache.invalidate_user(str(mock_user.id))
+        await get_current_user(token, db=mock_db)
+
+    # Assert that the database is asked again after the invalidation
+    assert lookup.await_count == 2
+
+
+def test_cache_entry_does_not_outlive_token(mock_user):
+    """Test that a token about to expire is not trusted beyond its exp claim"""
+    cache = PrincipalCache(maxsize=8, ttl=60)
+
+    cache.set("fresh", mock_user, expires_at=time.time() + 600)
+    cache.set("expired", mock_user, expires_at=time.time() - 1)
+
+    # Assert that only the token that is still valid is remembered
+    assert cache.get("fresh").login == mock_user.login
+    assert cache.get("expired") is None
@@ -0,0 +1,68 @@
+"""
+Tests for the bulk reading list endpoints: per-item results, duplicate
+entries, the `all` pseudo status and the batch size cap.
+"""
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from src.config import BATCH_MAX_ITEMS
+
+from src.models.schemas import BookIDsBatch, ReadingListBatch, ReadingStatus
+from src.routers import reading_list_batch
+
+
+@patch("src.routers.reading_list_batch.add_reading_list_entries", return_value={3})
+@pytest.mark.asyncio
+async def test_add_to_reading_list_batch(mock_add, gutendex_client, fake_gutendex):
+    """Entries with the `all` pseudo status are rejected per item."""
+    batch = ReadingListBatch(entries=[
+        {"book_id": 3, "status": "reading"},
+        {"book_id": 5, "status": "all"},
+        {"book_id": 3, "status": "done"},
+    ])
+
+    result = await reading_list_batch.add_to_reading_list_batch(
+        batch, SimpleNamespace(id=uuid.uuid4()), AsyncMock(), gutendex_client
+    )
+
+    # Assert that the last status given for a book is the one written
+    assert [(item.book_id, item.result) for item in result.results] == [
+        (3, "created"), (5, "invalid"),
+    ]
+    assert mock_add.await_args.args[2] == {3: ReadingStatus.DONE}
+    # Assert that the invalid entry was not looked up
+    assert fake_gutendex.calls[0].url.params["ids"] == "3"
+
+
+@patch("src.routers.reading_list_batch.update_reading_list_entries",
+       return_value={7: ReadingStatus.READING})
+@pytest.mark.asyncio
+async def test_update_reading_status_batch(mock_update):
+    """Books missing from the reading list are reported as not found."""
+    batch = ReadingListBatch(entries=[
+        {"book_id": 7, "status": "done"},
+        {"book_id": 8, "status": "reading"},
+    ])
+
+    result = await reading_list_batch.update_reading_status_batch(
+        batch, SimpleNamespace(id=uuid.uuid4()), AsyncMock()
+    )
+
+    # Assert that only the entry on the list was updated
+    assert [(item.book_id, item.result) for item in result.results] == [
+        (7, "updated"), (8, "not_found"),
+    ]
+    mock_update.assert_awaited_once()
+
+
+def test_batch_size_is_capped():
+    """Empty batches and batches above BATCH_MAX_ITEMS are rejected up front."""
+    entries = [{"book_id": book_id, "status": "done"} for book_id in range(BATCH_MAX_ITEMS + 1)]
+    with pytest.raises(ValidationError):
+        ReadingListBatch(entries=entries)
+    with pytest.raises(ValidationError):
+        BookIDsBatch(book_ids=[])
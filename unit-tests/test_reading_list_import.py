@@ -0,0 +1,78 @@
+"""
+Tests for the reading list CSV import endpoint: the outcome counts, the
+staged rows and the row limit.
+"""
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.clients.gutendex_client import get_gutendex_client
+from src.database import get_async_session
+from src.models.schemas import ReadingStatus
+from src.routers import reading_list
+from src.routers.users import get_current_user
+
+GOODREADS_CSV = """\
+Book Id,Title,Author,Exclusive Shelf,Date Added,Date Read
+1,"Emma",Jane Austen,read,2024/01/02,2024/02/03
+2,Some Unknown Novel,Nobody,to-read,2024/01/02,
+3,Emma,Jane Austen,currently-reading,2024/03/04,
+"""
+
+
+def make_client(gutendex_client, session) -> TestClient:
+    """Mount the reading list router with the user, session and Gutendex stubbed."""
+    app = FastAPI()
+    app.include_router(reading_list.router, prefix="/reading-list")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    app.dependency_overrides[get_async_session] = lambda: session
+    app.dependency_overrides[get_gutendex_client] = lambda: gutendex_client
+    return TestClient(app)
+
+
+def upload(client: TestClient, content: str):
+    return client.post("/reading-list/import", files={"file": ("library.csv", content)})
+
+
+@patch("src.routers.reading_list_import.create_staging_table", AsyncMock())
+@patch("src.routers.reading_list_import.copy_staged_rows")
+@patch("src.routers.reading_list_import.merge_staged_rows")
+def test_import_goodreads_export(mock_merge, mock_copy, gutendex_client):
+    """Books are matched by title and author; the last row of a book wins."""
+    emma = {"id": 158, "title": "Emma", "authors": [{"name": "Austen, Jane"}]}
+    gutendex_client.find_books = AsyncMock(return_value={"count": 1, "results": [emma]})
+    mock_merge.return_value = [(158, None, ReadingStatus.READING)]
+    session = AsyncMock()
+
+    response = upload(make_client(gutendex_client, session), GOODREADS_CSV)
+
+    # Assert that the outcome is counted and the unknown book reported
+    assert response.json() == {
+        "rows": 3, "skipped": 0, "matched": 2, "unmatched": 1, "created": 1, "updated": 0,
+        "unmatched_rows": [{"line": 3, "title": "Some Unknown Novel", "author": "Nobody"}],
+    }
+    # Assert that both rows of Emma were staged with their line, status and dates
+    staged = mock_copy.await_args.args[1]
+    assert [(line, book_id, status) for line, book_id, status, _, _ in staged] == [
+        (2, 158, "done"), (4, 158, "reading"),
+    ]
+    assert staged[0][3:] == (datetime(2024, 1, 2), datetime(2024, 2, 3))
+    session.commit.assert_awaited_once()
+
+
+@patch("src.routers.reading_list_import.IMPORT_MAX_ROWS", 2)
+@patch("src.routers.reading_list_import.create_staging_table", AsyncMock())
+def test_import_row_limit(gutendex_client):
+    """Files with too many rows are refused before anything is merged."""
+    session = AsyncMock()
+    gutendex_client.find_books = AsyncMock(return_value={"count": 0, "results": []})
+
+    response = upload(make_client(gutendex_client, session), GOODREADS_CSV)
+
+    # Assert that the import was refused as a whole
+    assert response.status_code == 413
+    session.commit.assert_not_awaited()
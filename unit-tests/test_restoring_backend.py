@@ -0,0 +1,46 @@
+"""
+Tests for shared cache hits restored to the type they were stored as, so
+that books read from L2 need no validation downstream.
+"""
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from src.cache.redis_backend import RedisBackend
+from src.cache.restoring import RestoringBackend
+from src.clients.book_record import BookPayload
+from src.routers.json_responses import book_payload
+
+
+@pytest.fixture
+async def shared_cache():
+    """Fixture yielding a shared cache level on an in-memory Redis server."""
+    backend = RedisBackend(FakeAsyncRedis(server=FakeServer()), prefix="test:")
+    yield backend
+    await backend.aclose()
+
+
+@pytest.mark.asyncio
+async def test_values_are_restored(shared_cache):
+    """Only the value of an entry is rebuilt; its times are kept."""
+    restoring = RestoringBackend(shared_cache, tuple)
+    await restoring.set_many({"key": [1.0, [1, 2], 2.0]})
+
+    # Assert that the decoded list comes back as a tuple
+    assert await restoring.get_many(["key", "missing"]) == {"key": [1.0, (1, 2), 2.0]}
+
+
+@pytest.mark.asyncio
+async def test_shared_book_hits_are_passed_through(shared_cache, fake_gutendex):
+    """Books another worker cached in L2 come back validated, as `BookPayload`s."""
+    first = fake_gutendex.make_client(shared_cache)
+    second = fake_gutendex.make_client(shared_cache)
+    await first.get_books([501])
+
+    book = (await second.get_books([501]))[501]
+
+    # Assert that the second worker read L2 and its payload needs no validation
+    assert len(fake_gutendex.calls) == 1
+    assert isinstance(book, BookPayload)
+    assert book_payload(book) is book
+    await first.aclose()
+    await second.aclose()
@@ -0,0 +1,70 @@
+"""
+Tests for the tiered metadata cache: L1/L2 lookups, sharing between
+workers through a Redis-protocol backend (fakeredis) and outages of it.
+"""
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from src.cache.local import MemoryBackend
+from src.cache.redis_backend import RedisBackend
+from src.cache.tiered import TieredCache
+from src.metrics import CACHE_ERRORS
+
+
+@pytest.fixture
+def redis_server():
+    """Fixture providing an in-memory Redis server."""
+    return FakeServer()
+
+
+@pytest.fixture
+async def shared_cache(redis_server):
+    """Fixture yielding a shared cache level on the fake server."""
+    backend = RedisBackend(FakeAsyncRedis(server=redis_server), prefix="test:")
+    yield backend
+    await backend.aclose()
+
+
+@pytest.mark.asyncio
+async def test_l2_hits_are_promoted_to_l1(shared_cache):
+    """A value written by one worker is found by another and then kept in process."""
+    writer = TieredCache("test", MemoryBackend(8), shared_cache)
+    reader_l1 = MemoryBackend(8)
+    reader = TieredCache("test", reader_l1, shared_cache)
+
+    await writer.set_many({"book:1": {"id": 1}})
+
+    # Assert that the other worker finds it in L2 and copies it into its L1
+    assert await reader.get("book:1") == {"id": 1}
+    assert "book:1" in await reader_l1.get_many(["book:1"])
+
+
+@pytest.mark.asyncio
+async def test_workers_share_gutendex_metadata(shared_cache, fake_gutendex):
+    """The second worker serves a book fetched by the first without going upstream."""
+    first = fake_gutendex.make_client(shared_cache)
+    second = fake_gutendex.make_client(shared_cache)
+
+    await first.get_book(5)
+    books = await second.get_books([5])
+
+    # Assert that only the first worker called Gutendex
+    assert books[5]["id"] == 5
+    assert len(fake_gutendex.calls) == 1
+    await first.aclose()
+    await second.aclose()
+
+
+@pytest.mark.asyncio
+async def test_unavailable_server_is_a_miss(shared_cache, redis_server):
+    """A Redis outage degrades to cache misses instead of failing requests."""
+    cache = TieredCache("test", MemoryBackend(8), shared_cache)
+    errors = CACHE_ERRORS.labels("get")._value.get()
+    redis_server.connected = False
+
+    await cache.set_many({"book:1": {"id": 1}})
+    cache.clear()
+
+    # Assert that the lookup misses and the failure is counted
+    assert await cache.get("book:1") is None
+    assert CACHE_ERRORS.labels("get")._value.get() == errors + 1
@@ -0,0 +1,45 @@
+"""
+Tests for the expiry of tiered cache entries: copies promoted from the
+shared level keep the hard expiry they were written with.
+"""
+import pytest
+
+from src.cache.local import MemoryBackend
+from src.cache.tiered import TieredCache
+
+
+@pytest.mark.asyncio
+async def test_promoted_hits_keep_their_expiry(clock, monotonic):
+    """An L2 hit read shortly before it expires leaves L1 when it would have left L2."""
+    shared = MemoryBackend(8)
+    writer = TieredCache("test", MemoryBackend(8), shared, ttl=10)
+    reader_l1 = MemoryBackend(8)
+    reader = TieredCache("test", reader_l1, shared, ttl=10)
+    await writer.set_many({"book:1": {"id": 1}})
+
+    # Read it from L2 one second before its hard TTL runs out
+    clock[0] += 9
+    monotonic[0] += 9
+    assert await reader.get("book:1") == {"id": 1}
+    clock[0] += 6
+    monotonic[0] += 6
+
+    # Assert that the promoted copy expired along with the shared one
+    assert await reader.get("book:1") is None
+    assert await reader_l1.get_many(["book:1"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_entries_without_expiry_are_promoted_for_a_full_ttl(clock, monotonic):
+    """Pairs written before the hard expiry was stored are still promoted."""
+    shared = MemoryBackend(8)
+    reader_l1 = MemoryBackend(8)
+    reader = TieredCache("test", reader_l1, shared, ttl=10)
+    await shared.set_many({"book:1": [None, {"id": 1}]})
+
+    await reader.get("book:1")
+    clock[0] += 9
+    monotonic[0] += 9
+
+    # Assert that the copy is kept in process
+    assert await reader_l1.get_many(["book:1"]) == {"book:1": [None, {"id": 1}]}
@@ -1,3 +1,11 @@
+"""
+Tests for the user CRUD helpers: registration, authentication (including
+the upgrade of outdated password hashes) and token based user lookup.
+The caching of resolved tokens is covered in test_principal_cache.py.
+"""
+import uuid
+from datetime import datetime
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from src.models.user_schemas import UserCreate
@@ -16,7 +24,12 @@ def mock_db():
 @pytest.fixture
 def mock_user():
     """Fixture to create a mock user"""
+    # get_current_user hands out a snapshot of these columns
     user = MagicMock()
+    user.id = uuid.uuid4()
+    user.login = "testuser"
+    user.username = "Test User"
+    user.created_at = datetime(2025, 4, 27)
     user.hashed_password = "hashed_pass"
     return user
 
@@ -28,8 +41,7 @@ async def test_create_user(mock_db):
     """Test user creation and verify correct interactions with the db"""
     user_in = UserCreate(login="testuser", email="test@example.com", password="testpass")
 
-    with patch("src.oauth.password_utils.get_password_hash", return_value="hashed_pass"):
-        user = await create_user(mock_db, user_in)
+    user = await create_user(mock_db, user_in)
 
     # Assert that the user is created correctly
     assert user.login == user_in.login
@@ -41,7 +53,7 @@ async def test_create_user(mock_db):
     mock_db.refresh.assert_awaited_once_with(user)
 
 
-@patch("src.cruds.users_crud.verify_password", return_value=True)
+@patch("src.cruds.users_crud.check_password", return_value=(True, None))
 @patch("src.cruds.users_crud.get_user_by_login")
 @pytest.mark.asyncio
 async def test_authenticate_user_success(mock_get_user_by_login,
@@ -55,7 +67,7 @@ async def test_authenticate_user_success(mock_get_user_by_login,
     assert result == mock_user
 
 
-@patch("src.cruds.users_crud.verify_password", return_value=False)
+@patch("src.cruds.users_crud.check_password", return_value=(False, None))
 @patch("src.cruds.users_crud.get_user_by_login")
 @pytest.mark.asyncio
 async def test_authenticate_user_failure(mock_get_user_by_login,
@@ -69,17 +81,34 @@ async def test_authenticate_user_failure(mock_get_user_by_login,
     assert result is None
 
 
+@patch("src.cruds.users_crud.check_password", return_value=(True, "new_hash"))
+@patch("src.cruds.users_crud.get_user_by_login")
+@pytest.mark.asyncio
+async def test_authenticate_user_upgrades_hash(mock_get_user_by_login,
+                                               mock_check_password, mock_db, mock_user):
+    """Test that an outdated password hash is replaced on successful login"""
+    mock_get_user_by_login.return_value = mock_user
+
+    result = await authenticate_user(mock_db, "testuser", "testpass")
+
+    # Assert that the new hash is stored
+    assert result.hashed_password == "new_hash"
+    mock_db.commit.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_get_current_user_valid_token(mock_db, mock_user):
     """Test that current user is retrieved correctly when a valid token is provided"""
+    # A token without `uid`, as issued before user IDs were embedded, is resolved by login
     mock_token = "mocktoken"
 
     with patch("src.oauth.jwt_utils.jwt.decode", return_value={"login": "testuser"}), \
          patch("src.cruds.users_crud.get_user_by_login", return_value=mock_user):
         user = await get_current_user(mock_token, db=mock_db)
 
-    # Assert that the correct user is returned
-    assert user == mock_user
+    # Assert that a snapshot of the correct user is returned
+    assert user.id == str(mock_user.id)
+    assert user.login == mock_user.login
 
 
 @pytest.mark.asyncio